@@ -94,6 +94,94 @@ class ListWithAttributes(list):
     var: Iterable
 
 
+class OrderedSet:
+    """
+    Insertion-ordered set (based on a dict) with a list-like interface (append, remove, indexing, slicing).
+
+    In contrast to list, membership test and removal are O(1). Iteration runs over a snapshot of the elements,
+    thus it is allowed to remove elements during iteration. Elements which are appended during iteration are
+    visited like for list.
+    """
+
+    __slots__ = ("_dict", "_list")
+
+    def __init__(self, iterable: Iterable = ()):
+        self._dict = dict.fromkeys(iterable)
+
+        # cached list of the elements (None if outdated)
+        self._list = None
+
+    def _as_list(self) -> list:
+        if self._list is None:
+            self._list = list(self._dict)
+        return self._list
+
+    def append(self, element) -> None:
+        if element in self._dict:
+            msg = f"element {element} is already contained in {type(self).__name__}."
+            raise ValueError(msg)
+        self._dict[element] = None
+        if self._list is not None:
+            self._list.append(element)
+
+    def extend(self, iterable: Iterable) -> None:
+        for element in iterable:
+            self.append(element)
+
+    def remove(self, element) -> None:
+        """
+        remove element; raise ValueError if it is not contained (like list.remove)
+        """
+        try:
+            del self._dict[element]
+        except KeyError:
+            msg = f"{type(self).__name__}.remove(x): x not contained"
+            raise ValueError(msg)
+        # do not modify the old list because an iteration over it might be in progress
+        self._list = None
+
+    def discard(self, element) -> None:
+        """
+        remove element if it is contained (do nothing otherwise)
+        """
+        if self._dict.pop(element, self) is not self:
+            self._list = None
+
+    def copy(self) -> list:
+        return list(self._as_list())
+
+    def __contains__(self, element) -> bool:
+        return element in self._dict
+
+    def __len__(self) -> int:
+        return len(self._dict)
+
+    def __bool__(self) -> bool:
+        return bool(self._dict)
+
+    def __iter__(self):
+        return iter(self._as_list())
+
+    def __reversed__(self):
+        return reversed(self._as_list())
+
+    def __getitem__(self, index: Union[int, slice]):
+        return self._as_list()[index]
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, OrderedSet):
+            return self._as_list() == other._as_list()
+        if isinstance(other, (list, tuple)):
+            return self._as_list() == list(other)
+        return NotImplemented
+
+    def __add__(self, other: Iterable) -> list:
+        return self._as_list() + list(other)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._as_list()})"
+
+
 def apply_func_to_table_cells(func: callable, table: Iterable, *args, **kwargs) -> ListWithAttributes:
     res = ListWithAttributes()
     for row in table:
@@ -415,7 +503,7 @@ def clean_dict(dikt: Dict[Any, Union[list, dict]]) -> Dict[Any, Union[list, dict
 
     obsolete_keys = []
     for key, value in dikt.items():
-        if len(value) == 0 and isinstance(value, (list, dict)):
+        if len(value) == 0 and isinstance(value, (list, dict, OrderedSet)):
             obsolete_keys.append(key)
         elif isinstance(value, dict):
             tmp_dict = clean_dict(value)
@@ -58,7 +58,13 @@ def allows_instantiation(itm: Item) -> bool:
     :return:        bool
     """
 
-    taxtree = get_taxonomy_tree(itm)
+    return _get_taxonomy_info(itm)[2]
+
+
+def _allows_instantiation(taxtree: list) -> bool:
+    """
+    Evaluate the taxonomy tree of an item (see `allows_instantiation`)
+    """
 
     # This is a list of 2-tuples like the following:
     # [(None, <Item I4239["monovariate polynomial"]>),
@@ -103,10 +109,33 @@ def get_taxonomy_tree(itm, add_self=True) -> list:
 
     """
 
-    res = []
-
+    taxtree = _get_taxonomy_info(itm)[0]
     if add_self:
-        res.append((None, itm))
+        return list(taxtree)
+    return list(taxtree[1:])
+
+
+def _get_taxonomy_info(itm) -> tuple:
+    """
+    Return the cached 3-tuple (taxtree, r3_superclasses, allows_instantiation) for `itm`, where taxtree is the
+    tuple-version of the result of `get_taxonomy_tree(itm)` and r3_superclasses is the set of all items which occur
+    with "R3" in taxtree.
+
+    The cache (ds.taxonomy_cache) is invalidated if R3- or R4-statements change (see DataStore.process_changed_statement).
+    """
+
+    res = ds.taxonomy_cache.get(itm.uri)
+    if res is None:
+        taxtree = tuple(_get_uncached_taxonomy_tree(itm))
+        r3_superclasses = frozenset(elt for rel_key, elt in taxtree if rel_key == "R3")
+        res = (taxtree, r3_superclasses, _allows_instantiation(taxtree))
+        ds.taxonomy_cache[itm.uri] = res
+    return res
+
+
+def _get_uncached_taxonomy_tree(itm) -> list:
+
+    res = [(None, itm)]
 
     # Note:
     # parent_class refers to R4__is_instance, super_class refers to R3__is_subclass_of
@@ -117,12 +146,13 @@ def get_taxonomy_tree(itm, add_self=True) -> list:
         msg = f"currently not allowed together: R3__is_subclass_of and R4__is_instance_of (Entity: {itm}"
         raise NotImplementedError(msg)
 
+    # (the trees of the super and parent classes are taken from the cache)
     if super_class:
         res.append(("R3", super_class))
-        res.extend(get_taxonomy_tree(super_class, add_self=False))
+        res.extend(_get_taxonomy_info(super_class)[0][1:])
     elif parent_class:
         res.append(("R4", parent_class))
-        res.extend(get_taxonomy_tree(parent_class, add_self=False))
+        res.extend(_get_taxonomy_info(parent_class)[0][1:])
 
     return res
 
@@ -144,9 +174,7 @@ def is_subclass_of(itm1: Item, itm2: Item, allow_id=False, strict=True) -> bool:
                 msg = f"itm{i} ({itm}) is not a instantiable class"
                 raise core.aux.TaxonomicError(msg)
 
-    taxtree1 = get_taxonomy_tree(itm1)
-
-    # This is a list of 2-tuples like the following:
+    # the taxonomy tree of itm1 is a list of 2-tuples like the following:
     # [(None, <Item I4239["monovariate polynomial"]>),
     #  ('R3', <Item I4237["monovariate rational function"]>),
     #  ('R3', <Item I4236["mathematical expression"]>),
@@ -157,7 +185,8 @@ def is_subclass_of(itm1: Item, itm2: Item, allow_id=False, strict=True) -> bool:
 
     # reminder: R3__is_subclass_of, R4__is_instance_of
 
-    res = ("R3", itm2) in taxtree1
+    # itm2 has to occur with "R3" in this tree (the respective set is cached)
+    res = itm2 in _get_taxonomy_info(itm1)[1]
 
     return res
 
@@ -245,37 +274,39 @@ def instance_of(
         # add prefix2 "a" for "autogenerated"
         key = core.pop_uri_based_key(prefix="I", prefix2="a")
 
-    new_item = core.create_item(
-        key_str=key,
-        R1__has_label=r1,
-        R2__has_description=r2,
-    )
+    # the changes are reported as one mutation (the decorator `mutating` would break get_key_str_by_inspection)
+    with ds.mutation():
+        new_item = core.create_item(
+            key_str=key,
+            R1__has_label=r1,
+            R2__has_description=r2,
+        )
 
-    if not qualifiers and class_scope is not None:
-        qualifiers = [qff_has_defining_scope(class_scope)]
-    new_item.set_relation(R4["is instance of"], cls_entity, qualifiers=qualifiers)
+        if not qualifiers and class_scope is not None:
+            qualifiers = [qff_has_defining_scope(class_scope)]
+        new_item.set_relation(R4["is instance of"], cls_entity, qualifiers=qualifiers)
 
-    # add consistency relevant relations:
-    # note that the could be overwritten with item.overwrite_statement
-    for rel in [
-        R8["has domain of argument 1"],
-        R9["has domain of argument 2"],
-        R10["has domain of argument 3"],
-        R11["has range of result"],
-    ]:
+        # add consistency relevant relations:
+        # note that the could be overwritten with item.overwrite_statement
+        for rel in [
+            R8["has domain of argument 1"],
+            R9["has domain of argument 2"],
+            R10["has domain of argument 3"],
+            R11["has range of result"],
+        ]:
 
-        obj = cls_entity.get_relations(rel.uri, return_obj=True)
-        if obj not in ([], None):
-            if isinstance(obj, list):
-                assert len(obj) == 1
-                obj = obj[0]
-            new_item.set_relation(rel, obj)
+            obj = cls_entity.get_relations(rel.uri, return_obj=True)
+            if obj not in ([], None):
+                if isinstance(obj, list):
+                    assert len(obj) == 1
+                    obj = obj[0]
+                new_item.set_relation(rel, obj)
 
-    # TODO: solve this more elegantly
-    # this has to be run again after setting R4
-    new_item.__post_init__()
+        # TODO: solve this more elegantly
+        # this has to be run again after setting R4
+        new_item.__post_init__()
 
-    return new_item
+        return new_item
 
 
 ########################################################################################################################
@@ -1310,6 +1341,80 @@ class _rule__CM(AbstractMathRelatedScopeCM):
             # args are supposed to be variables created in the "setting"-scope
             self.new_rel(factory_anchor, R29["has argument"], arg, qualifiers=[qff_has_rule_ptg_mode(4)])
 
+    def new_aggregation(
+        self,
+        subject: Item,
+        predicate: Item,
+        objects: Item,
+        predicates: List[Relation] = None,
+        predicate_relation: Relation = None,
+        predicate_relation_object=None,
+        excluded_predicates: List[Relation] = None,
+        subject_class: Item = None,
+        min_count: int = 1,
+        max_count: int = None,
+        group_count: int = None,
+    ) -> Item:
+        """
+        Describe an aggregation premise (instead of a premise graph): the statements of the considered predicates are
+        grouped by (subject, predicate); every group whose number of objects fulfills the count condition is a match.
+
+        :param subject:                     variable (from the setting-scope) for the subject of a group
+        :param predicate:                   relation variable (from the setting-scope) for the predicate of a group
+        :param objects:                     variable (from the setting-scope) for the objects of a group (they are
+                                            passed as separate arguments to the consequent function)
+        :param predicates:                  list of relations whose statements are grouped
+        :param predicate_relation:          alternative to `predicates`: use the subjects of the statements of this
+                                            relation
+        :param predicate_relation_object:   optional; only consider statements of `predicate_relation` with this
+                                            object
+        :param excluded_predicates:         optional list of relations which are not considered
+        :param subject_class:               optional; only consider subjects which are direct instances of this class
+        :param min_count:                   minimum number of objects of a matching group
+        :param max_count:                   maximum number of objects of a matching group (None means: no limit)
+        :param group_count:                 optional; if passed, the rule matches only once if the number of matching
+                                            groups is equal to this value
+
+        Conditions on the subject or the objects can be added with `new_condition_func(func, subject)` or
+        `new_condition_func(func, objects)`. The rule is evaluated by ruleengine.AggregationRule.
+        """
+
+        if self.scope.R64__has_scope_type != "PREMISE":
+            msg = "aggregations are only allowed directly inside the 'premise'-scope"
+            raise core.aux.SemanticRuleError(msg)
+
+        if (predicates is None) == (predicate_relation is None):
+            msg = "Exactly one of `predicates` and `predicate_relation` has to be passed."
+            raise core.aux.SemanticRuleError(msg)
+
+        name = f"aggregation_anchor_item{self.anchor_item_counter}"
+        self.anchor_item_counter += 1
+        anchor_item = instance_of(I64["aggregation anchor"], r1=name)
+        self.new_var(**{name: anchor_item})
+
+        self.new_rel(anchor_item, R91["has group subject variable"], subject)
+        self.new_rel(anchor_item, R92["has group predicate variable"], predicate)
+        self.new_rel(anchor_item, R93["has group objects variable"], objects)
+
+        for pred in predicates or []:
+            self.new_rel(anchor_item, R83["has aggregated predicate"], pred)
+        if predicate_relation is not None:
+            self.new_rel(anchor_item, R84["aggregates predicates with relation"], predicate_relation)
+        if predicate_relation_object is not None:
+            self.new_rel(anchor_item, R85["aggregates predicates with relation object"], predicate_relation_object)
+        for pred in excluded_predicates or []:
+            self.new_rel(anchor_item, R86["excludes aggregated predicate"], pred)
+
+        if subject_class is not None:
+            self.new_rel(anchor_item, R87["has aggregated subject class"], subject_class)
+        self.new_rel(anchor_item, R88["has minimum group size"], min_count)
+        if max_count is not None:
+            self.new_rel(anchor_item, R89["has maximum group size"], max_count)
+        if group_count is not None:
+            self.new_rel(anchor_item, R90["has matching group count"], group_count)
+
+        return anchor_item
+
     # TODO unify these logical rules with the logical rules for theorems etc.
     def NOT(self):
         msg = "implementing this is planned for the future"
@@ -2368,20 +2473,31 @@ def get_all_instances_of(cls_item: Item, filter=None) -> List[Item]:
 def get_all_subclasses_of(cls_item: Item, strict=True) -> List[Item]:
     """
     Recursively compile a list of all subclasses.
-    """
 
-    subclasses = cls_item.get_inv_relations("R3__is_subclass_of", return_subj=True)
+    The results are cached (ds.subclasses_cache) until an R3-statement of one of the subclasses changes.
+    """
 
     if strict:
         assert allows_instantiation(cls_item)
 
-    indirect_subclasses = []
-    for sc in subclasses:
-        indirect_subclasses.extend(get_all_subclasses_of(sc, strict=strict))
+    subclasses = ds.subclasses_cache.get(cls_item.uri)
+    if subclasses is None:
+        subclasses = cls_item.get_inv_relations("R3__is_subclass_of", return_subj=True)
+
+        indirect_subclasses = []
+        for sc in subclasses:
+            indirect_subclasses.extend(get_all_subclasses_of(sc, strict=False))
+
+        subclasses.extend(indirect_subclasses)
+        subclasses = ds.subclasses_cache[cls_item.uri] = tuple(subclasses)
 
-    subclasses.extend(indirect_subclasses)
+    if strict:
+        # the cache does not depend on `strict` -> check all (direct and indirect) subclasses (cheap, see
+        # allows_instantiation)
+        for sc in subclasses:
+            assert allows_instantiation(sc)
 
-    return subclasses
+    return list(subclasses)
 
 
 def close_class_with_R51(cls_item: Item):
@@ -2407,13 +2523,12 @@ def set_multiple_statements(subjects: Union[list, tuple], predicate: Relation, o
     For every element of subjects, create a statement with predicate and object
     """
 
-    res = []
+    rows = []
     for sub in subjects:
         assert isinstance(sub, Entity)
-        stm = sub.set_relation(predicate, object, qualifiers=qualifiers)
-        res.append(stm)
+        rows.append((sub, predicate, object))
 
-    return res
+    return ds.bulk_insert(rows, qualifiers=qualifiers)
 
 
 R52 = create_builtin_relation(
@@ -2549,14 +2664,26 @@ def get_relation_properties_uris():
     return uris
 
 
-# TODO: this could be speed up by caching
 def get_relation_properties(rel_entity: Entity) -> List[str]:
     """
     return a sorted list of URIs, corresponding to the relation properties corresponding to `rel_entity`.
+
+    For Relation-instances the result is cached (see `DataStore.process_changed_statement`).
     """
 
-    assert isinstance(rel_entity, Relation) or rel_entity.R4__is_instance_of == I40["general relation"]
+    if isinstance(rel_entity, Relation):
+        cached = rel_entity._relation_properties
+        if cached is not None and cached[0] == ds.relation_properties_version:
+            return list(cached[1])
+        rel_props = _get_relation_properties(rel_entity)
+        rel_entity._relation_properties = (ds.relation_properties_version, rel_props)
+        return list(rel_props)
+
+    assert rel_entity.R4__is_instance_of == I40["general relation"]
+    return _get_relation_properties(rel_entity)
+
 
+def _get_relation_properties(rel_entity: Entity) -> List[str]:
     relation_properties_uris = get_relation_properties_uris()
     rel_props = []
     for rp_uri in relation_properties_uris:
@@ -2887,6 +3014,122 @@ R82 = create_builtin_relation(
 )
 
 
+# entities to express aggregation premises of semantic rules (see _rule__CM.new_aggregation)
+
+I64 = create_builtin_item(
+    key_str="I64",
+    R1__has_label="aggregation anchor",
+    R2__has_description=(
+        "anchor item which describes an aggregation premise: the statements of some predicates are grouped by "
+        "(subject, predicate) and every group whose number of objects fulfills a count condition is a match"
+    ),
+    R3__is_subclass_of=I43["anchor item"],
+    R18__has_usage_hint="created by _rule__CM.new_aggregation; evaluated by ruleengine.AggregationRule",
+)
+
+R83 = create_builtin_relation(
+    key_str="R83",
+    R1__has_label="has aggregated predicate",
+    R2__has_description="specifies a relation whose statements are grouped by an aggregation premise",
+    R8__has_domain_of_argument_1=I64["aggregation anchor"],
+    R11__has_range_of_result=I40["general relation"],
+)
+
+R84 = create_builtin_relation(
+    key_str="R84",
+    R1__has_label="aggregates predicates with relation",
+    R2__has_description=(
+        "specifies that the subjects of the statements of the object (a relation) are the aggregated predicates "
+        "(evaluated when the rule is applied)"
+    ),
+    R8__has_domain_of_argument_1=I64["aggregation anchor"],
+    R11__has_range_of_result=I40["general relation"],
+    R22__is_functional=True,
+)
+
+R85 = create_builtin_relation(
+    key_str="R85",
+    R1__has_label="aggregates predicates with relation object",
+    R2__has_description="restricts R84__aggregates_predicates_with_relation to the statements with this object",
+    R8__has_domain_of_argument_1=I64["aggregation anchor"],
+    R22__is_functional=True,
+)
+
+R86 = create_builtin_relation(
+    key_str="R86",
+    R1__has_label="excludes aggregated predicate",
+    R2__has_description="specifies a relation which is not considered by an aggregation premise",
+    R8__has_domain_of_argument_1=I64["aggregation anchor"],
+    R11__has_range_of_result=I40["general relation"],
+)
+
+R87 = create_builtin_relation(
+    key_str="R87",
+    R1__has_label="has aggregated subject class",
+    R2__has_description="specifies that only direct instances of the object are considered as subjects",
+    R8__has_domain_of_argument_1=I64["aggregation anchor"],
+    R11__has_range_of_result=I2["Metaclass"],
+    R22__is_functional=True,
+)
+
+R88 = create_builtin_relation(
+    key_str="R88",
+    R1__has_label="has minimum group size",
+    R2__has_description="specifies the minimum number of objects of a matching group",
+    R8__has_domain_of_argument_1=I64["aggregation anchor"],
+    R11__has_range_of_result=I37["integer number"],
+    R22__is_functional=True,
+)
+
+R89 = create_builtin_relation(
+    key_str="R89",
+    R1__has_label="has maximum group size",
+    R2__has_description="specifies the maximum number of objects of a matching group",
+    R8__has_domain_of_argument_1=I64["aggregation anchor"],
+    R11__has_range_of_result=I37["integer number"],
+    R22__is_functional=True,
+)
+
+R90 = create_builtin_relation(
+    key_str="R90",
+    R1__has_label="has matching group count",
+    R2__has_description=(
+        "specifies that the whole aggregation premise matches (once) if the number of matching groups is equal to "
+        "the object"
+    ),
+    R8__has_domain_of_argument_1=I64["aggregation anchor"],
+    R11__has_range_of_result=I37["integer number"],
+    R22__is_functional=True,
+)
+
+R91 = create_builtin_relation(
+    key_str="R91",
+    R1__has_label="has group subject variable",
+    R2__has_description="specifies the variable which represents the subject of a matching group",
+    R8__has_domain_of_argument_1=I64["aggregation anchor"],
+    R22__is_functional=True,
+)
+
+R92 = create_builtin_relation(
+    key_str="R92",
+    R1__has_label="has group predicate variable",
+    R2__has_description="specifies the variable which represents the predicate of a matching group",
+    R8__has_domain_of_argument_1=I64["aggregation anchor"],
+    R22__is_functional=True,
+)
+
+R93 = create_builtin_relation(
+    key_str="R93",
+    R1__has_label="has group objects variable",
+    R2__has_description=(
+        "specifies the variable which represents the objects of a matching group (they are passed as separate "
+        "arguments to the consequent function)"
+    ),
+    R8__has_domain_of_argument_1=I64["aggregation anchor"],
+    R22__is_functional=True,
+)
+
+
 def add_items(*args):
     if len(args) == 2:
         return I55["add"](*args)
@@ -10,12 +10,14 @@ import inspect
 import types
 import abc
 import random
+import bisect
 import functools
+import contextlib
 from urllib.parse import quote
 from enum import Enum, unique
 import re as regex
 from addict import Dict as attr_dict
-from typing import Any, Dict, Union, List, Iterable, Optional
+from typing import Any, Dict, Union, List, Iterable, Optional, Tuple
 from rdflib import Literal
 import pydantic
 import re
@@ -46,6 +48,22 @@ allowed_literal_types = (str, bool, float, int, complex, Literal)
 # for now these are hardcoded (which is also faster)
 RELKEYS_WITH_LITERAL_RANGE = ("R1", "R2", "R77")
 
+# uris of some builtin relations which have to be handled specially inside this module
+R1_URI = aux.make_uri(settings.BUILTINS_URI, "R1")
+R3_URI = aux.make_uri(settings.BUILTINS_URI, "R3")
+R4_URI = aux.make_uri(settings.BUILTINS_URI, "R4")
+R22_URI = aux.make_uri(settings.BUILTINS_URI, "R22")
+R32_URI = aux.make_uri(settings.BUILTINS_URI, "R32")
+R42_URI = aux.make_uri(settings.BUILTINS_URI, "R42")
+R60_URI = aux.make_uri(settings.BUILTINS_URI, "R60")
+R62_URI = aux.make_uri(settings.BUILTINS_URI, "R62")
+
+# relations whose statements determine the materialized property flags of Relation-instances
+RELATION_FLAG_URIS = (R22_URI, R32_URI, R42_URI, R60_URI)
+
+# upper bound for the number of entries of `ds.key_str_cache` (the cache is emptied if the bound is reached)
+KEY_STR_CACHE_MAXSIZE = 100000
+
 
 # copied from yamlpyowl project
 def check_type(obj, expected_type, strict=True):
@@ -88,6 +106,19 @@ def check_type(obj, expected_type, strict=True):
     return True
 
 
+def mutating(func: callable) -> callable:
+    """
+    Decorator for functions which change the data store (see DataStore.mutation)
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with ds.mutation():
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
 class Entity(abc.ABC):
     """
     Abstract parent class for both Relations and Items.
@@ -112,6 +143,12 @@ class Entity(abc.ABC):
         self._label_after_unlink = None
         self._unlinked = False
 
+        # cache for the results of _get_relation_contents like {rel_uri: {lang_indicator: value}};
+        # entries are removed by the DataStore when the respective statements change;
+        # the whole cache is outdated if its version differs from ds.rel_cache_version
+        self._rel_cache = {}
+        self._rel_cache_version = ds.rel_cache_version
+
         self.updated = False
 
     def __call__(self, *args, **kwargs):
@@ -272,6 +309,33 @@ class Entity(abc.ABC):
                 self.add_method(func)
 
     def _get_relation_contents(self, rel_uri: str, lang_indicator=None):
+        """
+        Return the object(s) of the statements with subject self and predicate rel_uri.
+
+        This is a cached version of `_get_uncached_relation_contents` (see there for details).
+        """
+
+        if lang_indicator is None:
+            lang_indicator = settings.DEFAULT_DATA_LANGUAGE
+
+        if self._rel_cache_version != ds.rel_cache_version:
+            self._rel_cache.clear()
+            self._rel_cache_version = ds.rel_cache_version
+
+        lang_dict = self._rel_cache.get(rel_uri)
+        if lang_dict is None:
+            lang_dict = self._rel_cache[rel_uri] = {}
+        try:
+            res = lang_dict[lang_indicator]
+        except KeyError:
+            res = lang_dict[lang_indicator] = self._get_uncached_relation_contents(rel_uri, lang_indicator)
+
+        if isinstance(res, list):
+            # prevent that the caller accidentally changes the cached list
+            return list(res)
+        return res
+
+    def _get_uncached_relation_contents(self, rel_uri: str, lang_indicator=None):
         aux.ensure_valid_uri(rel_uri)
 
         statements: List[Statement] = ds.get_statements(self.uri, rel_uri)
@@ -289,16 +353,10 @@ class Entity(abc.ABC):
         # R32["is functional for each language"]). R32 also must be handled separately
 
         relation: Relation = ds.relations[rel_uri]
-        hardcoded_functional_relations = [
-            aux.make_uri(settings.BUILTINS_URI, "R22"),
-            aux.make_uri(settings.BUILTINS_URI, "R32"),
-        ]
-
-        hardcoded_functional_fnc4elang_relations = [aux.make_uri(settings.BUILTINS_URI, "R1")]
 
         # in the following or-expression the second operand is only evaluated if the first ist false
         # if rel_uri in ["...#R22", "...#R32"] or relation.R22:
-        if rel_uri in hardcoded_functional_relations or relation.R22:
+        if rel_uri in (R22_URI, R32_URI) or relation.is_functional:
             if len(res) == 0:
                 return None
             else:
@@ -307,7 +365,7 @@ class Entity(abc.ABC):
 
         #  is a similar situation
         # if rel_key == "R32" this means that self 'is functional for each language'
-        elif rel_uri in hardcoded_functional_fnc4elang_relations or relation.R32:
+        elif rel_uri == R1_URI or relation.is_functional_for_each_language:
             if lang_indicator is not None and lang_indicator not in settings.SUPPORTED_LANGUAGES:
                 msg = f"unsupported language ({lang_indicator}) while accessing {self}.{relation.short_key}."
                 raise aux.MultilingualityError(msg)
@@ -461,7 +519,7 @@ class Entity(abc.ABC):
             raise TypeError(msg)
 
         # handle R32__is_functional_for_each_language
-        enforce_literal_as_type = relation.short_key in RELKEYS_WITH_LITERAL_RANGE or relation.R32
+        enforce_literal_as_type = relation.has_literal_range or relation.is_functional_for_each_language
 
         if enforce_literal_as_type and not isinstance(obj, Literal):
             obj = Literal(obj, lang=settings.DEFAULT_DATA_LANGUAGE)
@@ -474,6 +532,7 @@ class Entity(abc.ABC):
             msg = f"Unsupported type ({type(obj)}) of {obj}, while setting relation {relation.short_key} of {self}"
             raise TypeError(msg)
 
+    @mutating
     def _set_relation(
         self,
         rel_uri: str,
@@ -489,18 +548,12 @@ class Entity(abc.ABC):
         self.relation_dict[rel_uri] = rel
 
         # store this relation edge in the global store
-        if isinstance(rel_content, Entity):
-            corresponding_entity = rel_content
-            corresponding_literal = None
-        elif isinstance(rel_content, allowed_literal_types):
-            corresponding_entity = None
-            corresponding_literal = rel_content
-        else:
+        if not isinstance(rel_content, (Entity, *allowed_literal_types)):
             msg = f"unexpected type: {type(rel_content)} for object {rel_content}"
             raise TypeError(msg)
 
-        if qualifiers is None:
-            qualifiers = []
+        # (copy the list because it is extended below)
+        qualifiers = list(qualifiers) if qualifiers else []
 
         if scope is not None:
             assert scope.R4__is_instance_of == ds.get_entity_by_uri(u("bi__I16__scope"))
@@ -510,9 +563,6 @@ class Entity(abc.ABC):
         stm = Statement(
             relation=rel,
             relation_tuple=(self, rel, rel_content),
-            role=RelationRole.SUBJECT,
-            corresponding_entity=corresponding_entity,
-            corresponding_literal=corresponding_literal,
             scope=scope,
             qualifiers=qualifiers,
             proxyitem=proxyitem,
@@ -525,25 +575,13 @@ class Entity(abc.ABC):
 
         # if the object is not a literal then also store the inverse relation
         if isinstance(rel_content, Entity):
-            inv_stm = Statement(
-                relation=rel,
-                relation_tuple=(self, rel, rel_content),
-                role=RelationRole.OBJECT,
-                corresponding_entity=self,
-                scope=scope,
-                qualifiers=stm.qualifiers,
-                proxyitem=proxyitem,
-            )
+            inv_stm = InverseStatement(stm)
 
             # interconnect the primal Statement with the inverse one:
             stm.dual_statement = inv_stm
-            inv_stm.dual_statement = stm
-
-            # ds.set_statement(rel_content.short_key, rel.short_key, inv_stm)
-            tmp_list = ds.inv_statements[rel_content.uri][rel.uri]
 
             # TODO: maybe check length here for inverse functional
-            tmp_list.append(inv_stm)
+            ds.inv_statements[rel_content.uri][rel.uri].append(inv_stm)
         return stm
 
     def get_relations(
@@ -564,7 +602,8 @@ class Entity(abc.ABC):
             msg = f"unexpected type for key_str_or_uri: {type(key_str_or_uri)}. Expected a str or None."
             raise TypeError(msg)
 
-        rel_dict = ds.statements[self.uri]
+        # note: use .get to avoid creating (empty) buckets in the defaultdict just by looking
+        rel_dict = ds.statements.get(self.uri, {})
         return self._return_relations(rel_dict, key_str_or_uri, return_subj, return_obj)
 
     def get_inv_relations(
@@ -583,7 +622,7 @@ class Entity(abc.ABC):
         :return:            either the whole dict or just one value (of type list)
         """
 
-        inv_rel_dict = ds.inv_statements[self.uri]
+        inv_rel_dict = ds.inv_statements.get(self.uri, {})
 
         return self._return_relations(inv_rel_dict, key_str_or_uri, return_subj, return_obj)
 
@@ -620,7 +659,7 @@ class Entity(abc.ABC):
         stm_res: Union[Statement, List[Statement]] = base_dict.get(uri, [])
         if return_subj:
             # do not return the Statement instance(s) but only the subject(s)
-            if isinstance(stm_res, list):
+            if isinstance(stm_res, (list, aux.OrderedSet)):
                 stm_res: List[Statement]
                 res = [re.subject for re in stm_res]
             else:
@@ -628,7 +667,7 @@ class Entity(abc.ABC):
                 res = stm_res.subject
         elif return_obj:
             # do not return the Statement instance(s) but only the object(s)
-            if isinstance(stm_res, list):
+            if isinstance(stm_res, (list, aux.OrderedSet)):
                 stm_res: List[Statement]
                 res = [re.object for re in stm_res]
             else:
@@ -639,6 +678,7 @@ class Entity(abc.ABC):
             res = stm_res
         return res
 
+    @mutating
     def overwrite_statement(self, rel_key_str_or_uri: str, new_obj: "Entity", qualifiers=None) -> "Statement":
         # the caller wants only results for this key (e.g. "R4")
 
@@ -656,7 +696,7 @@ class Entity(abc.ABC):
 
         stm = self.get_relations(rel_uri)
 
-        if isinstance(stm, list):
+        if isinstance(stm, (list, aux.OrderedSet)):
             if len(stm) == 0:
                 msg = f"Unexpectedly found empty statement list for entity {self} and relation {rel}"
                 raise aux.GeneralPyIRKError(msg)
@@ -757,8 +797,8 @@ class DataStore:
         self.items = {}
         self.relations = {}
 
-        # dict of lists store keys of the entities (not the entities itself, to simplify deletion)
-        self.entities_created_in_mod = defaultdict(list)
+        # dict of ordered sets store keys of the entities (not the entities itself, to simplify deletion)
+        self.entities_created_in_mod = defaultdict(aux.OrderedSet)
 
         self.stms_created_in_mod = defaultdict(dict)
 
@@ -766,16 +806,17 @@ class DataStore:
         self.mod_path_mapping = aux.OneToOneMapping()
 
         # for every entity uri store a dict that maps relation uris to lists of corresponding relation-edges
+        # (these "lists" are aux.OrderedSet-instances which allow O(1)-removal)
         self.statements = defaultdict(dict)
 
         # also do this for the inverse relations (for easy querying)
-        self.inv_statements = defaultdict(lambda: defaultdict(list))
+        self.inv_statements = defaultdict(lambda: defaultdict(aux.OrderedSet))
 
         # for every scope-item key store the relevant relation-edges
         self.scope_statements = defaultdict(list)
 
         # for every relation key store the relevant relation-edges
-        self.relation_statements = defaultdict(list)
+        self.relation_statements = defaultdict(aux.OrderedSet)
 
         # store a map {uri: Statement-instance} of all relation edges
         self.statement_uri_map = {}
@@ -783,6 +824,20 @@ class DataStore:
         # this will be set on demand
         self.rdfgraph = None
 
+        # graph which is shared by all RuleApplicators (see ruleengine.get_reasoning_graph); set on demand
+        self.reasoning_graph = None
+
+        # cache for compiled semantic rules (see ruleengine.get_rule_cache); set on demand
+        self.rule_cache = None
+
+        # objects which are notified about added or removed statements and entities; they have to provide the
+        # methods `.statement_changed(stm, added)` and `.entity_changed(entity, added)` (and optionally
+        # `.changes_completed()`, see `.mutation`)
+        self.change_listeners = []
+
+        # number of nested changes which are currently performed (see `.mutation`)
+        self.mutation_depth = 0
+
         # dict to store important QualifierFactory instances which are created in builtin_entities but needed in core
         self.qff_dict = {}
 
@@ -818,6 +873,32 @@ class DataStore:
         # values: new_var_item
         self.scope_var_mappings = {}
 
+        # cache for `process_key_str`: maps 2-tuples (key_str, context_tuple) to ProcessedStmtKey-instances
+        # where context_tuple contains the function arguments and the relevant uris (active module, search uri)
+        self.key_str_cache = {}
+
+        # mapping like {short_key: {cache_key1, ...}} to selectively invalidate the key_str_cache
+        self.key_str_cache_short_key_index = defaultdict(set)
+
+        # global version of the entity-specific caches of relation contents (see Entity._get_relation_contents);
+        # incrementing it invalidates all these caches at once (e.g. if a relation becomes functional)
+        self.rel_cache_version = 0
+
+        # global version of the cached relation properties of relations (see bi.get_relation_properties)
+        self.relation_properties_version = 0
+
+        # index of all R1__has_label statements (of items and relations, all languages):
+        # maps casefolded label strings to OrderedSets of statements (see .get_entities_by_label)
+        self.label_index = defaultdict(aux.OrderedSet)
+
+        # sorted list of the keys of label_index (created on demand for prefix search; None means outdated)
+        self._sorted_label_keys = None
+
+        # caches for taxonomy related results (see builtin_entities.get_taxonomy_tree and .get_all_subclasses_of);
+        # they map entity uris to precomputed results and are invalidated if R3- or R4-statements change
+        self.taxonomy_cache = {}
+        self.subclasses_cache = {}
+
     def initialize_hooks(self) -> dict:
         self.hooks = {
             "post-create-entity": [],
@@ -829,14 +910,218 @@ class DataStore:
         }
         return self.hooks
 
+    def cache_processed_key(self, cache_key: tuple, processed_key: "ProcessedStmtKey") -> None:
+        """
+        Store the result of `process_key_str` for later reuse.
+        """
+
+        if len(self.key_str_cache) >= KEY_STR_CACHE_MAXSIZE:
+            self.invalidate_key_str_cache()
+        self.key_str_cache[cache_key] = processed_key
+        self.key_str_cache_short_key_index[processed_key.short_key].add(cache_key)
+
+    def invalidate_key_str_cache(self, short_key: str = None) -> None:
+        """
+        Remove outdated entries from the cache of `process_key_str`.
+
+        :param short_key:   optional str like "I1234"; if passed only the entries which resolve to this short_key
+                            are removed (e.g. because an entity with this short_key was created or unlinked or
+                            because its label changed); if None (default) the whole cache is emptied
+                            (e.g. because the prefix mapping changed).
+        """
+
+        if short_key is None:
+            self.key_str_cache.clear()
+            self.key_str_cache_short_key_index.clear()
+            return
+
+        for cache_key in self.key_str_cache_short_key_index.pop(short_key, ()):
+            self.key_str_cache.pop(cache_key, None)
+
+    def process_changed_statement(self, stm: "Statement") -> None:
+        """
+        Update derived data (caches, flags) after a (primary) statement was added or removed.
+        """
+
+        subject = stm.relation_tuple[0]
+        rel_uri = stm.relation_tuple[1].uri
+
+        if not isinstance(subject, Entity):
+            # qualifier statements (subject is a Statement) do not affect the derived data
+            return
+
+        subject._rel_cache.pop(rel_uri, None)
+
+        if rel_uri == R1_URI:
+            # the label is used to check labeled key strings -> cached results might be outdated
+            self.invalidate_key_str_cache(subject.short_key)
+
+        elif rel_uri in (R3_URI, R4_URI):
+            self.invalidate_taxonomy_cache(subject)
+            if rel_uri == R3_URI and isinstance(stm.relation_tuple[2], Entity):
+                self.invalidate_subclasses_cache(stm.relation_tuple[2])
+
+        elif rel_uri in RELATION_FLAG_URIS:
+            if isinstance(subject, Relation):
+                subject.update_property_flags()
+
+            if rel_uri in (R22_URI, R32_URI):
+                # the functionality of a relation changed -> this affects all cached contents (of that relation)
+                self.rel_cache_version += 1
+
+        if isinstance(subject, Relation):
+            # cached result of builtin_entities.get_relation_properties
+            subject._relation_properties = None
+            if rel_uri == R62_URI:
+                # the set of relation properties has changed -> this affects all relations
+                self.relation_properties_version += 1
+
+    def invalidate_taxonomy_cache(self, entity: Entity) -> None:
+        """
+        Remove the cached taxonomy results of `entity` and of all its (indirect) subclasses and instances.
+
+        Note: cached results of an entity are only created after those of its superclass/parent class. Thus, the
+        traversal can stop at entities without cached results.
+        """
+
+        stack = [entity.uri]
+        while stack:
+            uri = stack.pop()
+            if self.taxonomy_cache.pop(uri, None) is None:
+                continue
+            inv_rel_dict = self.inv_statements.get(uri)
+            if inv_rel_dict is None:
+                continue
+            for rel_uri in (R3_URI, R4_URI):
+                for inv_stm in inv_rel_dict.get(rel_uri, ()):
+                    stack.append(inv_stm.relation_tuple[0].uri)
+
+    def invalidate_subclasses_cache(self, cls_entity: Entity) -> None:
+        """
+        Remove the cached lists of all subclasses of `cls_entity` and of all its (indirect) superclasses.
+        """
+
+        stack = [cls_entity.uri]
+        visited = set()
+        while stack:
+            uri = stack.pop()
+            if uri in visited:
+                continue
+            visited.add(uri)
+            self.subclasses_cache.pop(uri, None)
+            for stm in self.statements.get(uri, {}).get(R3_URI, ()):
+                if isinstance(stm.relation_tuple[2], Entity):
+                    stack.append(stm.relation_tuple[2].uri)
+
+    def add_change_listener(self, listener) -> None:
+        assert callable(getattr(listener, "statement_changed", None))
+        assert callable(getattr(listener, "entity_changed", None))
+        if listener not in self.change_listeners:
+            self.change_listeners.append(listener)
+
+    def remove_change_listener(self, listener) -> None:
+        self.change_listeners.remove(listener)
+
+    def notify_statement_change(self, stm: "Statement", added: bool) -> None:
+        for listener in self.change_listeners:
+            listener.statement_changed(stm, added)
+
+    def notify_entity_change(self, entity: Entity, added: bool) -> None:
+        for listener in self.change_listeners:
+            listener.entity_changed(entity, added)
+
+    @contextlib.contextmanager
+    def mutation(self):
+        """
+        Context manager for a (possibly nested) change of the data store (see also the decorator `mutating`).
+
+        The change listeners are notified (`.statement_changed`, `.entity_changed`) while the indexes are updated,
+        thus they must not modify the data store. After the outermost change has been completed successfully, the
+        listeners which provide the method `.changes_completed()` are called (there, the data store may be modified).
+        """
+        self.mutation_depth += 1
+        try:
+            yield
+        finally:
+            self.mutation_depth -= 1
+        if self.mutation_depth == 0:
+            self.notify_changes_completed()
+
+    def notify_changes_completed(self) -> None:
+        for listener in list(self.change_listeners):
+            changes_completed = getattr(listener, "changes_completed", None)
+            if changes_completed is not None:
+                changes_completed()
+
+    def add_to_label_index(self, stm: "Statement") -> None:
+        subj, _, label = stm.relation_tuple
+        if not isinstance(subj, Entity) or isinstance(label, Entity):
+            return
+        key = str(label).casefold()
+        stms = self.label_index[key]
+        if not stms:
+            self._sorted_label_keys = None
+        stms.append(stm)
+
+    def remove_from_label_index(self, stm: "Statement") -> None:
+        key = str(stm.relation_tuple[2]).casefold()
+        stms = self.label_index.get(key)
+        if stms is None:
+            return
+        stms.discard(stm)
+        if not stms:
+            del self.label_index[key]
+            self._sorted_label_keys = None
+
+    def get_entities_by_label(
+        self, label: str, lang: Optional[str] = None, ignore_case: bool = False, prefix: bool = False
+    ) -> List[Entity]:
+        """
+        Return all entities (items and relations) whose R1__has_label matches `label` (using the label index).
+
+        :param label:       str; the label (or the beginning of the label, see `prefix`)
+        :param lang:        optional language tag like "en"; None means: any language
+        :param ignore_case: bool; if True the comparison is case-insensitive
+        :param prefix:      bool; if True all labels which start with `label` match
+
+        :return:            list of entities (without duplicates)
+        """
+
+        key = label.casefold()
+        if prefix:
+            if self._sorted_label_keys is None:
+                self._sorted_label_keys = sorted(self.label_index)
+            keys = self._sorted_label_keys
+            idx = bisect.bisect_left(keys, key)
+            stm_lists = []
+            while idx < len(keys) and keys[idx].startswith(key):
+                stm_lists.append(self.label_index[keys[idx]])
+                idx += 1
+        else:
+            stm_lists = [self.label_index.get(key, ())]
+
+        res = {}
+        for stms in stm_lists:
+            for stm in stms:
+                subj, _, obj = stm.relation_tuple
+                if lang is not None and get_language_of_str_literal(obj) != lang:
+                    continue
+                if not ignore_case:
+                    obj_str = str(obj)
+                    if not (obj_str.startswith(label) if prefix else obj_str == label):
+                        continue
+                res[subj] = None
+        return list(res)
+
     def get_item_by_label(self, label) -> Entity:
         """
-        Search over all item and return the first item which has the provided label.
-        Useful during interactive debugging. Not useful for production!
+        Return the first item which has the provided label (in the default data language).
+        Return None if no such item exists.
         """
-        for uri, itm in self.items.items():
-            if itm.R1.value == label:
-                return itm
+        for entity in self.get_entities_by_label(label, lang=settings.DEFAULT_DATA_LANGUAGE):
+            if isinstance(entity, Item):
+                return entity
+        return None
 
     def get_entity_by_key_str(self, key_str, mod_uri=None) -> Entity:
         """
@@ -954,20 +1239,20 @@ class DataStore:
         stm_list = self.statements[subj_uri].get(rel_uri, None)
 
         if stm_list is None or len(stm_list) == 0:
-            self.statements[subj_uri][rel_uri] = [stm]
+            self.statements[subj_uri][rel_uri] = aux.OrderedSet([stm])
 
-        elif isinstance(stm_list, list):
+        elif isinstance(stm_list, aux.OrderedSet):
             exception_flag = stm.get_first_qualifier_obj_with_rel(
                 "R65__allows_alternative_functional_value", tolerate_key_error=True
             )
-            if relation.R22 and not exception_flag:
+            if relation.is_functional and not exception_flag:
                 # R22__is_functional, this means there can only be one value for this relation and this item
                 msg = (
                     f"for subject {subj_uri} there already exists a statement for relation {stm.predicate}. "
                     f"This relation is functional (R22), thus another statement is not allowed."
                 )
                 raise aux.FunctionalRelationError(msg)
-            elif relation.R32 and not exception_flag:
+            elif relation.is_functional_for_each_language and not exception_flag:
                 if not isinstance(stm.object, Literal):
                     stm.object = Literal(stm.object, settings.DEFAULT_DATA_LANGUAGE)
                 lang_list = [get_language_of_str_literal(s.object) for s in stm_list]
@@ -983,10 +1268,223 @@ class DataStore:
         else:
             msg = (
                 f"unexpected type ({type(stm_list)}) of dict content for entity {subj_uri} and "
-                f"relation {rel_uri}. Expected list or None"
+                f"relation {rel_uri}. Expected OrderedSet or None"
             )
             raise TypeError(msg)
 
+        if rel_uri == R1_URI:
+            self.add_to_label_index(stm)
+
+        self.process_changed_statement(stm)
+        self.notify_statement_change(stm, added=True)
+
+    @mutating
+    def bulk_insert(
+        self,
+        rows: Iterable[tuple],
+        qualifiers: Optional[List["RawQualifier"]] = None,
+        scope: Optional["Entity"] = None,
+        overwrite_functional: bool = False,
+    ) -> List["Statement"]:
+        """
+        Create and insert many statements at once. Compared to calling `.set_relation` for every row, predicates are
+        resolved only once and the constraints of R22__is_functional and R32__is_functional_for_each_language are
+        checked in one pass after all statements have been inserted.
+
+        :param rows:        iterable of 3-tuples (subject, predicate, object); predicate: Relation, uri or key_str
+        :param qualifiers:  optional list of RawQualifiers which is applied to every new statement
+        :param scope:       optional scope-item for all new statements
+        :param overwrite_functional:
+                            bool; if True, a new statement replaces older statements which would violate R22 or
+                            R32 (newest wins). Otherwise a FunctionalRelationError is raised and none of the new
+                            statements remains in the data store (this also holds if a row is invalid).
+
+        :return:            list of the new Statement instances (in the order of rows)
+        """
+
+        if scope is not None:
+            assert scope.R4__is_instance_of == self.get_entity_by_uri(u("bi__I16__scope"))
+            qff_has_defining_scope: QualifierFactory = self.qff_dict["qff_has_defining_scope"]
+            qualifiers = [*(qualifiers or []), qff_has_defining_scope(scope)]
+
+        # predicate -> (relation, enforce_literal_as_type)
+        relation_cache = {}
+
+        # first pass: resolve and check all rows (before any index is changed)
+        resolved_rows = []
+        for subj, pred, obj in rows:
+            rel_info = relation_cache.get(pred)
+            if rel_info is None:
+                relation = pred
+                if isinstance(pred, str):
+                    if aux.ensure_valid_uri(pred, strict=False):
+                        relation = self.get_entity_by_uri(pred)
+                    else:
+                        relation = self.get_entity_by_key_str(pred)
+                if not isinstance(relation, Relation):
+                    msg = f"unexpected type: {type(relation)} of relation object {relation}"
+                    raise TypeError(msg)
+                enforce_literal_as_type = relation.has_literal_range or relation.is_functional_for_each_language
+                rel_info = relation_cache[pred] = (relation, enforce_literal_as_type)
+            relation, enforce_literal_as_type = rel_info
+
+            if not isinstance(subj, Entity):
+                msg = f"unexpected type: {type(subj)} of subject {subj} (relation: {relation})"
+                raise TypeError(msg)
+
+            if enforce_literal_as_type and not isinstance(obj, Literal):
+                obj = Literal(obj, lang=settings.DEFAULT_DATA_LANGUAGE)
+
+            if not isinstance(obj, (Entity, *allowed_literal_types)):
+                msg = f"Unsupported type ({type(obj)}) of {obj}, while setting relation {relation.short_key} of {subj}"
+                raise TypeError(msg)
+
+            resolved_rows.append((subj, relation, obj))
+
+        new_stms = []
+
+        # (subj_uri, rel_uri) -> last new statement (used for the deferred validation)
+        touched_buckets = {}
+
+        # the change listeners are notified after the validation (this includes the qualifier statements which are
+        # created together with the new statements)
+        change_listeners, self.change_listeners = self.change_listeners, []
+        try:
+            # second pass: create the statements and fill the indexes (without checking)
+            for subj, relation, obj in resolved_rows:
+                stm = Statement(
+                    relation=relation,
+                    relation_tuple=(subj, relation, obj),
+                    scope=scope,
+                    qualifiers=list(qualifiers) if qualifiers else [],
+                    proxyitem=None,
+                )
+                new_stms.append(stm)
+
+                subj.relation_dict[relation.uri] = relation
+                rel_dict = self.statements[subj.uri]
+                stm_list = rel_dict.get(relation.uri)
+                if stm_list is None:
+                    stm_list = rel_dict[relation.uri] = aux.OrderedSet()
+                stm_list.append(stm)
+                self.relation_statements[relation.uri].append(stm)
+
+                if scope is not None:
+                    self.scope_statements[scope.uri].append(stm)
+
+                if isinstance(obj, Entity):
+                    inv_stm = InverseStatement(stm)
+                    stm.dual_statement = inv_stm
+                    self.inv_statements[obj.uri][relation.uri].append(inv_stm)
+
+                touched_buckets[(subj.uri, relation.uri)] = stm
+
+                if relation.uri == R1_URI:
+                    self.add_to_label_index(stm)
+
+            replaced_stms = self._validate_functional_buckets(touched_buckets, overwrite_functional)
+        except BaseException:
+            self._rollback_bulk_insert(new_stms, scope)
+            raise
+        finally:
+            self.change_listeners = change_listeners
+
+        for stm in new_stms:
+            self.process_changed_statement(stm)
+            for qf in stm.qualifiers:
+                self.notify_statement_change(qf, added=True)
+            self.notify_statement_change(stm, added=True)
+
+        for stm in replaced_stms:
+            stm.unlink()
+
+        return new_stms
+
+    def _rollback_bulk_insert(self, new_stms: List["Statement"], scope: Optional["Entity"]) -> None:
+        """
+        Remove the statements which were inserted by `.bulk_insert` from the indexes. In contrast to
+        `Statement.unlink` the change listeners are not notified because the statements have not been reported yet
+        (see `.bulk_insert`).
+        """
+
+        for stm in reversed(new_stms):
+            subj, pred, obj = stm.relation_tuple
+            _remove_from_index(self.statements, subj.uri, pred.uri, stm)
+
+            rel_stms = self.relation_statements.get(pred.uri)
+            if rel_stms is not None:
+                rel_stms.discard(stm)
+                if not rel_stms:
+                    del self.relation_statements[pred.uri]
+
+            if stm.dual_statement is not None:
+                _remove_from_index(self.inv_statements, obj.uri, pred.uri, stm.dual_statement)
+
+            if pred.uri == R1_URI:
+                self.remove_from_label_index(stm)
+
+            self.process_changed_statement(stm)
+            stm.unlinked = True
+
+            for qf in list(stm.qualifiers):
+                qf.unlink()
+
+            self.statement_uri_map.pop(stm.uri, None)
+
+        if scope is not None and new_stms:
+            new_stm_set = set(new_stms)
+            scope_stms = [stm for stm in self.scope_statements.get(scope.uri, ()) if stm not in new_stm_set]
+            if scope_stms:
+                self.scope_statements[scope.uri] = scope_stms
+            else:
+                self.scope_statements.pop(scope.uri, None)
+
+    def _validate_functional_buckets(self, touched_buckets: dict, overwrite_functional: bool) -> List["Statement"]:
+        """
+        Check R22 and R32 for all (subj_uri, rel_uri)-keys of `touched_buckets` (see `.bulk_insert`).
+
+        :return:    list of statements which have to be unlinked (only nonempty if overwrite_functional is True)
+        """
+
+        res = []
+        for (subj_uri, rel_uri), last_stm in touched_buckets.items():
+            relation = last_stm.relation
+            if relation.is_functional:
+                # all statements are in the same "group"
+                per_language = False
+            elif relation.is_functional_for_each_language:
+                per_language = True
+            else:
+                continue
+
+            stm_list = self.statements[subj_uri][rel_uri]
+            if len(stm_list) < 2:
+                continue
+
+            # group -> list of statements which are currently valid (for the respective group)
+            valid_stms = {}
+            for stm in stm_list:
+                group = get_language_of_str_literal(stm.object) if per_language else None
+                previous_stms = valid_stms.setdefault(group, [])
+                if previous_stms:
+                    exception_flag = stm.get_first_qualifier_obj_with_rel(
+                        "R65__allows_alternative_functional_value", tolerate_key_error=True
+                    )
+                    if exception_flag:
+                        pass
+                    elif overwrite_functional:
+                        res.extend(previous_stms)
+                        previous_stms.clear()
+                    else:
+                        msg = (
+                            f"for subject {subj_uri} there already exists a statement for relation "
+                            f"{stm.predicate}. This relation is functional (R22) or functional for each language "
+                            f"(R32, language: {group}), thus another statement is not allowed."
+                        )
+                        raise aux.FunctionalRelationError(msg)
+                previous_stms.append(stm)
+        return res
+
     def get_uri_for_prefix(self, prefix: str) -> str:
         res = self.uri_prefix_mapping.b.get(prefix)
 
@@ -1142,6 +1640,38 @@ def process_key_str(
     check: bool = True,
     resolve_prefix: bool = True,
     mod_uri: str = None,
+) -> ProcessedStmtKey:
+    """
+    Memoized version of `_process_key_str` (see there for documentation).
+
+    The result depends on the module context (active module, search uri). Thus, this context is part of the
+    cache key. Entries are invalidated via `ds.invalidate_key_str_cache(...)` when the relevant data changes
+    (new or unlinked entities, changed labels, changed prefixes, (un)loaded modules).
+
+    Note: the returned object is shared between callers and must not be modified.
+    """
+
+    cache_key = (
+        key_str,
+        check,
+        resolve_prefix,
+        mod_uri,
+        _uri_stack[-1] if _uri_stack else None,
+        _search_uri_stack[-1] if _search_uri_stack else None,
+        settings.DEFAULT_DATA_LANGUAGE,
+    )
+    res = ds.key_str_cache.get(cache_key)
+    if res is None:
+        res = _process_key_str(key_str, check=check, resolve_prefix=resolve_prefix, mod_uri=mod_uri)
+        ds.cache_processed_key(cache_key, res)
+    return res
+
+
+def _process_key_str(
+    key_str: str,
+    check: bool = True,
+    resolve_prefix: bool = True,
+    mod_uri: str = None,
 ) -> ProcessedStmtKey:
     """
     In IRK there are the following kinds of keys:
@@ -1508,19 +2038,10 @@ class SingleKWArgProcessor:
 
     def handle_kwarg_stage2(self):
 
-        rel_obj = ds.get_entity_by_uri(self.processed_rel_key.uri)
+        rel_obj: Relation = ds.get_entity_by_uri(self.processed_rel_key.uri)
 
-        try:
-            self.rel_is_functional = rel_obj.R22__is_functional != None
-        except aux.ShortKeyNotFoundError:
-            # this happens at the beginning if R22/R32 is not yet defined
-            self.rel_is_functional = False
-
-        try:
-            self.rel_is_functional_fel = rel_obj.R32__is_functional_for_each_language != None
-        except aux.ShortKeyNotFoundError:
-            # this happens at the beginning if R22/R32 is not yet defined
-            self.rel_is_functional_fel = False
+        self.rel_is_functional = rel_obj.is_functional
+        self.rel_is_functional_fel = rel_obj.is_functional_for_each_language
 
         # handle those relations which might come with multiple languages
         if self.new_key in RELKEYS_WITH_LITERAL_RANGE:
@@ -1677,22 +2198,26 @@ def create_item(key_str: str = "", **kwargs) -> Item:
     else:
         item_key = key_str
 
-    mod_uri = get_active_mod_uri()
+    # the changes are reported as one mutation (the decorator `mutating` would break get_key_str_by_inspection)
+    with ds.mutation():
+        mod_uri = get_active_mod_uri()
 
-    new_kwargs, lang_related_kwargs = process_kwargs_for_entity_creation(item_key, kwargs)
+        new_kwargs, lang_related_kwargs = process_kwargs_for_entity_creation(item_key, kwargs)
 
-    itm = Item(base_uri=mod_uri, key_str=item_key, **new_kwargs)
-    assert itm.uri not in ds.items, f"Problematic (duplicated) uri: {itm.uri}"
-    ds.items[itm.uri] = itm
+        itm = Item(base_uri=mod_uri, key_str=item_key, **new_kwargs)
+        assert itm.uri not in ds.items, f"Problematic (duplicated) uri: {itm.uri}"
+        ds.items[itm.uri] = itm
+        ds.invalidate_key_str_cache(itm.short_key)
+        ds.notify_entity_change(itm, added=True)
 
-    # access the defaultdict(list)
-    ds.entities_created_in_mod[mod_uri].append(itm.uri)
+        # access the defaultdict(OrderedSet)
+        ds.entities_created_in_mod[mod_uri].append(itm.uri)
 
-    process_lang_related_kwargs_for_entity_creation(itm, item_key, lang_related_kwargs)
+        process_lang_related_kwargs_for_entity_creation(itm, item_key, lang_related_kwargs)
 
-    run_hooks(itm, phase="post-create")
+        run_hooks(itm, phase="post-create")
 
-    return itm
+        return itm
 
 
 # noinspection PyShadowingNames
@@ -1703,6 +2228,16 @@ class Relation(Entity):
         self.short_key = short_key
         self.uri = aux.make_uri(self.base_uri, self.short_key)
 
+        # materialized relation properties; they are kept up to date by `ds.process_changed_statement`
+        self._is_functional = False  # R22
+        self._is_functional_for_each_language = False  # R32
+        self._is_symmetrical = False  # R42
+        self._is_transitive = False  # R60
+        self._has_literal_range = short_key in RELKEYS_WITH_LITERAL_RANGE
+
+        # will be set on demand by builtin_entities.get_relation_properties
+        self._relation_properties = None
+
         # set label
         self._set_relations_from_init_kwargs(**kwargs)
 
@@ -1715,6 +2250,43 @@ class Relation(Entity):
             r1 = getattr(self, "_label_after_unlink", "no label")
         return f'<Relation {self.short_key}["{r1}"]>'
 
+    @property
+    def is_functional(self) -> bool:
+        return self._is_functional
+
+    @property
+    def is_functional_for_each_language(self) -> bool:
+        return self._is_functional_for_each_language
+
+    @property
+    def is_symmetrical(self) -> bool:
+        return self._is_symmetrical
+
+    @property
+    def is_transitive(self) -> bool:
+        return self._is_transitive
+
+    @property
+    def has_literal_range(self) -> bool:
+        return self._has_literal_range
+
+    def update_property_flags(self) -> None:
+        """
+        Recompute the materialized property flags from the statements of this relation.
+
+        Note: the statements are accessed directly to avoid infinite recursion during bootstrapping.
+        """
+
+        rel_dict = ds.statements.get(self.uri, {})
+
+        def get_flag(rel_uri):
+            return any(stm.relation_tuple[2] for stm in rel_dict.get(rel_uri, []))
+
+        self._is_functional = get_flag(R22_URI)
+        self._is_functional_for_each_language = get_flag(R32_URI)
+        self._is_symmetrical = get_flag(R42_URI)
+        self._is_transitive = get_flag(R60_URI)
+
 
 @unique
 class RelationRole(Enum):
@@ -1769,8 +2341,18 @@ def register_hook(type_str: str, func: callable) -> None:
 class KeyManager:
     """
     Class for a flexible and comprehensible key management. Every pyirk module must have its own (passed via)
+
+    The keys are generated lazily as a seeded pseudo-random permutation of the key range (no list of keys is
+    materialized). If the range is exhausted, it is extended by a new (larger) block. Keys for statements (and
+    qualifiers) are taken from a separate reservoir such that they do not consume item/relation keys.
     """
 
+    # number of rounds of the Feistel network which is used for the permutation
+    FEISTEL_ROUNDS = 4
+
+    # factor by which the upper bound of the key range is increased if the current range is exhausted
+    EXPANSION_FACTOR = 10
+
     # TODO: the term "maxval" is misleading because it will be used in range where the upper bound is exclusive
     # however, using range(minval, maxval+1) would results in different shuffling and thus will probably need some
     # refactoring of existing modules
@@ -1782,47 +2364,97 @@ class KeyManager:
         :param keyseed: int; This allows a module to create its own random key order
         """
 
+        assert maxval > minval
+
         self.instance = self
         self.minval = minval
         self.maxval = maxval
+
+        # passing seed ensures "reproducible randomness" across runs
+        if not keyseed:
+            # use hardcoded fallback
+            keyseed = 1750
         self.keyseed = keyseed
 
-        self.key_reservoir = None
+        # for every reservoir ("entity" and "statement"): [block index, position inside the block]
+        self._reservoir_state = {"entity": [0, 0], "statement": [0, 0]}
 
-        self._generate_key_numbers()
+        # cache for the round keys (lazily created for every (reservoir, block index))
+        self._round_keys = {}
 
-    def pop(self, index: int = -1) -> int:
-        key = self.key_reservoir.pop(index)
-        return key
+    def pop(self) -> int:
+        """
+        Return the next key for an item or a relation.
 
-    def _generate_key_numbers(self) -> None:
+        Rationale behind random keys: During creation of knowledge bases it frees the mind of thinking too much
+        about a meaningful order in which to create entities. Due to the seed value these numbers are stable between
+        runs of the software, which simplifies development and debugging.
         """
-        Creates a reservoir of keynumbers, e.g. for automatically created entities. Due to the hardcoded seed value
-        these numbers are stable between runs of the software, which simplifies development and debugging.
+        return self._pop_from_reservoir("entity")
 
-        This function is also called after unloading a module because the respective keys are "free" again
+    def pop_stm_key(self) -> int:
+        """
+        Return the next key for a statement or a qualifier.
+        """
+        return self._pop_from_reservoir("statement")
 
-        Rationale behind random keys: During creation of knowledge bases it frees the mind of thinking too much
-        about a meaningful order in which to create entities.
+    def get_block_range(self, block_idx: int) -> Tuple[int, int]:
+        """
+        Return (lower bound, exclusive upper bound) of the key block with index `block_idx`.
+        Block 0 is (minval, maxval), every further block starts where the previous one ended.
+        """
+
+        lower, upper = self.minval, self.maxval
+        for _ in range(block_idx):
+            lower, upper = upper, upper * self.EXPANSION_FACTOR
+        return lower, upper
+
+    def _pop_from_reservoir(self, reservoir: str) -> int:
+        state = self._reservoir_state[reservoir]
+        block_idx, pos = state
+        lower, upper = self.get_block_range(block_idx)
+        if pos >= upper - lower:
+            # the current block is exhausted -> expand the key space
+            block_idx, pos = block_idx + 1, 0
+            lower, upper = self.get_block_range(block_idx)
+        state[0], state[1] = block_idx, pos + 1
+
+        round_keys = self._round_keys.get((reservoir, block_idx))
+        if round_keys is None:
+            random_ng = random.Random(x=f"{self.keyseed}-{reservoir}-{block_idx}")
+            round_keys = tuple(random_ng.getrandbits(32) for _ in range(self.FEISTEL_ROUNDS))
+            self._round_keys[(reservoir, block_idx)] = round_keys
 
-        :return:    list of integers
+        return lower + self._permute(pos, upper - lower, round_keys)
+
+    @staticmethod
+    def _permute(pos: int, size: int, round_keys: Tuple[int]) -> int:
+        """
+        Bijective pseudo-random mapping of range(size) onto itself (balanced Feistel network + cycle walking).
         """
 
-        assert self.key_reservoir is None
+        half_bits = ((size - 1).bit_length() + 1) // 2 or 1
+        mask = (1 << half_bits) - 1
 
-        # passing seed (arg `x`) ensures "reproducible randomness" across runs
-        if not self.keyseed:
-            # use hardcoded fallback
-            self.keyseed = 1750
-        random_ng = random.Random(x=self.keyseed)
-        self.key_reservoir = list(range(self.minval, self.maxval))
-        random_ng.shuffle(self.key_reservoir)
+        res = pos
+        while True:
+            left, right = res >> half_bits, res & mask
+            for rk in round_keys:
+                left, right = right, left ^ ((((right ^ rk) * 0x9E3779B1) >> 11) & mask)
+            res = (left << half_bits) | right
+
+            # the network permutes range(2**(2*half_bits)) -> repeat until we are inside range(size)
+            if res < size:
+                return res
 
 
 def pop_uri_based_key(prefix: Optional[str] = None, prefix2: str = "") -> Union[int, str]:
     """
     Create a short key (int or str) (optionally with prefixes) from the reservoir.
 
+    Without prefix the key is taken from the statement reservoir of the keymanager. With prefix a key is returned
+    which is not yet used by an entity of the active module.
+
     :param prefix:
     :param prefix2:
     :return:
@@ -1830,15 +2462,17 @@ def pop_uri_based_key(prefix: Optional[str] = None, prefix2: str = "") -> Union[
 
     active_mod_uri = get_active_mod_uri()
     km: KeyManager = ds.uri_keymanager_dict[active_mod_uri]
-    num_key = km.pop()
     if prefix is None:
         assert not prefix2
-        return num_key
+        return km.pop_stm_key()
 
     assert prefix in ("I", "R")
 
-    short_key = f"{prefix}{prefix2}{num_key}"
-    return short_key
+    while True:
+        short_key = f"{prefix}{prefix2}{km.pop()}"
+        uri = aux.make_uri(active_mod_uri, short_key)
+        if uri not in ds.items and uri not in ds.relations:
+            return short_key
 
 
 def repl_spc_by_udsc(txt: str) -> str:
@@ -1900,8 +2534,17 @@ class Statement:
     # some old comments might refer to this
     """
     Models a concrete (instantiated/applied) relation between entities. This is basically a dict.
+
+    To save memory only the data which cannot be derived from `relation_tuple` is stored (in slots).
+    The perspective of the object (RelationRole.OBJECT) is represented by a lightweight `InverseStatement`
+    (available via `.dual_statement`), which is stored in `ds.inv_statements`.
     """
 
+    __slots__ = ("uri", "relation_tuple", "scope", "dual_statement", "unlinked", "qualifiers", "proxyitem")
+
+    # Statement-instances are always stored from the perspective of the subject
+    role = RelationRole.SUBJECT
+
     def __init__(
         self,
         relation: Relation = None,
@@ -1915,36 +2558,33 @@ class Statement:
     ) -> None:
         """
 
-        :param relation:
+        :param relation:                must be relation_tuple[1] (redundant, kept for backward compatibility)
         :param relation_tuple:
-        :param role:                    RelationRole.SUBJECT for normal and RelationRole.OBJECT for inverse statements
-        :param corresponding_entity:    This is the entity on the "other side" of the relation (depending of `role`) or
-                                        None in case that other side is a literal
-        :param corresponding_literal:   This is the literal on the "other side" of the relation (depending of `role`) or
-        :param scope:                   None in case that other side is an Entity
+        :param role:                    None or RelationRole.SUBJECT (inverse statements are modeled by
+                                        InverseStatement)
+        :param corresponding_entity:    ignored (derived from relation_tuple, kept for backward compatibility)
+        :param corresponding_literal:   ignored (derived from relation_tuple, kept for backward compatibility)
+        :param scope:
         :param qualifiers:              list of relation edges, that describe `self` more precisely
                                         (cf. wikidata qualifiers)
         :param proxyitem:               associated item; e.g. a equation-item
         """
 
+        if role not in (None, RelationRole.SUBJECT):
+            msg = f"Unexpected role: {role}. Inverse statements are represented by InverseStatement-instances."
+            raise ValueError(msg)
+        assert relation is None or relation is relation_tuple[1]
+
         # S means "statement" (successor of earlier RE for "relation edge")
-        self.short_key = f"S{pop_uri_based_key()}"
         mod_uri = get_active_mod_uri()
-        self.base_uri = mod_uri
-        self.uri = f"{aux.make_uri(self.base_uri, self.short_key)}"
-        self.relation = relation
-        self.rsk = relation.short_key  # to conveniently access this attribute in visualization
-        self.relation_tuple = relation_tuple
-        self.subject = relation_tuple[0]
-        self.predicate = relation_tuple[1]
-        self.object = relation_tuple[2]
-        self.role = role
+        self.uri = sys.intern(aux.make_uri(mod_uri, f"S{pop_uri_based_key()}"))
+        self.relation_tuple = tuple(relation_tuple)
         self.scope = scope
-        self.corresponding_entity = corresponding_entity
-        self.corresponding_literal = corresponding_literal
         self.dual_statement = None
         self.unlinked = None
-        self.qualifiers = []
+
+        # most statements have no qualifiers -> use a shared (immutable) empty sequence
+        self.qualifiers = ()
         self._process_qualifiers(qualifiers)
 
         ds.stms_created_in_mod[mod_uri][self.uri] = self
@@ -1955,11 +2595,61 @@ class Statement:
         # TODO: replace this by qualifier
         self.proxyitem = proxyitem
 
+    @property
+    def short_key(self) -> str:
+        return self.uri.rsplit(settings.URI_SEP, 1)[1]
+
+    @property
+    def base_uri(self) -> str:
+        return self.uri.rsplit(settings.URI_SEP, 1)[0]
+
     @property
     def key_str(self):
         # TODO: the "attribute" `.key_str` for Statement is deprecated; use `.short_key` instead
         return self.short_key
 
+    @property
+    def subject(self):
+        return self.relation_tuple[0]
+
+    @property
+    def predicate(self) -> Relation:
+        return self.relation_tuple[1]
+
+    @property
+    def relation(self) -> Relation:
+        return self.relation_tuple[1]
+
+    @property
+    def rsk(self) -> str:
+        # to conveniently access this attribute in visualization
+        return self.relation_tuple[1].short_key
+
+    @property
+    def object(self):
+        return self.relation_tuple[2]
+
+    @object.setter
+    def object(self, value):
+        subj, pred, _ = self.relation_tuple
+        self.relation_tuple = (subj, pred, value)
+
+    @property
+    def corresponding_entity(self) -> Optional[Entity]:
+        """
+        the entity on the "other side" of the relation or None in case that other side is a literal
+        """
+        obj = self.relation_tuple[2]
+        return obj if isinstance(obj, Entity) else None
+
+    @property
+    def corresponding_literal(self):
+        """
+        the literal on the "other side" of the relation or None in case that other side is an Entity
+        """
+        obj = self.relation_tuple[2]
+        return None if isinstance(obj, Entity) else obj
+
     def __repr__(self):
         res = f"{self.short_key}{self.relation_tuple}"
         return res
@@ -1972,24 +2662,14 @@ class Statement:
             return
 
         if isinstance(qlist[0], QualifierStatement):
-            # this is the case when an inverse statement is created
             self.qualifiers = [*qlist]
             return
 
+        self.qualifiers = []
         for qf in qlist:
-            if isinstance(qf.obj, Entity):
-                corresponding_entity = qf.obj
-                corresponding_literal = None
-            else:
-                corresponding_entity = None
-                corresponding_literal = repr(qf.obj)
-
             qf_stm = QualifierStatement(
                 relation=qf.rel,
                 relation_tuple=(self, qf.rel, qf.obj),
-                role=RelationRole.SUBJECT,
-                corresponding_entity=corresponding_entity,
-                corresponding_literal=corresponding_literal,
                 scope=scope,
                 qualifiers=None,
                 proxyitem=None,
@@ -2025,9 +2705,10 @@ class Statement:
 
         return None
 
+    @mutating
     def unlink(self, *args) -> None:
         """
-        Remove this Statement instance from all data structures in the global data storage
+        Remove this Statement instance (and its inverse) from all data structures in the global data storage
         :return:
         """
 
@@ -2048,39 +2729,38 @@ class Statement:
             # -> do nothing
             try:
                 subj.qualifiers.remove(self)
-            except ValueError:
-                pass
-            try:
-                subj.dual_statement.qualifiers.remove(self)
             except (ValueError, AttributeError):
-                # AttributeError means that dual_statement was None
+                # AttributeError means that the qualifiers are the empty default tuple
                 pass
 
-        if self.role == RelationRole.SUBJECT:
-            subj_rel_edges: Dict[str : List[Statement]] = ds.statements[subj.uri]
-            tolerant_removal(subj_rel_edges.get(pred.uri, []), self)
-
-            # ds.relation_statements: for every relation key stores a list of relevant relation-edges
-            # (check before accessing the *defaultdict* to avoid to create a key just by looking)
-            if pred.uri in ds.relation_statements:
-                tolerant_removal(ds.relation_statements.get(pred.uri, []), self)
-
-        elif self.role == RelationRole.OBJECT:
-            assert isinstance(obj, Entity)
-            obj_rel_edges: Dict[str : List[Statement]] = ds.inv_statements[obj.uri]
-            # (check before accessing, see above)
-            if pred.uri in obj_rel_edges:
-                tolerant_removal(obj_rel_edges[pred.uri], self)
-        else:
-            msg = f"Unexpected .role attribute: {self.role}"
-            raise ValueError(msg)
+        # remove the statement from the indexes; buckets which become empty are deleted immediately
+        # (this keeps the effort of unlinking (and thus of `unload_mod`) independent of the total data size)
+        _remove_from_index(ds.statements, subj.uri, pred.uri, self)
+
+        # ds.relation_statements: for every relation key stores a list of relevant relation-edges
+        # (use .get to avoid to create a key of the *defaultdict* just by looking)
+        rel_stms = ds.relation_statements.get(pred.uri)
+        if rel_stms is not None:
+            rel_stms.discard(self)
+            if not rel_stms:
+                del ds.relation_statements[pred.uri]
+
+        if pred.uri == R1_URI:
+            ds.remove_from_label_index(self)
+
+        ds.process_changed_statement(self)
+        ds.notify_statement_change(self, added=False)
 
         # this prevents from infinite recursion
         self.unlinked = True
         if self.dual_statement is not None:
-            self.dual_statement.unlink()
+            # remove the inverse statement
+            _remove_from_index(ds.inv_statements, obj.uri, pred.uri, self.dual_statement)
+        elif isinstance(self, QualifierStatement) and isinstance(obj, Entity):
+            # qualifier statements are stored directly in ds.inv_statements (see ._process_qualifiers)
+            _remove_from_index(ds.inv_statements, obj.uri, pred.uri, self)
 
-        for qf in self.qualifiers:
+        for qf in list(self.qualifiers):
             qf: Statement
             qf.unlink()
 
@@ -2088,10 +2768,76 @@ class Statement:
 
 
 class QualifierStatement(Statement):
-    def __init__(self, *args, **kwargs):
-        # self.dual_qualifier = None
-        super().__init__(*args, **kwargs)
-        self.short_key = f"Q{self.short_key}"
+    __slots__ = ()
+
+    @property
+    def short_key(self) -> str:
+        return f"Q{super().short_key}"
+
+    @property
+    def corresponding_literal(self):
+        obj = self.relation_tuple[2]
+        return None if isinstance(obj, Entity) else repr(obj)
+
+
+def _dual_statement_property(name: str) -> property:
+    return property(lambda self: getattr(self.dual_statement, name), doc=f"`.{name}` of the primary statement")
+
+
+class InverseStatement(Statement):
+    """
+    Lightweight view of a Statement from the perspective of its object (RelationRole.OBJECT).
+
+    Instances are stored in `ds.inv_statements`. All data is taken from the primary statement (`.dual_statement`),
+    i.e. only the slot `dual_statement` is used.
+    """
+
+    __slots__ = ()
+
+    role = RelationRole.OBJECT
+
+    # noinspection PyMissingConstructor
+    def __init__(self, stm: Statement):
+        self.dual_statement = stm
+
+    uri = _dual_statement_property("uri")
+    relation_tuple = _dual_statement_property("relation_tuple")
+    scope = _dual_statement_property("scope")
+    qualifiers = _dual_statement_property("qualifiers")
+    proxyitem = _dual_statement_property("proxyitem")
+    unlinked = _dual_statement_property("unlinked")
+
+    @property
+    def corresponding_entity(self) -> Entity:
+        # from the perspective of the object the subject is on the "other side"
+        return self.dual_statement.relation_tuple[0]
+
+    corresponding_literal = None
+
+    def is_qualifier(self):
+        return False
+
+    def unlink(self, *args) -> None:
+        self.dual_statement.unlink()
+
+
+def _remove_from_index(index: dict, uri: str, rel_uri: str, stm: Statement) -> None:
+    """
+    Remove `stm` from `index[uri][rel_uri]` (where index is `ds.statements` or `ds.inv_statements`) and delete the
+    buckets which became empty. Missing buckets are tolerated (and not created).
+    """
+
+    rel_dict = index.get(uri)
+    if rel_dict is None:
+        return
+    stms = rel_dict.get(rel_uri)
+    if stms is None:
+        return
+    stms.discard(stm)
+    if not stms:
+        del rel_dict[rel_uri]
+        if not rel_dict:
+            del index[uri]
 
 
 def tolerant_removal(sequence, element):
@@ -2124,29 +2870,33 @@ def create_relation(key_str: str = "", **kwargs) -> Relation:
     else:
         rel_key = key_str
 
-    assert rel_key.startswith("R")
+    # the changes are reported as one mutation (the decorator `mutating` would break get_key_str_by_inspection)
+    with ds.mutation():
+        assert rel_key.startswith("R")
 
-    mod_uri = get_active_mod_uri()
+        mod_uri = get_active_mod_uri()
 
-    # TODO: obsolete?
-    default_relations = {
-        # "R22": None,  # R22__is_functional
-    }
+        # TODO: obsolete?
+        default_relations = {
+            # "R22": None,  # R22__is_functional
+        }
 
-    new_kwargs, lang_related_kwargs = process_kwargs_for_entity_creation(rel_key, kwargs)
+        new_kwargs, lang_related_kwargs = process_kwargs_for_entity_creation(rel_key, kwargs)
 
-    rel = Relation(mod_uri, rel_key, **new_kwargs)
-    if rel.uri in ds.relations:
-        msg = f"URI '{rel.uri}' has already been used."
-        raise aux.InvalidURIError(msg)
-    ds.relations[rel.uri] = rel
-    ds.entities_created_in_mod[mod_uri].append(rel.uri)
+        rel = Relation(mod_uri, rel_key, **new_kwargs)
+        if rel.uri in ds.relations:
+            msg = f"URI '{rel.uri}' has already been used."
+            raise aux.InvalidURIError(msg)
+        ds.relations[rel.uri] = rel
+        ds.invalidate_key_str_cache(rel.short_key)
+        ds.notify_entity_change(rel, added=True)
+        ds.entities_created_in_mod[mod_uri].append(rel.uri)
 
-    process_lang_related_kwargs_for_entity_creation(rel, rel_key, lang_related_kwargs)
+        process_lang_related_kwargs_for_entity_creation(rel, rel_key, lang_related_kwargs)
 
-    run_hooks(rel, phase="post-create")
+        run_hooks(rel, phase="post-create")
 
-    return rel
+        return rel
 
 
 def create_builtin_item(*args, **kwargs) -> Item:
@@ -2178,16 +2928,8 @@ def generate_new_key(prefix, prefix2="", mod_uri=None):
         print(aux.byellow(f"Warning: creating key based on module {mod_uri}, which is probably unintended"))
 
     with uri_context(mod_uri):
-        while True:
-            key = f"{prefix}{prefix2}{pop_uri_based_key()}"
-            uri = aux.make_uri(mod_uri, key)
-            try:
-                ds.get_entity_by_uri(uri)
-            except aux.UnknownURIError:
-                # the key was new -> no problem
-                return key
-            else:
-                continue
+        # note: pop_uri_based_key ensures that the key is new
+        return pop_uri_based_key(prefix, prefix2)
 
 
 def print_new_keys(n=30, loaded_mod=None):
@@ -2328,6 +3070,7 @@ class abstract_uri_context:
 
         if self.prefix:
             ds.uri_prefix_mapping.add_pair(self.uri, self.prefix)
+            ds.invalidate_key_str_cache()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -2337,6 +3080,7 @@ class abstract_uri_context:
         assert res == self.uri
         if self.prefix:
             ds.uri_prefix_mapping.remove_pair(self.uri, self.prefix)
+            ds.invalidate_key_str_cache()
 
 
 class uri_context(abstract_uri_context):
@@ -2400,8 +3144,9 @@ def unload_mod(mod_uri: str, strict=True) -> None:
         else:
             pass
 
-    aux.clean_dict(ds.statements)
-    aux.clean_dict(ds.inv_statements)
+    # note: no global clean up of ds.statements and ds.inv_statements is necessary here because unlinking a
+    # statement already removes the buckets which became empty. Thus, the effort of unloading is proportional to
+    # the number of entities and statements which are related to the module.
 
     try:
         ds.uri_keymanager_dict.pop(mod_uri)
@@ -2416,11 +3161,13 @@ def unload_mod(mod_uri: str, strict=True) -> None:
             raise
 
     ds.uri_prefix_mapping.remove_pair(mod_uri, strict=strict)
+    ds.invalidate_key_str_cache()
 
     if modname := ds.modnames.get(mod_uri):
         sys.modules.pop(modname)
 
 
+@mutating
 def _unlink_entity(uri: str, remove_from_mod=False) -> None:
     """
     Remove the occurrence of this the respective entity from all relevant data structures
@@ -2439,17 +3186,21 @@ def _unlink_entity(uri: str, remove_from_mod=False) -> None:
     if remove_from_mod:
         mod_uri = uri.split("#")[0]
         mod_entities = ds.entities_created_in_mod[mod_uri]
-
-        # TODO: this could be speed up by using a dict instead of a list for mod_entities
         mod_entities.remove(uri)
 
     res1 = ds.items.pop(uri, None)
     res2 = ds.relations.pop(uri, None)
+    ds.invalidate_key_str_cache(entity.short_key)
+    entity._rel_cache.clear()
+    ds.taxonomy_cache.pop(uri, None)
+    ds.subclasses_cache.pop(uri, None)
 
     if res1 is None and res2 is None:
         msg = f"No entity with key {uri} could be found. This is unexpected."
         raise KeyError(msg)
 
+    ds.notify_entity_change(entity, added=False)
+
     # now delete the relation edges from the data structures
     re_dict = ds.statements.pop(entity.uri, {})
     inv_re_dict = ds.inv_statements.pop(entity.uri, {})
@@ -2476,12 +3227,12 @@ def _unlink_entity(uri: str, remove_from_mod=False) -> None:
         stm: Statement
         stm.unlink(uri)
 
-    # during unlinking of the Statements the default dicts might have been recreating some keys -> pop again
-    # TODO: obsolete because we clean up the defaultdicts anyway
+    # during unlinking of the Statements the index buckets of this entity might have been recreated -> pop again
     ds.statements.pop(entity.uri, None)
     ds.inv_statements.pop(entity.uri, None)
 
 
+@mutating
 def replace_and_unlink_entity(old_entity: Entity, new_entity: Entity):
     """
     Replace all statements where `old_entity` is subject or object with new relations where `new_entity` is sub or obj.
@@ -2589,6 +3340,9 @@ def register_mod(uri: str, keymanager: KeyManager = None, check_uri=True, prefix
     if prefix:
         ds.uri_prefix_mapping.add_pair(key_a=uri, key_b=prefix)
 
+    # keys might now be resolved differently (new module or new prefix)
+    ds.invalidate_key_str_cache()
+
 
 def start_mod(uri):
     """
@@ -60,13 +60,7 @@ def import_stms_from_rdf_triples(fpath: str):
             new_row.append(p.rdfstack.convert_from_rdf_to_pyirk(elt))
         new_rows.append(new_row)
 
-    res.new_stms = []
-    for subj, pred, obj in new_rows:
-        try:
-            stm = subj.set_relation(pred, obj)
-        except p.aux.FunctionalRelationError:
-            stm = subj.overwrite_statement(pred.uri, obj)
-
-        res.new_stms.append(stm)
+    # newer values of functional relations replace existing ones
+    res.new_stms = p.ds.bulk_insert(new_rows, overwrite_functional=True)
 
     return res
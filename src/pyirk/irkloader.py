@@ -211,6 +211,7 @@ def _load_mod_from_path(
         raise pyirk.aux.InvalidPrefixError(msg)
 
     pyirk.ds.uri_prefix_mapping.add_pair(mod_uri, prefix)
+    pyirk.ds.invalidate_key_str_cache()
 
     pyirk.ds.uri_mod_dict[mod_uri] = mod
 
@@ -6,14 +6,15 @@ This module contains code to enable semantic inferences based on special items (
 
 """
 
-from typing import Dict, List, Tuple, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Tuple, Optional, Union
 import os
-from collections import defaultdict
+from collections import defaultdict, Counter
 from enum import Enum
-import json
 import textwrap
 import time
+import copy
 import itertools as it
+import multiprocessing
 
 import networkx as nx
 from networkx.algorithms import isomorphism as nxiso
@@ -37,99 +38,1589 @@ import pyirk as p
 
 LITERAL_BASE_URI = "irk:/tmp/literals"
 
+R20_URI = bi.R20["has defining scope"].uri
+
 VERBOSITY = False
 
 
-def apply_all_semantic_rules(mod_context_uri=None) -> List[core.Statement]:
-    """
-    Extract all semantic rules and apply them.
+def apply_all_semantic_rules(mod_context_uri=None) -> List[core.Statement]:
+    """
+    Extract all semantic rules and apply them.
+
+    :returns:  list of newly created statements
+    """
+    rule_instances = get_all_rules()
+    total_res = core.RuleResult()
+    for rule in rule_instances:
+        res = apply_semantic_rule(rule, mod_context_uri)
+        total_res.add_partial(res)
+
+    return total_res
+
+
+def apply_semantic_rules(
+    *rules: List, mod_context_uri: str = None, processes: int = None, match_limit: int = None
+) -> List[core.Statement]:
+    """
+    Apply the rules (in this order)
+
+    :param processes:   optional number of worker processes for the matching phase (see ParallelRuleMatcher); the
+                        results are the same as without
+    :param match_limit: see apply_semantic_rule
+    """
+    total_res = ReportingMultiRuleResult(rule_list=rules)
+
+    parallel_matcher = None
+    if processes:
+        recorder = StatementRecorder()
+        core.ds.add_change_listener(recorder)
+        parallel_matcher = ParallelRuleMatcher(processes, recorder)
+        parallel_matcher.precompute([(rule, None) for rule in rules])
+
+    try:
+        for rule in rules:
+            precomputed_matches = parallel_matcher.pop(rule) if parallel_matcher else None
+            res = apply_semantic_rule(
+                rule, mod_context_uri, precomputed_matches=precomputed_matches, match_limit=match_limit
+            )
+            total_res.add_partial(res)
+            if res.exception:
+                break
+    finally:
+        if parallel_matcher:
+            core.ds.remove_change_listener(recorder)
+
+    return total_res
+
+
+def apply_rules_until_fixpoint(
+    rules: List[core.Item],
+    max_rounds: int = None,
+    time_budget: float = None,
+    mod_context_uri: str = None,
+    processes: int = None,
+    match_limit: int = None,
+) -> "ReportingMultiRuleResult":
+    """
+    Apply the rules repeatedly until no new statements are created (or until a limit is reached).
+
+    The first round applies every rule to the whole graph. In the following rounds (semi-naive evaluation) a rule
+    is only searched for matches which involve at least one statement that was created since the beginning of its
+    previous application (delta statements). Rules without delta statements are skipped.
+
+    This assumes that the premise of a rule (including its condition functions) only depends on statements whose
+    subjects are entities of the match. Rules with SPARQL premise and algorithmic rules are completely re-evaluated
+    (if there are delta statements).
+
+    :param rules:           sequence of rules (applied in this order in every round)
+    :param max_rounds:      maximum number of rounds (None means no limit)
+    :param time_budget:     maximum time in seconds (checked before every rule application; None means no limit)
+    :param mod_context_uri: see apply_semantic_rule
+    :param processes:       optional number of worker processes; if passed, the matches of all rules of a round are
+                            searched in parallel at the beginning of the round (see ParallelRuleMatcher); the results
+                            are the same as without
+    :param match_limit:     optional maximum number of matches which are processed per rule application (and
+                            RuleApplicatorWorker); the remaining matches of a truncated application are processed
+                            in the following rounds (paging, see RuleApplicator.match_cursors)
+
+    :returns:               ReportingMultiRuleResult; per-round statistics are stored in `.round_stats` and the
+                            reason for stopping in `.stop_reason` ("fixpoint", "max_rounds", "time_budget",
+                            "exception")
+    """
+
+    total_res = ReportingMultiRuleResult(rule_list=list(rules))
+    recorder = StatementRecorder()
+    core.ds.add_change_listener(recorder)
+    parallel_matcher = ParallelRuleMatcher(processes, recorder) if processes else None
+
+    # for every rule: position in recorder.statements at the beginning of its previous application
+    last_positions = {}
+
+    # for every truncated rule: Container(start=..., end=..., match_cursors=...) (the delta statements are
+    # recorder.statements[start:end]; start is None for the first application)
+    pending_pages = {}
+    t_start = time.time()
+    round_idx = 0
+
+    try:
+        while True:
+            if max_rounds is not None and round_idx >= max_rounds:
+                total_res.stop_reason = "max_rounds"
+                break
+            round_idx += 1
+            round_stats = Container(
+                round=round_idx, applied_rules=0, skipped_rules=0, truncated_rules=0, new_statements=0, apply_time=0
+            )
+            total_res.round_stats.append(round_stats)
+            stm_count_at_start = len(recorder.statements)
+
+            if parallel_matcher:
+                rule_deltas = []
+                for rule in rules:
+                    if rule.uri in pending_pages:
+                        # the application continues after the last processed match (no precomputation)
+                        continue
+                    if (last_pos := last_positions.get(rule.uri)) is None:
+                        rule_deltas.append((rule, None))
+                    elif delta_stms := recorder.get_statements(start=last_pos):
+                        rule_deltas.append((rule, delta_stms))
+                parallel_matcher.precompute(rule_deltas)
+
+            for rule in rules:
+                if time_budget is not None and time.time() - t_start > time_budget:
+                    total_res.stop_reason = "time_budget"
+                    break
+
+                pos = len(recorder.statements)
+                match_cursors = None
+                if (page := pending_pages.pop(rule.uri, None)) is not None:
+                    # continue the truncated application (same delta statements, after the last processed match)
+                    last_pos, pos, match_cursors = page.start, page.end, page.match_cursors
+                    delta_stms = None if last_pos is None else recorder.get_statements(start=last_pos, end=pos)
+                elif (last_pos := last_positions.get(rule.uri)) is None:
+                    delta_stms = None
+                else:
+                    delta_stms = recorder.get_statements(start=last_pos)
+                    if not delta_stms:
+                        round_stats.skipped_rules += 1
+                        continue
+
+                precomputed_matches = parallel_matcher.pop(rule) if parallel_matcher else None
+                res = apply_semantic_rule(
+                    rule,
+                    mod_context_uri,
+                    delta_stms=delta_stms,
+                    precomputed_matches=precomputed_matches,
+                    match_limit=match_limit,
+                    match_cursors=match_cursors,
+                )
+                total_res.add_partial(res)
+                if res.match_limit_reached:
+                    # not all matches have been processed -> continue with the same delta statements next time
+                    pending_pages[rule.uri] = Container(
+                        start=last_pos, end=pos, match_cursors=res.creator_object.match_cursors
+                    )
+                    round_stats.truncated_rules += 1
+                else:
+                    last_positions[rule.uri] = pos
+                round_stats.applied_rules += 1
+                round_stats.apply_time += res.apply_time
+                if res.exception:
+                    total_res.stop_reason = "exception"
+                    break
+
+            # this also counts statements which are not reported by the rule results (e.g. from consequent functions)
+            round_stats.new_statements = len(recorder.statements) - stm_count_at_start
+            if total_res.stop_reason is not None:
+                break
+            if len(recorder.statements) == stm_count_at_start and not pending_pages:
+                total_res.stop_reason = "fixpoint"
+                break
+    finally:
+        core.ds.remove_change_listener(recorder)
+
+    return total_res
+
+
+class StatementRecorder:
+    """
+    Change listener for the data store which records all new statements (see apply_rules_until_fixpoint)
+    """
+
+    def __init__(self):
+        self.statements = []
+
+        # number of changes which might remove matches (used by ParallelRuleMatcher)
+        self.removed_count = 0
+
+    def statement_changed(self, stm: core.Statement, added: bool) -> None:
+        # qualifier statements are irrelevant for the reasoning graph
+        if not isinstance(stm.subject, core.Entity):
+            return
+        if added:
+            self.statements.append(stm)
+            if stm.predicate.uri == R20_URI:
+                # the subject is removed from the reasoning graph
+                self.removed_count += 1
+        elif is_node_for_simple_graph(stm.subject):
+            self.removed_count += 1
+
+    def entity_changed(self, entity: core.Entity, added: bool) -> None:
+        # new entities can only be matched via new statements -> nothing to do here
+        if not added:
+            self.removed_count += 1
+
+    def get_statements(self, start: int = 0, end: int = None) -> List[core.Statement]:
+        return [stm for stm in self.statements[start:end] if not stm.unlinked]
+
+
+def get_rule_relations(rule: core.Item) -> Container:
+    """
+    Determine which relations a rule reads (in its premise) and writes (in its assertion).
+
+    :returns:   Container(read_uris=..., written_uris=...); the values are sets of relation uris or None (which means:
+                any relation, e.g. for SPARQL premises or consequent functions)
+
+    Condition functions are assumed to only read the relations which are passed to them as arguments.
+    """
+    res = Container(read_uris=set(), written_uris=set())
+    if is_algorithmic_rule(rule):
+        res.read_uris = res.written_uris = None
+        return res
+    try:
+        ra = RuleApplicator(rule)
+    except Exception:
+        # the exception will be raised again when the rule is applied
+        res.read_uris = res.written_uris = None
+        return res
+
+    if ra.premise_type != PremiseType.GRAPH:
+        res.read_uris = None
+
+    for ra_worker in ra.ra_workers:
+        if res.read_uris is not None:
+            res.read_uris = _get_read_relation_uris(ra_worker, res.read_uris)
+
+        if res.written_uris is not None:
+            if ra_worker.get_function_tables()["consequent"][0]:
+                # consequent functions might create arbitrary statements
+                res.written_uris = None
+                continue
+            for cntnr in ra_worker.asserted_relation_templates:
+                if not isinstance(cntnr.predicate, core.Relation):
+                    # proxy item (the relation is determined by the match)
+                    res.written_uris = None
+                    break
+                res.written_uris.add(cntnr.predicate.uri)
+    return res
+
+
+def _get_read_relation_uris(ra_worker: "RuleApplicatorWorker", read_uris: set) -> Optional[set]:
+    if ra_worker.subjectivized_predicates.a:
+        return None
+    for _, node_data in ra_worker.P.nodes(data=True):
+        if node_data.get("rel_statements") is not None:
+            # relation node with specific properties
+            return None
+    for _, _, rel_uri in ra_worker.P.edges(data="rel_uri"):
+        if rel_uri == wildcard_relation_uri:
+            return None
+        read_uris.add(rel_uri)
+
+    _, cond_func_arg_nodes = ra_worker.get_function_tables()["condition"]
+    for node_tuple in cond_func_arg_nodes:
+        for node in node_tuple:
+            uri = ra_worker.extended_local_nodes.b.get(node)
+            if isinstance(core.ds.get_entity_by_uri(uri, strict=False), core.Relation):
+                read_uris.add(uri)
+    return read_uris
+
+
+def create_rule_dependency_graph(rules: List[core.Item]) -> nx.DiGraph:
+    """
+    Create a directed graph whose nodes are the uris of the rules. An edge (uri1, uri2) means: rule1 writes a
+    relation which rule2 reads (see get_rule_relations). The node attribute "relations" holds the result of
+    get_rule_relations.
+    """
+    graph = nx.DiGraph()
+    for rule in rules:
+        graph.add_node(rule.uri, rule=rule, relations=get_rule_relations(rule))
+
+    for producer_uri, producer_data in graph.nodes(data=True):
+        written_uris = producer_data["relations"].written_uris
+        for consumer_uri, consumer_data in graph.nodes(data=True):
+            read_uris = consumer_data["relations"].read_uris
+            if written_uris is None or read_uris is None or not written_uris.isdisjoint(read_uris):
+                graph.add_edge(producer_uri, consumer_uri)
+    return graph
+
+
+class RuleScheduler:
+    """
+    Change driven application of a set of rules: a rule is only applied again if statements of the relations which
+    it reads (see get_rule_relations) were created or removed since its previous application. The rules are ordered
+    by their dependency graph (see create_rule_dependency_graph) such that producers are applied before consumers.
+    Rules of the same strongly connected component (stratum) keep their original order.
+
+    The scheduler is a change listener of the data store. Use `.close()` (or a with-statement) to unregister it.
+    """
+
+    def __init__(self, rules: List[core.Item], mod_context_uri: str = None):
+        self.rules = list(rules)
+        self.mod_context_uri = mod_context_uri
+        self.dependency_graph = create_rule_dependency_graph(self.rules)
+
+        # list of lists of rules (in the order of application)
+        self.strata: List[List[core.Item]] = self._get_strata()
+
+        # counter of relevant changes of the data store (serves as time stamp)
+        self.version = 0
+
+        # {rel_uri1: <version of last change>, ...}
+        self.last_changes: Dict[str, int] = {}
+
+        # version of the last change which might affect every rule (removed entity)
+        self.last_global_change = 0
+
+        # {rule_uri1: <version at the beginning of the last application>, ...}
+        self.last_runs: Dict[str, int] = {}
+
+        self.new_statement_count = 0
+        core.ds.add_change_listener(self)
+
+    def _get_strata(self) -> List[List[core.Item]]:
+        rule_indices = {rule.uri: i for i, rule in enumerate(self.rules)}
+        condensed_graph = nx.condensation(self.dependency_graph)
+
+        def get_min_index(scc_idx):
+            return min(rule_indices[uri] for uri in condensed_graph.nodes[scc_idx]["members"])
+
+        strata = []
+        for scc_idx in nx.lexicographical_topological_sort(condensed_graph, key=get_min_index):
+            uris = sorted(condensed_graph.nodes[scc_idx]["members"], key=rule_indices.get)
+            strata.append([self.dependency_graph.nodes[uri]["rule"] for uri in uris])
+        return strata
+
+    def statement_changed(self, stm: core.Statement, added: bool) -> None:
+        if not isinstance(stm.subject, core.Entity):
+            # qualifier statement
+            return
+        self.version += 1
+        self.last_changes[stm.predicate.uri] = self.version
+        if added:
+            self.new_statement_count += 1
+
+    def entity_changed(self, entity: core.Entity, added: bool) -> None:
+        # new entities can only be matched via new statements
+        if not added:
+            self.version += 1
+            self.last_global_change = self.version
+
+    def close(self) -> None:
+        core.ds.remove_change_listener(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def is_touched(self, rule: core.Item) -> bool:
+        """
+        Return True if the rule has to be applied (again)
+        """
+        last_run = self.last_runs.get(rule.uri)
+        if last_run is None or self.last_global_change > last_run:
+            return True
+        read_uris = self.dependency_graph.nodes[rule.uri]["relations"].read_uris
+        if read_uris is None:
+            return self.version > last_run
+        return any(self.last_changes.get(uri, 0) > last_run for uri in read_uris)
+
+    def apply(self, max_passes: int = 1) -> "ReportingMultiRuleResult":
+        """
+        Apply the touched rules (all rules in the first pass) stratum by stratum.
+
+        :param max_passes:  maximum number of passes over all strata (None means: until no rule is touched anymore)
+
+        :returns:           ReportingMultiRuleResult; per-pass statistics are stored in `.round_stats` and the reason
+                            for stopping in `.stop_reason` ("fixpoint", "max_rounds", "exception")
+        """
+        total_res = ReportingMultiRuleResult(rule_list=self.rules)
+        pass_idx = 0
+        while True:
+            if not any(self.is_touched(rule) for rule in self.rules):
+                total_res.stop_reason = "fixpoint"
+                break
+            if max_passes is not None and pass_idx >= max_passes:
+                total_res.stop_reason = "max_rounds"
+                break
+            pass_idx += 1
+            pass_stats = Container(round=pass_idx, applied_rules=0, skipped_rules=0, new_statements=0, apply_time=0)
+            total_res.round_stats.append(pass_stats)
+            stm_count_at_start = self.new_statement_count
+
+            for stratum in self.strata:
+                for rule in stratum:
+                    if not self.is_touched(rule):
+                        pass_stats.skipped_rules += 1
+                        continue
+                    self.last_runs[rule.uri] = self.version
+                    res = apply_semantic_rule(rule, self.mod_context_uri)
+                    total_res.add_partial(res)
+                    pass_stats.applied_rules += 1
+                    pass_stats.apply_time += res.apply_time
+                    if res.exception:
+                        total_res.stop_reason = "exception"
+                        break
+                if total_res.stop_reason is not None:
+                    break
+
+            pass_stats.new_statements = self.new_statement_count - stm_count_at_start
+            if total_res.stop_reason is not None:
+                break
+
+        return total_res
+
+
+class IncrementalRuleNetwork:
+    """
+    Opt-in network which keeps the consequences of rules up to date while statements are added or removed (TREAT
+    style: the indices of the data store serve as alpha memories; the network stores the fired matches of every rule
+    and the changes which were not processed yet).
+
+    The network is a change listener of the data store. The changes are collected while the data store reports them
+    and processed by `.run()` as soon as the change has been completed (see `.changes_completed` and
+    DataStore.mutation; the result of the last automatic run is stored in `.last_result`). Thus, the consequences are
+    up to date after every change of the data store (e.g. after every call of `set_relation` or `unlink`). Use
+    `.pause()` to collect many changes (e.g. while loading a module) and `.resume()` to process them at once. Only the
+    matches which involve changed entities and which have not fired before are processed (see
+    apply_rules_until_fixpoint for the underlying assumptions). The first run considers all matches.
+
+    Removing a statement forgets the fired matches which contain its subject (such that they can fire again if they
+    are re-established); the consequences of the match are not retracted.
+    """
+
+    def __init__(
+        self,
+        rules: List[core.Item] = None,
+        mod_context_uri: str = None,
+        max_pending_changes: int = 10000,
+        max_fired_matches: int = 100000,
+    ):
+        """
+        :param rules:               sequence of rules (default: all rules); rules without graph premise are ignored
+                                    (see `.ignored_rules`)
+        :param mod_context_uri:     see apply_semantic_rule
+        :param max_pending_changes: if more changes are pending, the next run considers all matches (instead of
+                                    storing every changed statement)
+        :param max_fired_matches:   maximum number of fired matches which are stored per rule; if there are more, the
+                                    oldest are forgotten (they might fire again; for asserted statements this is
+                                    harmless if they use R59__has_rule_prototype_graph_mode=5)
+        """
+        if rules is None:
+            rules = get_all_rules()
+        self.mod_context_uri = mod_context_uri
+        self.max_pending_changes = max_pending_changes
+        self.max_fired_matches = max_fired_matches
+
+        self.rules = []
+        self.ignored_rules = []
+
+        # {rule_uri1: <set of read relation uris or None>, ...}
+        self.read_uris: Dict[str, Optional[set]] = {}
+        for rule in rules:
+            if is_algorithmic_rule(rule) or RuleApplicator(rule).premise_type != PremiseType.GRAPH:
+                self.ignored_rules.append(rule)
+                continue
+            self.rules.append(rule)
+            self.read_uris[rule.uri] = get_rule_relations(rule).read_uris
+
+        # {rule_uri1: {<match key>: None, ...}, ...} (the dicts are used as ordered sets)
+        self.fired_matches: Dict[str, Dict[tuple, None]] = {rule.uri: {} for rule in self.rules}
+
+        # {rule_uri1: {<uri or literal value>: {<match key>, ...}, ...}, ...}
+        self.fired_match_index: Dict[str, Dict[object, set]] = {rule.uri: defaultdict(set) for rule in self.rules}
+
+        # {rule_uri1: [stm1, ...], ...}
+        self.pending_changes: Dict[str, List[core.Statement]] = defaultdict(list)
+        self.pending_change_count = 0
+
+        # the first run considers all matches
+        self.match_all = True
+
+        self.paused = False
+        self.running = False
+
+        # result of the last run which was triggered by a change of the data store (see .changes_completed)
+        self.last_result: Optional["ReportingMultiRuleResult"] = None
+        core.ds.add_change_listener(self)
+
+    def statement_changed(self, stm: core.Statement, added: bool) -> None:
+        if not isinstance(stm.subject, core.Entity) or not is_node_for_simple_graph(stm.subject):
+            # qualifier statement or statement inside a scope
+            return
+        for rule in self.rules:
+            read_uris = self.read_uris[rule.uri]
+            if read_uris is not None and stm.predicate.uri not in read_uris:
+                continue
+            if added:
+                self._add_pending_change(rule, stm)
+            else:
+                self._forget_matches(rule, stm.subject.uri)
+
+    def entity_changed(self, entity: core.Entity, added: bool) -> None:
+        # new entities can only be matched via new statements
+        if not added:
+            for rule in self.rules:
+                self._forget_matches(rule, entity.uri)
+
+    def changes_completed(self) -> None:
+        """
+        Called by the data store after a change has been completed (the indexes are up to date): process the
+        collected changes (unless the network is paused or the change was caused by the current run)
+        """
+        if self.paused or self.running or not (self.match_all or self.pending_changes):
+            return
+        self.last_result = self.run()
+
+    def _add_pending_change(self, rule: core.Item, stm: core.Statement) -> None:
+        if self.match_all:
+            return
+        self.pending_changes[rule.uri].append(stm)
+        self.pending_change_count += 1
+        if self.pending_change_count > self.max_pending_changes:
+            # considering all matches is cheaper than storing the changes
+            self.match_all = True
+            self.pending_changes.clear()
+            self.pending_change_count = 0
+
+    def _forget_matches(self, rule: core.Item, uri: str) -> None:
+        for key in list(self.fired_match_index[rule.uri].get(uri, ())):
+            self._drop_fired_match(rule.uri, key)
+
+    def _drop_fired_match(self, rule_uri: str, key: tuple) -> None:
+        self.fired_matches[rule_uri].pop(key)
+        index = self.fired_match_index[rule_uri]
+        for _, node_value in key[1]:
+            keys = index[node_value]
+            keys.discard(key)
+            if not keys:
+                index.pop(node_value)
+
+    def _match_filter(self, ra_worker: "RuleApplicatorWorker", result_map: dict) -> bool:
+        """
+        Return True if the match has not fired before (and store it)
+        """
+        rule_uri = ra_worker.rule.uri
+        fired_matches = self.fired_matches[rule_uri]
+        node_values = frozenset((node, getattr(value, "uri", value)) for node, value in result_map.items())
+        key = (ra_worker.parent.ra_workers.index(ra_worker), node_values)
+        if key in fired_matches:
+            return False
+
+        fired_matches[key] = None
+        index = self.fired_match_index[rule_uri]
+        for _, node_value in node_values:
+            index[node_value].add(key)
+        if len(fired_matches) > self.max_fired_matches:
+            # forget the oldest match
+            self._drop_fired_match(rule_uri, next(iter(fired_matches)))
+        return True
+
+    def pause(self) -> None:
+        """
+        Stop processing the changes (they are still collected)
+        """
+        self.paused = True
+
+    def resume(self, run: bool = True) -> Optional["ReportingMultiRuleResult"]:
+        """
+        Continue processing the changes (and process the collected ones if `run` is True)
+        """
+        self.paused = False
+        if run:
+            return self.run()
+        return None
+
+    def close(self) -> None:
+        core.ds.remove_change_listener(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def run(self, max_rounds: int = None) -> "ReportingMultiRuleResult":
+        """
+        Process the collected changes (including the changes caused by the fired rules).
+
+        :param max_rounds:  maximum number of rounds over all rules (None means: until no changes are pending)
+
+        :returns:           ReportingMultiRuleResult (with `.round_stats` and `.stop_reason` like
+                            apply_rules_until_fixpoint; `.stop_reason` is "paused" if the network is paused)
+        """
+        total_res = ReportingMultiRuleResult(rule_list=self.rules)
+        if self.paused or self.running:
+            # runs are not nested (the changes of the current run are processed by itself)
+            total_res.stop_reason = "paused" if self.paused else "running"
+            return total_res
+
+        self.running = True
+        round_idx = 0
+        try:
+            while True:
+                if not (self.match_all or self.pending_changes):
+                    total_res.stop_reason = "fixpoint"
+                    break
+                if max_rounds is not None and round_idx >= max_rounds:
+                    total_res.stop_reason = "max_rounds"
+                    break
+                round_idx += 1
+                round_stats = Container(
+                    round=round_idx, applied_rules=0, skipped_rules=0, new_statements=0, apply_time=0
+                )
+                total_res.round_stats.append(round_stats)
+                stm_count_at_start = len(total_res.new_statements)
+
+                match_all = self.match_all
+                self.match_all = False
+                for rule in self.rules:
+                    delta_stms = None
+                    if not match_all:
+                        changes = self.pending_changes.pop(rule.uri, None)
+                        delta_stms = [stm for stm in changes or () if not stm.unlinked]
+                        self.pending_change_count -= len(changes or ())
+                        if not delta_stms:
+                            round_stats.skipped_rules += 1
+                            continue
+                    res = apply_semantic_rule(
+                        rule, self.mod_context_uri, delta_stms=delta_stms, match_filter=self._match_filter
+                    )
+                    total_res.add_partial(res)
+                    round_stats.applied_rules += 1
+                    round_stats.apply_time += res.apply_time
+                    if res.exception:
+                        total_res.stop_reason = "exception"
+                        break
+
+                round_stats.new_statements = len(total_res.new_statements) - stm_count_at_start
+                if total_res.stop_reason is not None:
+                    break
+        finally:
+            self.running = False
+
+        return total_res
+
+
+class BackwardChainer:
+    """
+    Goal directed evaluation of rules (backward chaining): decide whether a statement follows from the data store and
+    the rules without applying the rules (the data store is not modified). This is useful if only a few statements
+    are of interest, e.g. "is x an instance of y after closure".
+
+    The goal is unified with the assertion templates of the compiled rules (see RuleApplicatorWorker). The edges of
+    the prototype graph of a matching rule are then resolved as subgoals (existing statements or consequences of other
+    rules). Subgoals are tabled: every subgoal is evaluated once per query and recursive subgoals are evaluated until
+    their answers do not change anymore. This terminates because no new entities are created.
+
+    Limitations: only rules with graph premise are used. Assertions which involve new entities (fiat items) and
+    workers with subjectivized predicates, wildcard relations or relation nodes with specific properties are ignored.
+    Condition functions are evaluated on the data store (not on the derived statements).
+
+    The compiled rules are stored in the instance. Create a new instance after rules have been changed.
+    """
+
+    def __init__(self, rules: List[core.Item] = None):
+        """
+        :param rules:   sequence of rules (default: all rules); rules without usable assertion are ignored
+                        (see `.ignored_rules`)
+        """
+        if rules is None:
+            rules = get_all_rules()
+
+        self.rules = []
+        self.ignored_rules = []
+
+        # {rel_uri1: [Container(ra_worker=..., template=..., ...), ...], ...}
+        self.rule_heads: Dict[str, List[Container]] = defaultdict(list)
+
+        for rule in rules:
+            heads = []
+            if not is_algorithmic_rule(rule):
+                ra = RuleApplicator(rule)
+                if ra.premise_type == PremiseType.GRAPH:
+                    heads = self._get_rule_heads(ra)
+            if not heads:
+                self.ignored_rules.append(rule)
+                continue
+            self.rules.append(rule)
+            for head in heads:
+                self.rule_heads[head.template.predicate.uri].append(head)
+
+        self._reset_tables()
+
+    def _get_rule_heads(self, ra: "RuleApplicator") -> List[Container]:
+        heads = []
+        for ra_worker in ra.ra_workers:
+            if not self._is_supported_worker(ra_worker):
+                continue
+            fixed_values = {
+                node: ra_worker._get_by_uri(uri) for node, uri in ra_worker._get_fixed_nodes().items()
+            }
+            for template in ra_worker.asserted_relation_templates:
+                if not isinstance(template.predicate, core.Relation):
+                    # proxy item (the relation is determined by the match)
+                    continue
+                if template.subject not in ra_worker.P:
+                    continue
+                if not isinstance(template.object, LiteralWrapper) and template.object not in ra_worker.P:
+                    # new entity or unbound variable literal
+                    continue
+                head = Container(ra_worker=ra_worker, template=template, edges=list(ra_worker.P.edges(data="rel_uri")))
+                # note: assign the dict after the construction (the Container would convert it otherwise)
+                head.fixed_values = fixed_values
+                heads.append(head)
+        return heads
+
+    @staticmethod
+    def _is_supported_worker(ra_worker: "RuleApplicatorWorker") -> bool:
+        if ra_worker.subjectivized_predicates.a:
+            return False
+        fixed_nodes = ra_worker._get_fixed_nodes()
+        for node, node_data in ra_worker.P.nodes(data=True):
+            if node_data.get("rel_statements") is not None:
+                return False
+            if node not in fixed_nodes and ra_worker.P.degree(node) == 0:
+                # the node could not be bound by the premise
+                return False
+        for _, _, rel_uri in ra_worker.P.edges(data="rel_uri"):
+            if rel_uri == wildcard_relation_uri:
+                return False
+        return True
+
+    def _reset_tables(self) -> None:
+        # {(subj_key, rel_uri, obj_key): {(subj_key, obj_key): <answer>, ...}, ...}; None means: unbound
+        self.tables: Dict[tuple, Dict[tuple, Container]] = {}
+        self.complete_tables = set()
+
+        # tables which depend on a table that was still evaluated when they were finished: {goal_key: stack_position}
+        self.incomplete_tables: Dict[tuple, int] = {}
+
+        # goals which are currently evaluated (and their smallest stack position they depend on)
+        self.stack: List[tuple] = []
+        self.stack_positions: Dict[tuple, int] = {}
+        self.lowlinks: Dict[tuple, int] = {}
+
+        self.node_status_cache: Dict[str, bool] = {}
+
+    def prove(self, subject: core.Entity, relation: Union[core.Relation, str], obj) -> Container:
+        """
+        Decide whether the statement (subject, relation, obj) exists or follows from the rules.
+
+        :param subject:     entity
+        :param relation:    relation or uri of a relation
+        :param obj:         entity or literal value
+
+        :returns:           Container(answer=<bool>, derivation=<derivation or None>) (see `.query`)
+        """
+        answers = self.query(subject, relation, obj)
+        res = Container(answer=bool(answers))
+        res.derivation = answers[0] if answers else None
+        return res
+
+    def query(self, subject: Optional[core.Entity], relation: Union[core.Relation, str], obj=None) -> List[Container]:
+        """
+        Find all statements (subject, relation, obj) which exist or follow from the rules. `subject` and `obj` might
+        be None (unbound).
+
+        :returns:   list of derivations; every derivation is a Container(subject=..., predicate=..., object=...) with
+                    either `.statement` (existing statement) or `.rule` and `.premises` (list of derivations)
+        """
+        rel_uri = relation.uri if isinstance(relation, core.Relation) else relation
+        self._reset_tables()
+        return self._solve(subject, rel_uri, obj)
+
+    @staticmethod
+    def _get_key(value):
+        """
+        Return a hashable key for an entity, a literal value or None
+        """
+        if isinstance(value, core.Entity):
+            return value.uri
+        if value is None:
+            return None
+        return ("literal", value)
+
+    def _solve(self, subject: Optional[core.Entity], rel_uri: str, obj) -> List[Container]:
+        key = (self._get_key(subject), rel_uri, self._get_key(obj))
+        table = self.tables.get(key)
+
+        if key in self.complete_tables:
+            return list(table.values())
+
+        if (pos := self.stack_positions.get(key)) is not None:
+            # recursive goal: use the answers found so far (the evaluation of the goal is repeated until it is stable)
+            for stack_key in self.stack[pos + 1 :]:
+                self.lowlinks[stack_key] = min(self.lowlinks[stack_key], pos)
+            return list(table.values())
+
+        if table is None:
+            table = self.tables[key] = {}
+
+        pos = len(self.stack)
+        self.stack.append(key)
+        self.stack_positions[key] = pos
+        self.lowlinks[key] = pos
+        try:
+            while True:
+                answer_count = len(table)
+                for answer in self._evaluate(subject, rel_uri, obj):
+                    table.setdefault((self._get_key(answer.subject), self._get_key(answer.object)), answer)
+                if len(table) == answer_count:
+                    break
+        finally:
+            self.stack.pop()
+            self.stack_positions.pop(key)
+            lowlink = self.lowlinks.pop(key)
+
+        dependent_keys = [k for k, stack_pos in self.incomplete_tables.items() if stack_pos >= pos]
+        if lowlink >= pos:
+            # the goal does not depend on an unfinished goal -> its answers (and those of its dependents) are final
+            self.complete_tables.add(key)
+            for k in dependent_keys:
+                self.incomplete_tables.pop(k)
+                self.complete_tables.add(k)
+        else:
+            self.incomplete_tables[key] = lowlink
+            for k in dependent_keys:
+                self.incomplete_tables[k] = lowlink
+
+        return list(table.values())
+
+    def _evaluate(self, subject: Optional[core.Entity], rel_uri: str, obj) -> Iterator[Container]:
+        for stm in self._get_statements(subject, rel_uri, obj):
+            subj, pred, stm_obj = stm.relation_tuple
+            yield Container(subject=subj, predicate=pred, object=stm_obj, statement=stm)
+
+        for head in self.rule_heads.get(rel_uri, ()):
+            yield from self._evaluate_rule_head(head, subject, obj)
+
+    def _get_statements(self, subject: Optional[core.Entity], rel_uri: str, obj) -> Iterator[core.Statement]:
+        """
+        Yield the existing statements which match the goal (and which are part of the reasoning graph)
+        """
+        if subject is not None:
+            if not isinstance(subject, core.Entity):
+                return
+            stms = core.ds.statements.get(subject.uri, {}).get(rel_uri, ())
+        elif isinstance(obj, core.Entity):
+            stms = core.ds.inv_statements.get(obj.uri, {}).get(rel_uri, ())
+        else:
+            stms = core.ds.relation_statements.get(rel_uri, ())
+
+        obj_key = self._get_key(obj)
+        for stm in stms:
+            subj, _, stm_obj = stm.relation_tuple
+            if stm.unlinked or not isinstance(subj, core.Entity):
+                # qualifier statement
+                continue
+            if subject is not None and subj.uri != subject.uri:
+                continue
+            if obj is not None and self._get_key(stm_obj) != obj_key:
+                continue
+            if not self._is_graph_node(subj):
+                continue
+            if isinstance(stm_obj, core.Entity) and not self._is_graph_node(stm_obj):
+                continue
+            yield stm
+
+    def _is_graph_node(self, entity: core.Entity) -> bool:
+        res = self.node_status_cache.get(entity.uri)
+        if res is None:
+            res = self.node_status_cache[entity.uri] = is_node_for_simple_graph(entity)
+        return res
+
+    def _is_valid_value(self, ra_worker: "RuleApplicatorWorker", node, value) -> bool:
+        """
+        Check whether `value` might be bound to the (variable) P-node (see RuleApplicatorWorker._node_matcher)
+        """
+        if isinstance(value, core.Entity):
+            return not ra_worker.P.nodes[node].get("is_variable_literal") and self._is_graph_node(value)
+        return bool(ra_worker.P.nodes[node].get("is_variable_literal"))
+
+    def _bind(self, ra_worker: "RuleApplicatorWorker", node, value, bindings: dict, used: dict) -> Optional[list]:
+        """
+        Bind `value` to `node` (if it is not bound yet).
+
+        :returns:   list of newly bound nodes or None (if the binding is not possible)
+        """
+        value_key = self._get_key(value)
+        if node in bindings:
+            return [] if self._get_key(bindings[node]) == value_key else None
+        if value_key in used or not self._is_valid_value(ra_worker, node, value):
+            # different nodes have to be bound to different values (monomorphism)
+            return None
+        bindings[node] = value
+        used[value_key] = node
+        return [node]
+
+    def _unbind(self, nodes: list, bindings: dict, used: dict) -> None:
+        for node in nodes:
+            used.pop(self._get_key(bindings.pop(node)))
+
+    def _evaluate_rule_head(self, head: Container, subject: Optional[core.Entity], obj) -> Iterator[Container]:
+        ra_worker, template = head.ra_worker, head.template
+        bindings = dict(head.fixed_values)
+        used = {self._get_key(value): node for node, value in bindings.items()}
+
+        if subject is not None and self._bind(ra_worker, template.subject, subject, bindings, used) is None:
+            return
+        if isinstance(template.object, LiteralWrapper):
+            if obj is not None and self._get_key(obj) != self._get_key(template.object.value):
+                return
+        elif obj is not None and self._bind(ra_worker, template.object, obj, bindings, used) is None:
+            return
+
+        condition_funcs, condition_arg_nodes = ra_worker.get_function_tables()["condition"]
+        for premises in self._solve_edges(head, head.edges, bindings, used, []):
+            if not self._check_conditions(ra_worker, condition_funcs, condition_arg_nodes, bindings):
+                continue
+            if isinstance(template.object, LiteralWrapper):
+                answer_obj = template.object.value
+            else:
+                answer_obj = bindings[template.object]
+            answer = Container(
+                subject=bindings[template.subject], predicate=template.predicate, object=answer_obj, rule=ra_worker.rule
+            )
+            answer.premises = premises
+            yield answer
+
+    def _solve_edges(
+        self, head: Container, edges: List[tuple], bindings: dict, used: dict, premises: List[Container]
+    ) -> Iterator[List[Container]]:
+        """
+        Yield the lists of derivations of the edges (one for every combination of bindings)
+        """
+        if not edges:
+            yield list(premises)
+            return
+
+        # prefer edges with bound nodes (to reduce the number of answers of the subgoal)
+        def get_score(edge):
+            return (edge[0] in bindings) + (edge[1] in bindings), edge[0] in bindings
+
+        idx = max(range(len(edges)), key=lambda i: get_score(edges[i]))
+        n1, n2, rel_uri = edges[idx]
+        remaining_edges = edges[:idx] + edges[idx + 1 :]
+
+        for answer in self._solve(bindings.get(n1), rel_uri, bindings.get(n2)):
+            new_nodes1 = self._bind(head.ra_worker, n1, answer.subject, bindings, used)
+            if new_nodes1 is None:
+                continue
+            new_nodes2 = self._bind(head.ra_worker, n2, answer.object, bindings, used)
+            if new_nodes2 is not None:
+                premises.append(answer)
+                yield from self._solve_edges(head, remaining_edges, bindings, used, premises)
+                premises.pop()
+                self._unbind(new_nodes2, bindings, used)
+            self._unbind(new_nodes1, bindings, used)
+
+    @staticmethod
+    def _check_conditions(
+        ra_worker: "RuleApplicatorWorker", condition_funcs: list, condition_arg_nodes: list, bindings: dict
+    ) -> bool:
+        for condition_func, node_tuple in zip(condition_funcs, condition_arg_nodes):
+            args = [
+                bindings[node] if node in bindings else ra_worker._resolve_local_node(node=node)
+                for node in node_tuple
+            ]
+            if not condition_func(*args):
+                return False
+        return True
+
+    def get_derivation_text(self, derivation: Container, indent: int = 0) -> str:
+        """
+        Return a human readable (multi line) representation of a derivation (see `.query`)
+        """
+        line = f"{' ' * indent}({derivation.subject}, {derivation.predicate}, {derivation.object})"
+        if derivation.statement:
+            return f"{line}  # statement {derivation.statement.short_key}"
+        lines = [f"{line}  # rule {derivation.rule}"]
+        for premise in derivation.premises:
+            lines.append(self.get_derivation_text(premise, indent + 4))
+        return "\n".join(lines)
+
+
+class ParallelRuleMatcher:
+    """
+    Search the matches of several rules in worker processes (opt-in, see `processes` argument of
+    apply_rules_until_fixpoint and apply_semantic_rules).
+
+    The worker processes are forked, i.e. they search in a read-only snapshot of the reasoning graph. Only the matching
+    phase runs in parallel: the parent process applies the rules serially (in the usual order) and passes the
+    precomputed matches to the RuleApplicatorWorkers. Matches which involve statements that were created after the
+    snapshot (by previous rules) are added by a delta search (see RuleApplicatorWorker._get_precomputed_raw_matches).
+    If matches might have been removed since the snapshot (unlinked statements or entities) the precomputed matches
+    are discarded. Thus, the results are the same as those of the serial application.
+    """
+
+    def __init__(self, processes: int, recorder: StatementRecorder):
+        """
+        :param processes:   maximum number of worker processes
+        :param recorder:    StatementRecorder which is registered as change listener during the application
+        """
+        self.processes = processes
+        self.recorder = recorder
+
+        # {rule_uri: Container(position=..., removed_count=..., raw_maps=[...]), ...} (one entry in raw_maps per
+        # RuleApplicatorWorker; None if the matches have to be searched in the parent process)
+        self.snapshots: Dict[str, Container] = {}
+
+    @staticmethod
+    def is_available() -> bool:
+        # the workers rely on the memory of the parent process
+        return "fork" in multiprocessing.get_all_start_methods()
+
+    def precompute(self, rule_deltas: List[Tuple[core.Item, Optional[List[core.Statement]]]]) -> None:
+        """
+        Search the matches of all graph-premise rules in worker processes.
+
+        :param rule_deltas:     list of 2-tuples (rule, delta_stms) (see apply_semantic_rule)
+        """
+        global _parallel_match_jobs
+
+        self.snapshots.clear()
+        if not self.is_available():
+            return
+
+        jobs = []
+        for rule, delta_stms in rule_deltas:
+            if rule.uri in self.snapshots or is_algorithmic_rule(rule) or RuleApplicatorWorker.use_vf2_matcher:
+                continue
+            try:
+                ra = RuleApplicator(rule, delta_stms=delta_stms)
+            except Exception:
+                # the exception will be raised again when the rule is applied
+                continue
+            if ra.premise_type != PremiseType.GRAPH:
+                continue
+            self.snapshots[rule.uri] = Container(
+                position=len(self.recorder.statements),
+                removed_count=self.recorder.removed_count,
+                raw_maps=[None] * len(ra.ra_workers),
+            )
+            jobs.extend((rule.uri, idx, ra_worker) for idx, ra_worker in enumerate(ra.ra_workers))
+
+        if len(jobs) < 2:
+            # nothing to parallelize
+            self.snapshots.clear()
+            return
+
+        _parallel_match_jobs = [ra_worker for _, _, ra_worker in jobs]
+        try:
+            with multiprocessing.get_context("fork").Pool(min(self.processes, len(jobs))) as pool:
+                results = pool.map(_run_parallel_match_job, range(len(jobs)), chunksize=1)
+        finally:
+            _parallel_match_jobs = []
+
+        for (rule_uri, idx, _), raw_maps in zip(jobs, results):
+            self.snapshots[rule_uri].raw_maps[idx] = raw_maps
+
+    def pop(self, rule: core.Item) -> Optional[List[Optional[Container]]]:
+        """
+        Return the precomputed matches for the rule (one Container per RuleApplicatorWorker) or None if there are
+        none (or if they are outdated)
+        """
+        snapshot = self.snapshots.pop(rule.uri, None)
+        if snapshot is None or snapshot.removed_count != self.recorder.removed_count:
+            return None
+
+        extra_delta_stms = self.recorder.get_statements(start=snapshot.position)
+        res = []
+        for raw_maps in snapshot.raw_maps:
+            if raw_maps is None:
+                res.append(None)
+                continue
+            c = Container(extra_delta_stms=extra_delta_stms)
+            # assign separately (the constructor of Container would convert all the dicts)
+            c.raw_maps = raw_maps
+            res.append(c)
+        return res
+
+
+# RuleApplicatorWorkers which are inherited by the forked worker processes (see ParallelRuleMatcher.precompute)
+_parallel_match_jobs: List["RuleApplicatorWorker"] = []
+
+
+def _run_parallel_match_job(job_idx: int) -> Optional[List[dict]]:
+    """
+    Executed in a worker process: search the matches of one RuleApplicatorWorker (None means: search again in the
+    parent process)
+    """
+    ra_worker = _parallel_match_jobs[job_idx]
+    try:
+        raw_maps, limit_reached = ra_worker.find_raw_matches(ra_worker.parent.delta_stms, ra_worker.parent.match_limit)
+    except Exception:
+        # the exception will be raised again when the rule is applied in the parent process
+        return None
+    if limit_reached:
+        # the parent process has to find out whether the limit is reached after adding the delta matches
+        return None
+    return raw_maps
+
+
+def apply_semantic_rule(
+    rule: core.Item,
+    mod_context_uri: str = None,
+    delta_stms: List[core.Statement] = None,
+    precomputed_matches: List[Optional[Container]] = None,
+    match_limit: int = None,
+    match_cursors: List[Optional[tuple]] = None,
+    match_filter: callable = None,
+) -> List[core.Statement]:
+    """
+    Create a RuleApplicator instance for the rules, execute its apply-method, return the result (list of new statements)
+
+    :param delta_stms:          optional list of statements; if passed, only matches which involve at least one of
+                                these statements are processed (see apply_rules_until_fixpoint)
+    :param precomputed_matches: optional list of matches from worker processes (see ParallelRuleMatcher.pop)
+    :param match_limit:         optional maximum number of matches which are processed per RuleApplicatorWorker
+                                (default: RuleApplicatorWorker.max_subgraph_monomorphisms); if it is reached,
+                                `.match_limit_reached` of the result is True
+    :param match_cursors:       optional list of match keys (see RuleApplicator.match_cursors); if passed, only the
+                                matches after these keys are processed
+    :param match_filter:        optional callable (RuleApplicatorWorker, result map) -> bool; it is called for every
+                                match which fulfills the condition functions; the consequences of the match are only
+                                applied if it returns True (see IncrementalRuleNetwork)
+    """
+    assert bi.is_instance_of(rule, bi.I41["semantic rule"])
+
+    if VERBOSITY:
+        print("applying", rule)
+    ra = RuleApplicator(
+        rule,
+        mod_context_uri=mod_context_uri,
+        delta_stms=delta_stms,
+        precomputed_matches=precomputed_matches,
+        match_limit=match_limit,
+        match_cursors=match_cursors,
+        match_filter=match_filter,
+    )
+    try:
+        t0 = time.time()
+        raw_res: core.RuleResult = ra.apply()
+        res = ReportingRuleResult.get_new_instance(raw_res)
+        res.match_limit_reached = ra.match_limit_reached
+    except core.aux.RuleTermination as ex:
+        res = ReportingRuleResult(raworker=None)
+        res._rule = rule
+        res.exception = ex
+        res.apply_time = time.time() - t0
+
+    if VERBOSITY:
+        print("  ", res, "\n")
+    return res
+
+
+def get_all_rules():
+    rule_instances: list = bi.I41["semantic rule"].get_inv_relations("R4__is_instance_of", return_subj=True)
+
+    return rule_instances
+
+
+def filter_relevant_stms(re_list: List[core.Statement], return_items=True) -> List[core.Statement]:
+    """
+    From a list of Statement instances select only those which are qualifiers and whose subject is an
+    RE with .role == SUBJECT.
+    In other words: omit those instances which are created as dual relation edges
+
+    :param re_list:
+    :return:
+    """
+
+    res_statements = []
+    res_items = []
+
+    for stm in re_list:
+        assert isinstance(stm, core.Statement)
+        if isinstance(stm.subject, core.Statement) and stm.subject.role == core.RelationRole.SUBJECT:
+            res_statements.append(stm.subject)
+        elif isinstance(stm.subject, core.Item):
+            res_items.append(stm.subject)
+
+    if return_items:
+        return res_statements, res_items
+    else:
+        return res_statements
+
+
+class PremiseType(Enum):
+    GRAPH = 0
+    SPARQL = 1
+    AGGREGATION = 2
+
+
+class LiteralWrapper:
+    def __init__(self, value):
+        self.value = value
+
+
+class RelationStatistics:
+    """
+    Cardinality statistics of the edges of the reasoning graph (used to order the joins of a premise, see
+    PrototypeMatcher.compile_plan). The statistics are updated together with the graph.
+    """
+
+    def __init__(self):
+        # {rel_uri1: Counter({subj_uri1: <number of edges>, ...}), ...}
+        self.subject_counts: Dict[str, Counter] = defaultdict(Counter)
+        # {rel_uri1: Counter({obj_uri1: <number of edges>, ...}), ...} (this includes literal nodes)
+        self.object_counts: Dict[str, Counter] = defaultdict(Counter)
+        # {rel_uri1: <number of edges>, ...}
+        self.statement_counts = Counter()
+
+        # number of edges (in and out) for every node
+        self.node_degrees = Counter()
+        self.total_statement_count = 0
+
+    def add(self, rel_uri: str, subj_uri: str, obj_uri: str) -> None:
+        self.subject_counts[rel_uri][subj_uri] += 1
+        self.object_counts[rel_uri][obj_uri] += 1
+        self.statement_counts[rel_uri] += 1
+        self.node_degrees[subj_uri] += 1
+        self.node_degrees[obj_uri] += 1
+        self.total_statement_count += 1
+
+    def remove(self, rel_uri: str, subj_uri: str, obj_uri: str) -> None:
+        _decrement(self.subject_counts[rel_uri], subj_uri)
+        _decrement(self.object_counts[rel_uri], obj_uri)
+        _decrement(self.statement_counts, rel_uri)
+        _decrement(self.node_degrees, subj_uri)
+        _decrement(self.node_degrees, obj_uri)
+        self.total_statement_count -= 1
+
+    def get_statement_count(self, rel_uri: str) -> int:
+        return self.statement_counts.get(rel_uri, 0)
+
+    def get_distinct_subject_count(self, rel_uri: str) -> int:
+        return len(self.subject_counts.get(rel_uri, ()))
+
+    def get_distinct_object_count(self, rel_uri: str) -> int:
+        return len(self.object_counts.get(rel_uri, ()))
+
+    def get_subject_fanout(self, rel_uri: str, subj_uri: str = None) -> float:
+        """
+        Return the number of objects for the given subject (or the average number of objects per subject)
+        """
+        if subj_uri is not None:
+            return self.subject_counts.get(rel_uri, {}).get(subj_uri, 0)
+        return self.get_statement_count(rel_uri) / max(1, self.get_distinct_subject_count(rel_uri))
+
+    def get_object_fanout(self, rel_uri: str, obj_uri: str = None) -> float:
+        """
+        Return the number of subjects for the given object (e.g. for a literal value) (or the average number of
+        subjects per object)
+        """
+        if obj_uri is not None:
+            return self.object_counts.get(rel_uri, {}).get(obj_uri, 0)
+        return self.get_statement_count(rel_uri) / max(1, self.get_distinct_object_count(rel_uri))
+
+    def get_node_count(self) -> int:
+        # note: nodes without edges are not counted
+        return len(self.node_degrees)
+
+    def get_average_degree(self) -> float:
+        return 2 * self.total_statement_count / max(1, len(self.node_degrees))
+
+
+def _decrement(counter: Counter, key) -> None:
+    counter[key] -= 1
+    if counter[key] <= 0:
+        counter.pop(key)
+
+
+class ReasoningGraph:
+    """
+    Simple graph (without qualifiers) of the whole knowledge base which is shared by all RuleApplicators.
+
+    The graph is built once. Afterwards, the changes of the data store (reported via `.statement_changed` and
+    `.entity_changed`) are collected and applied when the graph is requested the next time (see `.get_graph`).
+    Thus, the graph does not change during the application of a rule.
+
+    Nodes: uris (of items and relations which are not defined inside scopes, and of literal values)
+    Edges: one edge for every statement; the uri of the statement serves as key of the (multi-)edge
+    """
+
+    # if more changes are pending (relative to the size of the graph) the graph is rebuilt instead of updated
+    rebuild_factor = 1.0
+
+    def __init__(self):
+        # shared mapping between literal uris and literal values (also used for the prototype graphs)
+        self.literals = core.aux.OneToOneMapping()
+
+        self.G: nx.MultiDiGraph = None
+        self.statistics: RelationStatistics = None
+        self._pending_changes = []
+        self._max_pending_changes = 0
+
+        core.ds.add_change_listener(self)
+
+    def statement_changed(self, stm: core.Statement, added: bool) -> None:
+        if self.G is None or not isinstance(stm.relation_tuple[0], core.Entity):
+            # no graph yet or qualifier statement
+            return
+        self._pending_changes.append(stm)
+        self._limit_pending_changes()
+
+    def entity_changed(self, entity: core.Entity, added: bool) -> None:
+        if self.G is None:
+            return
+        self._pending_changes.append(entity)
+        self._limit_pending_changes()
+
+    def _limit_pending_changes(self) -> None:
+        if len(self._pending_changes) > self._max_pending_changes:
+            # rebuilding is cheaper than updating
+            self.G = None
+            self._pending_changes.clear()
+
+    def get_graph(self) -> nx.MultiDiGraph:
+        """
+        Return the up-to-date graph
+        """
+        if self.G is None:
+            self.statistics = RelationStatistics()
+            self.G = self.build_graph(self.statistics)
+        else:
+            self._apply_pending_changes()
+
+        # note: G.number_of_edges() iterates over all edges
+        size = self.G.number_of_nodes() + self.statistics.total_statement_count
+        self._max_pending_changes = max(1000, int(size * self.rebuild_factor))
+        return self.G
+
+    def build_graph(self, statistics: RelationStatistics = None) -> nx.MultiDiGraph:
+        """
+        Create a new graph (and fill `statistics` if passed)
+        """
+        G = nx.MultiDiGraph()
+        if statistics is not None:
+            # used by PrototypeMatcher to find the subjects (or objects) of a relation
+            G.graph["statistics"] = statistics
+
+        for uri, entity in list(core.ds.items.items()) + list(core.ds.relations.items()):
+            # prevent items created inside scopes
+            if is_node_for_simple_graph(entity):
+                G.add_node(uri, itm=entity, is_literal=False)
+
+        for subj_uri, stm_dict in core.ds.statements.items():
+            if subj_uri not in G:
+                # ignored entity or qualifier
+                continue
+            for stm_list in stm_dict.values():
+                for stm in stm_list:
+                    self._add_edge(G, stm, statistics)
+
+        return G
+
+    def make_literal(self, value) -> str:
+        """
+        create (if necessary) and return an uri for an literal value
+        """
+
+        if uri := self.literals.b.get(value):
+            return uri
+        i = len(self.literals.a)
+        uri = f"{LITERAL_BASE_URI}#{i}"
+        self.literals.add_pair(uri, value)
 
-    :returns:  list of newly created statements
-    """
-    rule_instances = get_all_rules()
-    total_res = core.RuleResult()
-    for rule in rule_instances:
-        res = apply_semantic_rule(rule, mod_context_uri)
-        total_res.add_partial(res)
+        return uri
 
-    return total_res
+    def _apply_pending_changes(self) -> None:
+        changes, self._pending_changes = self._pending_changes, []
 
+        # entities whose node-status might have changed
+        entities = {}
 
-def apply_semantic_rules(*rules: List, mod_context_uri: str = None) -> List[core.Statement]:
-    total_res = ReportingMultiRuleResult(rule_list=rules)
-    for rule in rules:
-        res = apply_semantic_rule(rule, mod_context_uri)
-        total_res.add_partial(res)
-        if res.exception:
-            break
+        for obj in changes:
+            if isinstance(obj, core.Statement):
+                if obj.unlinked:
+                    self._remove_edge(self.G, obj, self.statistics)
+                else:
+                    self._add_edge(self.G, obj, self.statistics)
+                if obj.predicate.uri == R20_URI:
+                    entities[obj.subject.uri] = obj.subject
+            else:
+                entities[obj.uri] = obj
 
-    return total_res
+        # note: this evaluates the current state of the data store (not the state at the time of the change)
+        for entity in entities.values():
+            self._update_node(entity)
+
+    def _add_edge(self, G: nx.MultiDiGraph, stm: core.Statement, statistics: RelationStatistics = None) -> None:
+        subj, pred, obj = stm.relation_tuple
+        if subj.uri not in G:
+            return
+
+        if isinstance(obj, core.Entity):
+            if obj.uri not in G:
+                # obj belongs to an ignored item (eg from inside a scope)
+                return
+            obj_uri, itm2 = obj.uri, obj
+        else:
+            itm2 = stm.corresponding_literal
+            obj_uri = self.make_literal(itm2)
+            if obj_uri not in G:
+                G.add_node(obj_uri, is_literal=True, value=itm2)
 
+        if G.has_edge(subj.uri, obj_uri, key=stm.uri):
+            # the statement might be reported twice (see _update_node)
+            return
+        G.add_edge(subj.uri, obj_uri, key=stm.uri, itm1=subj, itm2=itm2, rel_uri=pred.uri, rel_entity=pred)
+        if statistics is not None:
+            statistics.add(pred.uri, subj.uri, obj_uri)
+
+    def _remove_edge(self, G: nx.MultiDiGraph, stm: core.Statement, statistics: RelationStatistics = None) -> None:
+        subj, pred, obj = stm.relation_tuple
+        if isinstance(obj, core.Entity):
+            obj_uri = obj.uri
+        else:
+            obj_uri = self.literals.b.get(stm.corresponding_literal)
+        if G.has_edge(subj.uri, obj_uri, key=stm.uri):
+            G.remove_edge(subj.uri, obj_uri, key=stm.uri)
+            if statistics is not None:
+                statistics.remove(pred.uri, subj.uri, obj_uri)
+            self._remove_unused_literal_node(G, obj_uri)
+
+    def _remove_unused_literal_node(self, G: nx.MultiDiGraph, node) -> None:
+        if node.startswith(LITERAL_BASE_URI) and G.in_degree(node) == 0:
+            G.remove_node(node)
+
+    def _update_node(self, entity: core.Entity) -> None:
+        is_node = (
+            core.ds.get_entity_by_uri(entity.uri, strict=False) is entity and is_node_for_simple_graph(entity)
+        )
+        if entity.uri in self.G and self.G.nodes[entity.uri].get("itm") is not entity:
+            # the uri was reused by a new entity (e.g. after reloading a module)
+            self._remove_node(entity.uri)
 
-def apply_semantic_rule(rule: core.Item, mod_context_uri: str = None) -> List[core.Statement]:
+        if is_node and entity.uri not in self.G:
+            self.G.add_node(entity.uri, itm=entity, is_literal=False)
+            for stm_list in core.ds.statements.get(entity.uri, {}).values():
+                for stm in stm_list:
+                    self._add_edge(self.G, stm, self.statistics)
+            for inv_stm_list in core.ds.inv_statements.get(entity.uri, {}).values():
+                for inv_stm in inv_stm_list:
+                    # note: qualifier statements are also stored in ds.inv_statements (they are not part of G)
+                    if isinstance(inv_stm, core.InverseStatement):
+                        self._add_edge(self.G, inv_stm.dual_statement, self.statistics)
+        elif not is_node and entity.uri in self.G:
+            self._remove_node(entity.uri)
+
+    def _remove_node(self, uri: str) -> None:
+        literal_nodes = [n for n in self.G.successors(uri) if n.startswith(LITERAL_BASE_URI)]
+        for n1, n2, rel_uri in self.G.out_edges(uri, data="rel_uri"):
+            self.statistics.remove(rel_uri, n1, n2)
+        for n1, n2, rel_uri in self.G.in_edges(uri, data="rel_uri"):
+            if n1 != n2:
+                # (self loops have already been handled)
+                self.statistics.remove(rel_uri, n1, n2)
+        self.G.remove_node(uri)
+        for node in literal_nodes:
+            self._remove_unused_literal_node(self.G, node)
+
+
+def get_reasoning_graph() -> ReasoningGraph:
     """
-    Create a RuleApplicator instance for the rules, execute its apply-method, return the result (list of new statements)
+    Return the (shared) reasoning graph of the data store (create it if necessary)
     """
-    assert bi.is_instance_of(rule, bi.I41["semantic rule"])
+    if core.ds.reasoning_graph is None:
+        core.ds.reasoning_graph = ReasoningGraph()
+    return core.ds.reasoning_graph
 
-    if VERBOSITY:
-        print("applying", rule)
-    ra = RuleApplicator(rule, mod_context_uri=mod_context_uri)
-    try:
-        t0 = time.time()
-        raw_res: core.RuleResult = ra.apply()
-        res = ReportingRuleResult.get_new_instance(raw_res)
-    except core.aux.RuleTermination as ex:
-        res = ReportingRuleResult(raworker=None)
-        res._rule = rule
-        res.exception = ex
-        res.apply_time = time.time() - t0
 
-    if VERBOSITY:
-        print("  ", res, "\n")
-    return res
+class CompiledRuleCache:
+    """
+    Cache for the compiled (i.e. data independent) parts of RuleApplicators: prototype graphs, function tables,
+    asserted relation templates etc. (see RuleApplicator.compiled_attributes).
 
+    An entry is invalidated if a statement or an entity which belongs to the rule changes (the rule item itself, its
+    scopes and all entities and statements defined inside these scopes).
+    """
 
-def get_all_rules():
-    rule_instances: list = bi.I41["semantic rule"].get_inv_relations("R4__is_instance_of", return_subj=True)
+    def __init__(self):
+        # {rule_uri1: Container(rule=..., reasoning_graph=..., attributes=..., ra_workers=..., uris=...), ...}
+        self.entries: Dict[str, Container] = {}
 
-    return rule_instances
+        # {uri1: {rule_uri1, ...}, ...} (uris of entities and statements on which the compiled rules depend)
+        self.dependencies: Dict[str, set] = defaultdict(set)
 
+        self.hits = 0
+        self.misses = 0
 
-def filter_relevant_stms(re_list: List[core.Statement], return_items=True) -> List[core.Statement]:
-    """
-    From a list of Statement instances select only those which are qualifiers and whose subject is an
-    RE with .role == SUBJECT.
-    In other words: omit those instances which are created as dual relation edges
+        core.ds.add_change_listener(self)
 
-    :param re_list:
-    :return:
-    """
+    def get(self, rule: core.Item, reasoning_graph: ReasoningGraph) -> Optional[Container]:
+        entry = self.entries.get(rule.uri)
+        if entry is not None and (entry.rule is not rule or entry.reasoning_graph is not reasoning_graph):
+            # the uri was reused by a new entity (e.g. after reloading a module)
+            self.invalidate(rule.uri)
+            entry = None
 
-    res_statements = []
-    res_items = []
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def add(self, ra: "RuleApplicator") -> None:
+        uris = get_rule_dependency_uris(ra.rule)
+        attributes = {name: getattr(ra, name) for name in ra.compiled_attributes}
+        self.entries[ra.rule.uri] = Container(
+            rule=ra.rule, reasoning_graph=ra.reasoning_graph, attributes=attributes, ra_workers=ra.ra_workers, uris=uris
+        )
+        for uri in uris:
+            self.dependencies[uri].add(ra.rule.uri)
 
-    for stm in re_list:
-        assert isinstance(stm, core.Statement)
-        if isinstance(stm.subject, core.Statement) and stm.subject.role == core.RelationRole.SUBJECT:
-            res_statements.append(stm.subject)
-        elif isinstance(stm.subject, core.Item):
-            res_items.append(stm.subject)
+    def invalidate(self, rule_uri: str) -> None:
+        entry = self.entries.pop(rule_uri, None)
+        if entry is None:
+            return
+        for uri in entry.uris:
+            rule_uris = self.dependencies[uri]
+            rule_uris.discard(rule_uri)
+            if not rule_uris:
+                self.dependencies.pop(uri)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.dependencies.clear()
+
+    def statement_changed(self, stm: core.Statement, added: bool) -> None:
+        if not self.dependencies:
+            return
+        subj, _, obj = stm.relation_tuple
+        self._invalidate_dependent_rules(subj.uri)
+        if isinstance(obj, (core.Entity, core.Statement)):
+            # e.g. a new variable (R20) or a new statement (qualifier R20) inside a scope
+            self._invalidate_dependent_rules(obj.uri)
 
-    if return_items:
-        return res_statements, res_items
-    else:
-        return res_statements
+    def entity_changed(self, entity: core.Entity, added: bool) -> None:
+        if self.dependencies:
+            self._invalidate_dependent_rules(entity.uri)
 
+    def _invalidate_dependent_rules(self, uri: str) -> None:
+        rule_uris = self.dependencies.get(uri)
+        if rule_uris:
+            for rule_uri in list(rule_uris):
+                self.invalidate(rule_uri)
 
-class PremiseType(Enum):
-    GRAPH = 0
-    SPARQL = 1
+
+def get_rule_cache() -> CompiledRuleCache:
+    """
+    Return the cache for compiled rules of the data store (create it if necessary)
+    """
+    if core.ds.rule_cache is None:
+        core.ds.rule_cache = CompiledRuleCache()
+    return core.ds.rule_cache
 
 
-class LiteralWrapper:
-    def __init__(self, value):
-        self.value = value
+def get_rule_dependency_uris(rule: core.Item) -> set:
+    """
+    Return the uris of the rule item, of its scopes (including sub scopes) and of all entities and statements which are
+    defined inside these scopes.
+    """
+    uris = {rule.uri}
+    scopes = rule.get_inv_relations("R21__is_scope_of", return_subj=True)
+    while scopes:
+        scope = scopes.pop()
+        uris.add(scope.uri)
+        for subj in scope.get_inv_relations("R20__has_defining_scope", return_subj=True):
+            uris.add(subj.uri)
+        scopes.extend(scope.get_inv_relations("R21__is_scope_of", return_subj=True))
+    return uris
 
 
 class RuleApplicator:
@@ -137,13 +1628,100 @@ class RuleApplicator:
     Class to handle the application of a single semantic rule. Deploys several RuleApplicatorWorkers
     (depending on the OR-subscopes)
 
+    The rule specific data (prototype graphs etc.) is compiled only once and then reused from the
+    CompiledRuleCache (as long as the rule does not change).
     """
 
-    def __init__(self, rule: core.Entity, mod_context_uri: Optional[str] = None):
+    # attributes which are created by `.compile()` (and restored from the cache)
+    compiled_attributes = (
+        "premise_stm_lists",
+        "premise_item_lists",
+        "setting_stms",
+        "vars",
+        "external_entities",
+        "vars_for_literals",
+        "fiat_prototype_vars",
+        "asserted_nodes",
+        "literal_variable_nodes",
+        "sparql_src",
+        "premise_type",
+        "aggregation",
+    )
+
+    def __init__(
+        self,
+        rule: core.Entity,
+        mod_context_uri: Optional[str] = None,
+        delta_stms: List[core.Statement] = None,
+        precomputed_matches: List[Optional[Container]] = None,
+        match_limit: int = None,
+        match_cursors: List[Optional[tuple]] = None,
+        match_filter: callable = None,
+    ):
         self.rule = rule
         self.mod_context_uri = mod_context_uri
 
-        self.literals = core.aux.OneToOneMapping()
+        # None means: consider all matches (otherwise: only matches which involve at least one of these statements)
+        self.delta_stms = delta_stms
+
+        # maximum number of matches which are processed by every worker (None means: no limit)
+        if match_limit is None:
+            match_limit = RuleApplicatorWorker.max_subgraph_monomorphisms
+        if match_limit is not None and match_limit < 1:
+            msg = f"Invalid match limit: {match_limit} (expected positive integer or None)"
+            raise ValueError(msg)
+        self.match_limit = match_limit
+
+        # will be set to True if some worker does not process all matches because of match_limit
+        self.match_limit_reached = False
+
+        # optional callable (RuleApplicatorWorker, result map) -> bool (see apply_semantic_rule)
+        self.match_filter = match_filter
+
+        self.reasoning_graph = get_reasoning_graph()
+        self.literals = self.reasoning_graph.literals
+
+        # the shared graph (it is not rebuilt for every rule but updated with the recent changes)
+        self.G: nx.MultiDiGraph = self.reasoning_graph.get_graph()
+
+        rule_cache = get_rule_cache()
+        entry = rule_cache.get(rule, self.reasoning_graph)
+        if entry is None:
+            self.compile()
+            rule_cache.add(self)
+        else:
+            self.__dict__.update(entry.attributes)
+            self.ra_workers = [ra_worker.copy_for_parent(self) for ra_worker in entry.ra_workers]
+
+        if precomputed_matches is not None:
+            assert len(precomputed_matches) == len(self.ra_workers)
+            for ra_worker, worker_matches in zip(self.ra_workers, precomputed_matches):
+                ra_worker.precomputed_matches = worker_matches
+
+        if match_cursors is not None:
+            assert len(match_cursors) == len(self.ra_workers)
+            for ra_worker, match_cursor in zip(self.ra_workers, match_cursors):
+                ra_worker.match_cursor = match_cursor
+
+    @property
+    def match_cursors(self) -> List[Optional[tuple]]:
+        """
+        Keys of the last processed match of every worker (see RuleApplicatorWorker.iter_result_maps). They can be
+        passed to a new RuleApplicator to continue a truncated application (see `match_limit_reached`).
+        """
+        return [ra_worker.match_cursor for ra_worker in self.ra_workers]
+
+    def compile(self) -> None:
+        """
+        Extract the relevant statements of the rule and create the workers (with their prototype graphs)
+        """
+
+        rule = self.rule
+        aggregation_anchor = get_aggregation_anchor(rule)
+        if aggregation_anchor is not None:
+            self.compile_aggregation_rule(aggregation_anchor)
+            return
+        self.aggregation = None
 
         self.premise_stm_lists, self.premise_item_lists = self.extract_premise_stm_lists()
 
@@ -185,12 +1763,93 @@ class RuleApplicator:
         self.create_prototypes_for_fiat_entities()
         self.create_prototypes_for_variable_literals()
 
-        self.G: nx.DiGraph = self.create_simple_graph()
-
         assert len(self.premise_item_lists) == len(self.premise_stm_lists)
         pairs = zip(self.premise_stm_lists, self.premise_item_lists)
         self.ra_workers = [RuleApplicatorWorker(self, stms, itms) for stms, itms in pairs]
 
+    def compile_aggregation_rule(self, anchor_item: core.Item) -> None:
+        """
+        Create the AggregationRule from the statements of the aggregation anchor (see _rule__CM.new_aggregation),
+        of the condition function anchors in the premise and of the consequent function anchor in the assertion.
+        Aggregation rules have no premise graph and thus no workers.
+        """
+        rule = self.rule
+
+        def get_obj(rel_key):
+            return anchor_item.get_relations(rel_key, return_obj=True)
+
+        group_vars = {
+            get_obj("R91__has_group_subject_variable")[0].uri: "subject",
+            get_obj("R92__has_group_predicate_variable")[0].uri: "predicate",
+            get_obj("R93__has_group_objects_variable")[0].uri: "objects",
+        }
+
+        # condition functions with one argument (the subject variable or the objects variable) are filters
+        filters = {"subject": [], "objects": []}
+        premise_items = rule.scp__premise.get_inv_relations("R20__has_defining_scope", return_subj=True)
+        for itm in premise_items:
+            condition_func = getattr(itm, "condition_func", None)
+            if not isinstance(itm, core.Item) or condition_func is None:
+                continue
+            args = itm.get_relations("R29__has_argument", return_obj=True)
+            name = group_vars.get(args[0].uri) if len(args) == 1 else None
+            if name not in filters:
+                msg = (
+                    f"Unexpected arguments for condition function of aggregation rule {rule}: {args} "
+                    "(expected: subject variable or objects variable)"
+                )
+                raise core.aux.SemanticRuleError(msg)
+            filters[name].append(condition_func)
+
+        # the consequent function is called with its literal arguments followed by the group arguments
+        assertion_items = rule.scp__assertion.get_inv_relations("R20__has_defining_scope", return_subj=True)
+        fiat_factories = [itm for itm in assertion_items if getattr(itm, "fiat_factory", None) is not None]
+        if len(fiat_factories) != 1:
+            msg = f"Aggregation rule {rule} needs exactly one consequent function but has {len(fiat_factories)}."
+            raise core.aux.SemanticRuleError(msg)
+        consequent_args = []
+        group_arguments = []
+        for arg in fiat_factories[0].get_relations("R29__has_argument", return_obj=True):
+            if isinstance(arg, p.allowed_literal_types) and not group_arguments:
+                consequent_args.append(arg)
+            elif isinstance(arg, core.Entity) and arg.uri in group_vars:
+                group_arguments.append(group_vars[arg.uri])
+            else:
+                msg = (
+                    f"Unexpected argument of consequent function of aggregation rule {rule}: {arg} "
+                    "(expected: literals followed by group variables)"
+                )
+                raise core.aux.SemanticRuleError(msg)
+
+        max_counts = get_obj("R89__has_maximum_group_size")
+        group_counts = get_obj("R90__has_matching_group_count")
+        self.aggregation = AggregationRule(
+            consequent_function=fiat_factories[0].fiat_factory,
+            predicates=get_obj("R83__has_aggregated_predicate") or None,
+            predicate_relation=anchor_item.R84__aggregates_predicates_with_relation,
+            predicate_relation_object=anchor_item.R85__aggregates_predicates_with_relation_object,
+            excluded_predicates=get_obj("R86__excludes_aggregated_predicate"),
+            subject_class=anchor_item.R87__has_aggregated_subject_class,
+            subject_filter=combine_filters(filters["subject"]),
+            object_filter=combine_filters(filters["objects"]),
+            min_count=anchor_item.R88__has_minimum_group_size,
+            max_count=max_counts[0] if max_counts else None,
+            consequent_args=consequent_args,
+            group_arguments=group_arguments,
+            group_count=group_counts[0] if group_counts else None,
+        )
+
+        self.premise_stm_lists, self.premise_item_lists = [], []
+        self.setting_stms, self.vars = [], []
+        self.external_entities = []
+        self.vars_for_literals = []
+        self.fiat_prototype_vars = []
+        self.asserted_nodes = core.aux.OneToOneMapping()
+        self.literal_variable_nodes = core.aux.OneToOneMapping()
+        self.sparql_src = None
+        self.premise_type = PremiseType.AGGREGATION
+        self.ra_workers = []
+
     def get_premise_type(self) -> PremiseType:
         self.sparql_src = self.rule.scp__premise.get_relations("R63__has_SPARQL_source", return_obj=True)
 
@@ -266,6 +1925,11 @@ class RuleApplicator:
         Perform the actual application of the rule (either via subgraph monomorphism or via SPARQL query)
         """
 
+        if self.aggregation is not None:
+            res = AlgorithmicRuleApplicationWorker().apply_aggregation_rule(self.aggregation)
+            res._rule = self.rule
+            return res
+
         # TODO: remove this when implementing the AlgorithmicRuleApplicationWorker
         if getattr(self.rule, "cheat", None):
             func = self.rule.cheat[0]
@@ -286,6 +1950,17 @@ class RuleApplicator:
             assert len(self.ra_workers) == 1
             return self.ra_workers[0].apply_sparql_premise()
 
+    def explain(self) -> str:
+        """
+        Return a human readable description of the matching plans of all workers (intended for debugging).
+        """
+        if self.premise_type != PremiseType.GRAPH:
+            return f"{self.rule}: no matching plan ({self.premise_type.name} premise)"
+        parts = []
+        for i, ra_worker in enumerate(self.ra_workers):
+            parts.append(f"{self.rule} (worker {i}):\n{ra_worker.explain()}")
+        return "\n\n".join(parts)
+
     def create_prototypes_for_variable_literals(self):
         for i, var in enumerate(self.vars_for_literals):
             node_name = f"vlit{i}"
@@ -296,41 +1971,13 @@ class RuleApplicator:
             node_name = f"fiat{i}"
             self.asserted_nodes.add_pair(var.uri, node_name)
 
-    def create_simple_graph(self) -> nx.DiGraph:
+    def create_simple_graph(self) -> nx.MultiDiGraph:
         """
-        Create graph without regarding qualifiers. Nodes: uris (of items and relations)
+        Create (a new instance of the) graph without regarding qualifiers. Nodes: uris (of items and relations)
 
-        :return:
+        Note: the RuleApplicator itself uses the shared graph (see `get_reasoning_graph`)
         """
-        G = nx.MultiDiGraph()
-
-        for uri, entity in list(core.ds.items.items()) + list(core.ds.relations.items()):
-            # prevent items created inside scopes
-            if is_node_for_simple_graph(entity):
-                # TODO: rename kwarg itm to ent
-                G.add_node(uri, itm=entity, is_literal=False)
-
-        all_rels: Dict[Tuple, List] = self.get_all_node_relations()
-        for uri_tup, rel_cont_list in all_rels.items():
-            rel_cont_list: List[Container]  # a list of statement-describing Containers
-            uri1, uri2 = uri_tup
-            for rel_cont in rel_cont_list:
-                if uri1 in G.nodes and uri2.startswith(LITERAL_BASE_URI):
-                    literal_value = self.literals.a[uri2]
-                    G.add_node(uri2, is_literal=True, value=literal_value)
-                    G.add_edge(*uri_tup, itm1=core.ds.get_entity_by_uri(uri1), itm2=literal_value, **rel_cont)
-                elif uri1 in G.nodes and uri2 in G.nodes:
-                    G.add_edge(
-                        *uri_tup,
-                        itm1=core.ds.get_entity_by_uri(uri1),
-                        itm2=core.ds.get_entity_by_uri(uri2),
-                        **rel_cont,
-                    )
-                else:
-                    pass
-                    # uri1 belongs to an ignored item (eg from inside a scope)
-
-        return G
+        return self.reasoning_graph.build_graph()
 
     def get_all_node_relations(self) -> dict:
         """
@@ -377,14 +2024,7 @@ class RuleApplicator:
         """
         create (if necessary) and return an uri for an literal value
         """
-
-        if uri := self.literals.b.get(value):
-            return uri
-        i = len(self.literals.a)
-        uri = f"{LITERAL_BASE_URI}#{i}"
-        self.literals.add_pair(uri, value)
-
-        return uri
+        return self.reasoning_graph.make_literal(value)
 
 
 class RuleApplicatorWorker:
@@ -392,7 +2032,25 @@ class RuleApplicatorWorker:
     Performs the application of one premise branch of a rule
     """
 
-    max_subgraph_monomorphisms = 3000
+    # default for the maximum number of matches which are processed per application (None means: no limit; see also
+    # match_limit argument of RuleApplicator)
+    max_subgraph_monomorphisms = None
+
+    # use the VF2 implementation of networkx instead of PrototypeMatcher (e.g. for comparison)
+    use_vf2_matcher = False
+
+    # evaluate the condition functions already during matching (as soon as all their arguments are bound, see
+    # PrototypeMatcher). They are evaluated again before the consequences of a match are applied. Thus, a match whose
+    # condition only becomes true due to the consequences of another match of the same application is found by the
+    # next application (e.g. in the next round of apply_rules_until_fixpoint).
+    push_down_condition_functions = True
+
+    # generate only one of several equivalent matches (which are mapped onto each other by an automorphism of the rule,
+    # see get_symmetry_constraints)
+    break_symmetries = True
+
+    # if P has more automorphisms no symmetry breaking is performed
+    max_automorphisms = 5040
 
     # useful for debugging: IPS(self.parent.rule.short_key=="I763")
 
@@ -439,9 +2097,24 @@ class RuleApplicatorWorker:
         # will be set when needed (holds the union of both previous structures)
         self.extended_local_nodes = None
 
+        # will be set when needed (see match_subgraph_P)
+        self.matcher: PrototypeMatcher = None
+
+        # optional Container(raw_maps=..., extra_delta_stms=...) (see ParallelRuleMatcher)
+        self.precomputed_matches: Container = None
+
+        # key of the last processed match (see iter_result_maps)
+        self.match_cursor: tuple = None
+
+        # will be set when needed (see get_symmetry_constraints)
+        self.symmetry_constraints: List[tuple] = None
+
         # list of Containers, containing triples like (node1, <Relation>, node2)
         self.asserted_relation_templates: List[Container] = None
 
+        # holds the function tables (see get_function_tables); this dict is shared by all copies (see copy_for_parent)
+        self.function_tables = {}
+
         self.P: nx.MultiDiGraph = None
         self.create_prototype_subgraph_from_rule()
 
@@ -449,6 +2122,20 @@ class RuleApplicatorWorker:
     def rule(self):
         return self.parent.rule
 
+    def copy_for_parent(self, parent: RuleApplicator) -> "RuleApplicatorWorker":
+        """
+        Return a (shallow) copy of this worker which is used by another RuleApplicator for the same rule.
+        The compiled data (P, local_nodes, ...) is shared.
+        """
+        new_worker = copy.copy(self)
+        new_worker.parent = parent
+
+        # the plan of the matcher depends on the statistics of the current graph
+        new_worker.matcher = None
+        new_worker.precomputed_matches = None
+        new_worker.match_cursor = None
+        return new_worker
+
     def apply_sparql_premise(self) -> core.RuleResult:
         t0 = time.time()
         where_clause = textwrap.dedent(self.sparql_src[0])
@@ -546,39 +2233,53 @@ class RuleApplicatorWorker:
 
     def apply_graph_premise(self) -> core.RuleResult:
         t0 = time.time()
-        result_maps = self.match_subgraph_P()
+        # the matches are generated lazily (and processed as they arrive); they are searched in G which does not change
+        # while the consequences are applied (see ReasoningGraph)
+        result_maps = self._iter_and_track_result_maps()
         # Note: useful for debugging:
         # - self._get_understandable_local_nodes()
-        # - self._get_understandable_result_maps()
+        # - self._get_understandable_result_maps(self.match_subgraph_P())
         #
         # TODO: to debug the result_maps data structure the following things might be helpful:
         # - a visualization of the prototype graph self.P
 
-        try:
-            dbg = self._get_understandable_result_maps(result_maps)
-        except AssertionError:
-            # FIXME: occurs for test_d10__zebra_puzzle_stage02
-            dbg = None
-            pass
-
         # now apply condition funcs (to filter the results) and consequent funcs (to do something)
-        res = self._process_result_map(result_maps)
+        res = self._process_result_map(result_maps, limit=self.parent.match_limit)
         res.apply_time = time.time() - t0
 
         return res
 
-    def _process_result_map(self, result_maps) -> core.RuleResult:
+    def _iter_and_track_result_maps(self) -> Iterator[dict]:
+        """
+        Generate the result maps after self.match_cursor and update the cursor when a match has been processed
+        """
+        for match_key, result_map in self.iter_result_maps(start_after=self.match_cursor):
+            yield result_map
+            # the next match is requested after this one has been processed
+            self.match_cursor = match_key
+
+    def _process_result_map(self, result_maps: Iterable[dict], limit: int = None) -> core.RuleResult:
         """
         - process the found subgraphs with the assertion
+
+        :param result_maps: iterable of result maps (see iter_result_maps)
+        :param limit:       optional maximum number of result maps to process
         """
 
-        condition_functions, cond_func_arg_nodes = self.get_condition_funcs_and_args()
+        condition_functions, cond_func_arg_nodes = self.get_function_tables()["condition"]
 
-        consequent_functions, cf_arg_nodes, anchor_node_names = self.prepare_consequent_functions()
+        consequent_functions, cf_arg_nodes, anchor_node_names = self.get_function_tables()["consequent"]
 
-        result = ReportingRuleResult(raworker=self, raw_result_count=len(result_maps))
+        result = ReportingRuleResult(raworker=self, raw_result_count=0)
 
         for res_dict0 in result_maps:
+            if limit is not None and result.raw_result_count >= limit:
+                # there are more matches than allowed (they can be processed later, see RuleApplicator.match_cursors)
+                result.match_limit_reached = True
+                self.parent.match_limit_reached = True
+                break
+            result.raw_result_count += 1
+
             # res_dict represents one situation where the assertions should be applied
             # it's a dict {<node-number>: <item>, ...} like
             # {
@@ -610,6 +2311,9 @@ class RuleApplicatorWorker:
                 # despite we have a subgraph-monomorphism match -> we skip to the next res_dict
                 continue
 
+            if self.parent.match_filter is not None and not self.parent.match_filter(self, res_dict0):
+                continue
+
             call_args_list = []
             for node_tuple in cf_arg_nodes:
                 tmp_args = []
@@ -743,6 +2447,16 @@ class RuleApplicatorWorker:
 
         return relations
 
+    def get_function_tables(self) -> dict:
+        """
+        Return a dict with the results of `get_condition_funcs_and_args()` and `prepare_consequent_functions()`
+        (they are only created once per compiled rule).
+        """
+        if not self.function_tables:
+            self.function_tables["condition"] = self.get_condition_funcs_and_args()
+            self.function_tables["consequent"] = self.prepare_consequent_functions()
+        return self.function_tables
+
     def get_condition_funcs_and_args(self) -> (List[callable], List[Tuple[int]]):
         """ """
         self._fill_extended_local_nodes()
@@ -874,63 +2588,392 @@ class RuleApplicatorWorker:
                 stm.get_first_qualifier_obj_with_rel("R59__has_rule_prototype_graph_mode") == 5
             )
 
-            res.append(c)
+            res.append(c)
+
+        return res
+
+    def _fill_extended_local_nodes(self, force=False):
+        """
+        join local_nodes + asserted_nodes + parent.literal_variable_nodes
+        """
+        if self.extended_local_nodes is not None and not force:
+            return
+
+        self.extended_local_nodes = core.aux.OneToOneMapping(**self.local_nodes.a)
+        for k, v in self.parent.asserted_nodes.a.items():
+            self.extended_local_nodes.add_pair(k, v)
+        for k, v in self.parent.literal_variable_nodes.a.items():
+            self.extended_local_nodes.add_pair(k, v)
+
+    def match_subgraph_P(self) -> List[dict]:
+        """
+        Return the list of all result maps (see iter_result_maps)
+        """
+        return [result_map for _, result_map in self.iter_result_maps()]
+
+    def iter_result_maps(self, start_after: tuple = None) -> Iterator[Tuple[tuple, dict]]:
+        """
+        Lazily generate the matches of P in G as 2-tuples (match key, result map).
+
+        The result maps are dicts like
+        {
+            0: <Item I2931["local Lyapunov stability"]>,
+            1: <Item I4900["local asymptotical stability"]>,
+            2: <Item I9642["local exponential stability"]>
+        }
+
+        The matches are generated in the order of their keys (tuples of G-nodes in the order of the matching plan).
+        This order does not depend on the order in which the graph was built.
+
+        :param start_after: optional match key; only matches with greater keys are generated
+        """
+        assert self.P is not None
+
+        raw_maps = self._get_precomputed_raw_matches()
+        if raw_maps is None:
+            raw_maps = self.iter_raw_matches(self.parent.delta_stms)
+            if self.use_vf2_matcher:
+                # the order of the VF2 results is not stable across multiple runs
+                raw_maps = sorted(self._to_plan_order(raw_maps), key=tuple)
+
+        for raw_map in raw_maps:
+            # raw_map is a dict like {'irk:/test/zebra02#Ia1158': 0, 'irk:/tmp/literals#0': 1}
+            match_key = tuple(raw_map)
+            if start_after is not None and match_key <= start_after:
+                continue
+
+            # invert the dict (switching G and P does not work) and introduce items for uris
+            yield match_key, {P_node: self._get_by_uri(G_node) for G_node, P_node in raw_map.items()}
+
+    def iter_raw_matches(self, delta_stms: Optional[List[core.Statement]]) -> Iterator[dict]:
+        """
+        Lazily generate the matches of P in G (dicts like {G-node: P-node}) which involve at least one of the delta
+        statements (all matches if `delta_stms` is None).
+        """
+        G = self.parent.G
+        delta_subject_uris = None
+        if delta_stms is not None:
+            G, delta_subject_uris = self._get_delta_search_graph(delta_stms)
+
+        for r in self._iter_subgraph_monomorphisms(G):
+            if delta_subject_uris is not None and delta_subject_uris.isdisjoint(r):
+                # this match does not involve a delta statement (it was already processed before)
+                continue
+            yield r
+
+    def find_raw_matches(
+        self, delta_stms: Optional[List[core.Statement]], limit: int = None
+    ) -> Tuple[List[dict], bool]:
+        """
+        Return the list of matches (see iter_raw_matches).
+
+        :param limit:   optional maximum number of matches
+        :returns:       2-tuple (list of matches, flag whether there are more than `limit` matches)
+        """
+        res = []
+        for r in self.iter_raw_matches(delta_stms):
+            if limit is not None and len(res) >= limit:
+                return res, True
+            res.append(r)
+        return res, False
+
+    def _get_precomputed_raw_matches(self) -> Optional[List[dict]]:
+        """
+        Combine the matches which were found in a snapshot of G (see ParallelRuleMatcher) with the matches which
+        involve statements created after the snapshot.
+
+        :returns:   list of matches (like find_raw_matches) or None if the matches have to be searched from scratch
+        """
+        if self.precomputed_matches is None:
+            return None
+
+        raw_maps = self.precomputed_matches.raw_maps
+        if extra_delta_stms := self.precomputed_matches.extra_delta_stms:
+            extra_maps = self.iter_raw_matches(extra_delta_stms)
+            known_matches = set(frozenset(d.items()) for d in raw_maps)
+            raw_maps = raw_maps + [d for d in extra_maps if frozenset(d.items()) not in known_matches]
+
+        # the match keys depend on the order of the dict keys -> use the order of the current plan
+        return sorted(self._to_plan_order(raw_maps), key=tuple)
+
+    def _to_plan_order(self, raw_maps: Iterable[dict]) -> List[dict]:
+        """
+        Return copies of the matches whose keys are sorted like the nodes of the matching plan
+        """
+        plan_nodes = [step.node for step in self.get_matcher().plan]
+        res = []
+        for d in raw_maps:
+            inv_d = {P_node: G_node for G_node, P_node in d.items()}
+            res.append({inv_d[P_node]: P_node for P_node in plan_nodes})
+        return res
+
+    def _iter_subgraph_monomorphisms(self, G: nx.MultiDiGraph):
+        """
+        Iterate over all subgraph monomorphisms of P in G (dicts like {G-node: P-node}).
+        """
+        if self.use_vf2_matcher:
+            # restrictions for matching nodes: none
+            # ... for matching edges: relation-uri must match
+            GM = nxiso.MultiDiGraphMatcher(G, self.P, node_match=self._node_matcher, edge_match=edge_matcher)
+
+            # for the difference between subgraph monomorphisms and isomorphisms see:
+            # https://networkx.org/documentation/stable/reference/algorithms/isomorphism.vf2.html#subgraph-isomorphism
+            # jupyter notebook subgraph-matching-problem
+            return GM.subgraph_monomorphisms_iter()
+
+        return self.get_matcher().subgraph_monomorphisms_iter(G)
+
+    def get_matcher(self) -> "PrototypeMatcher":
+        """
+        Return the PrototypeMatcher for P (the plan is based on the current statistics of the reasoning graph)
+        """
+        if self.matcher is None:
+            self._fill_extended_local_nodes()
+            self.matcher = PrototypeMatcher(
+                self.P,
+                self._node_matcher,
+                edge_matcher,
+                self.parent.literals,
+                fixed_nodes=self._get_fixed_nodes(),
+                statistics=self.parent.reasoning_graph.statistics,
+                conditions=self._get_pushdown_conditions() if self.push_down_condition_functions else None,
+                symmetry_constraints=self.get_symmetry_constraints() if self.break_symmetries else None,
+            )
+        return self.matcher
+
+    def get_symmetry_constraints(self) -> List[tuple]:
+        """
+        Return a list of pairs (P-node1, P-node2) whose G-nodes have to be ordered (G-node1 < G-node2). This ensures
+        that of all matches which are mapped onto each other by an automorphism of the rule only one is generated.
+        Such matches would have the same consequences (e.g. for P-nodes of interchangeable variables).
+
+        The constraints are created from the stabilizer chain of the automorphism group, see
+        Grochow, Kellis (2007): "Network Motif Discovery Using Subgraph Enumeration and Symmetry-Breaking".
+        """
+        if self.symmetry_constraints is not None:
+            return self.symmetry_constraints
+
+        automorphisms = self._get_rule_automorphisms()
+        constraints = []
+        while len(automorphisms) > 1:
+            orbits = defaultdict(set)
+            for automorphism in automorphisms:
+                for node, image in automorphism.items():
+                    orbits[node].add(image)
+
+            # the node with the largest orbit (for equal sizes: the first node of P)
+            node = max(self.P.nodes, key=lambda n: len(orbits[n]))
+            for other_node in self.P.nodes:
+                if other_node != node and other_node in orbits[node]:
+                    constraints.append((node, other_node))
+
+            # continue with the stabilizer of node
+            automorphisms = [automorphism for automorphism in automorphisms if automorphism[node] == node]
+
+        self.symmetry_constraints = constraints
+        return constraints
+
+    def _get_rule_automorphisms(self) -> List[dict]:
+        """
+        Return the list of automorphisms (dicts {P-node: P-node}) of P which also leave the condition functions,
+        consequent functions and asserted statements of the rule invariant (empty list if there are too many).
+        """
+        if self.subjectivized_predicates.a or self.parent.premise_type != PremiseType.GRAPH:
+            # proxy items for relations are not considered
+            return []
+
+        fixed_nodes = self._get_fixed_nodes()
+        P_signature = nx.MultiDiGraph()
+        for node, node_data in self.P.nodes(data=True):
+            if node_data.get("rel_statements") is not None:
+                # relation nodes with specific properties are not considered
+                return []
+            if node in fixed_nodes:
+                signature = ("fixed", fixed_nodes[node])
+            else:
+                signature = ("variable", bool(node_data.get("is_variable_literal")))
+            P_signature.add_node(node, signature=signature)
+        for n1, n2, rel_uri in self.P.edges(data="rel_uri"):
+            if rel_uri == wildcard_relation_uri:
+                return []
+            P_signature.add_edge(n1, n2, rel_uri=rel_uri)
 
+        def edge_match(e1d, e2d):
+            return sorted(d["rel_uri"] for d in e1d.values()) == sorted(d["rel_uri"] for d in e2d.values())
+
+        GM = nxiso.MultiDiGraphMatcher(
+            P_signature,
+            P_signature,
+            node_match=lambda n1d, n2d: n1d["signature"] == n2d["signature"],
+            edge_match=edge_match,
+        )
+        res = []
+        for automorphism in GM.isomorphisms_iter():
+            if len(res) >= self.max_automorphisms:
+                return []
+            if self._is_rule_automorphism(automorphism):
+                res.append(automorphism)
         return res
 
-    def _fill_extended_local_nodes(self, force=False):
+    def _is_rule_automorphism(self, automorphism: dict) -> bool:
         """
-        join local_nodes + asserted_nodes + parent.literal_variable_nodes
+        Check whether the functions and asserted statements of the rule are invariant under the automorphism of P
         """
-        if self.extended_local_nodes is not None and not force:
-            return
 
-        self.extended_local_nodes = core.aux.OneToOneMapping(**self.local_nodes.a)
-        for k, v in self.parent.asserted_nodes.a.items():
-            self.extended_local_nodes.add_pair(k, v)
-        for k, v in self.parent.literal_variable_nodes.a.items():
-            self.extended_local_nodes.add_pair(k, v)
+        def map_nodes(node_tuple):
+            return tuple(automorphism.get(node, node) for node in node_tuple)
 
-    def match_subgraph_P(self) -> List[dict]:
-        assert self.P is not None
+        def is_invariant(entries: list, map_entry: callable) -> bool:
+            remaining_entries = list(entries)
+            for entry in entries:
+                mapped_entry = map_entry(entry)
+                if mapped_entry not in remaining_entries:
+                    return False
+                remaining_entries.remove(mapped_entry)
+            return True
 
-        # restrictions for matching nodes: none
-        # ... for matching edges: relation-uri must match
-        GM = nxiso.MultiDiGraphMatcher(
-            self.parent.G, self.P, node_match=self._node_matcher, edge_match=edge_matcher
-        )
+        condition_functions, cond_func_arg_nodes = self.get_function_tables()["condition"]
+        consequent_functions, cf_arg_nodes, _ = self.get_function_tables()["consequent"]
+
+        # the functions are bound to different anchor items -> compare the underlying functions
+        function_entries = []
+        for kind, funcs, arg_nodes in [
+            ("condition", condition_functions, cond_func_arg_nodes),
+            ("consequent", consequent_functions, cf_arg_nodes),
+        ]:
+            for func, node_tuple in zip(funcs, arg_nodes):
+                function_entries.append((kind, getattr(func, "__func__", func), node_tuple))
+        if not is_invariant(function_entries, lambda e: (e[0], e[1], map_nodes(e[2]))):
+            return False
 
-        # for the difference between subgraph monomorphisms and isomorphisms see:
-        # https://networkx.org/documentation/stable/reference/algorithms/isomorphism.vf2.html#subgraph-isomorphism
-        # jupyter notebook subgraph-matching-problem
-        res = []
-        i = 0
-        for r in GM.subgraph_monomorphisms_iter():
-            i += 1
-            res.append(r)
-            if i >= self.max_subgraph_monomorphisms:
-                break
-        # res is a list of dicts like:[{'irk:/test/zebra02#Ia1158': 0, 'irk:/tmp/literals#0': 1}, ...]
-        # for some reason the order of that list is not stable across multiple runs
-        # ensure stable order for stable test results; for comparing dicts they are converted to json-strings
-        res.sort(key=json.dumps)
+        template_entries = []
+        for cntnr in self.asserted_relation_templates:
+            if isinstance(cntnr.predicate, p.Item):
+                # proxy item
+                return False
+            template_entries.append((cntnr.subject, cntnr.predicate.uri, cntnr.object, cntnr.omit_if_existing))
+        return is_invariant(template_entries, lambda e: (*map_nodes(e[:1]), e[1], *map_nodes(e[2:3]), e[3]))
+
+    def _get_pushdown_conditions(self) -> List[Tuple[callable, Tuple[int]]]:
+        """
+        Return the condition functions (with their argument nodes) which can be evaluated during matching (i.e. all
+        arguments are nodes of P)
+        """
+        condition_functions, cond_func_arg_nodes = self.get_function_tables()["condition"]
+        return [
+            (cond_func, node_tuple)
+            for cond_func, node_tuple in zip(condition_functions, cond_func_arg_nodes)
+            if all(node in self.P for node in node_tuple)
+        ]
+
+    def explain(self) -> str:
+        """
+        Return a human readable description of the matching plan for P (intended for debugging).
+        """
+        return self.get_matcher().explain(get_node_label=self._get_P_node_label)
+
+    def _get_P_node_label(self, node) -> str:
+        node_data = self.P.nodes[node]
+        if node_data["is_literal"]:
+            return repr(node_data["value"])
+        entity = node_data["entity"]
+        name = self.local_node_names.a.get(entity.uri)
+        if name is not None:
+            return f"{name}({node})"
+        return f"{entity.short_key}[{entity.R1}]"
+
+    def _get_fixed_nodes(self) -> Dict[int, str]:
+        """
+        Return a dict {P-node: G-node} for all nodes of P which can only be mapped to one specific node of G
+        (external entities and literal values).
+        """
+        fixed_nodes = {}
+        for node, node_data in self.P.nodes(data=True):
+            if node_data["is_literal"] or node_data.get("entity") in self.parent.external_entities:
+                fixed_nodes[node] = self.extended_local_nodes.b[node]
+        return fixed_nodes
+
+    def _get_delta_search_graph(self, delta_stms: List[core.Statement]) -> Tuple[nx.MultiDiGraph, Optional[set]]:
+        """
+        Determine the part of G which contains all matches of P which involve at least one of the delta statements
+        (i.e. whose subjects are mapped to by some node of P).
 
-        # invert the dicts (switching G and P does not work)
-        # and introduce items for uris
+        :returns:   2-tuple: (graph to search in, set of subject-uris of the delta statements); if the second element
+                    is None all matches of the graph have to be processed
+        """
+        G = self.parent.G
+
+        P_rel_uris = set(rel_uri for _, _, rel_uri in self.P.edges(data="rel_uri"))
+        wildcard_edges = wildcard_relation_uri in P_rel_uris
+        delta_subject_uris = set()
+        for stm in delta_stms:
+            subj = stm.subject
+            if isinstance(subj, core.Relation) and (wildcard_edges or self.subjectivized_predicates.a):
+                # the statement might change which edges or relation-nodes match (without being part of the match)
+                return G, None
+            delta_subject_uris.add(subj.uri)
+
+        cc = self._get_weakly_connected_components(self.P)
+        if len(cc.main_components) != 1:
+            # the delta statement might belong to one component while the other component is matched anywhere
+            return G, delta_subject_uris
+
+        # P-nodes which are mapped to a fixed G-node (external entities and literal values)
+        main_component = cc.main_components[0]
+        fixed_nodes = self._get_fixed_nodes()
+        fixed_uris = set(fixed_nodes.values())
+
+        if not delta_subject_uris.isdisjoint(fixed_uris):
+            # every match involves this delta statement
+            return G, None
+
+        seeds = [uri for uri in delta_subject_uris if uri in G]
+        if not seeds:
+            return nx.MultiDiGraph(), delta_subject_uris
+
+        P_undirected = self.P.subgraph(main_component - fixed_nodes.keys()).to_undirected(as_view=True)
+        if len(P_undirected) == 0:
+            return nx.MultiDiGraph(), delta_subject_uris
+
+        # every node of a match has at most this (undirected) distance to the node which matches a delta subject
+        if nx.is_connected(P_undirected):
+            # paths inside the matches do not need to pass the fixed nodes (which might be hubs in G)
+            radius = nx.diameter(P_undirected)
+            blocked_uris = fixed_uris
+            # G-literals can only be matched by variable literals
+            skip_literals = not any(self.P.nodes[node].get("is_variable_literal") for node in P_undirected)
+        else:
+            radius = nx.diameter(self.P.subgraph(main_component).to_undirected(as_view=True))
+            blocked_uris = set()
+            skip_literals = False
+
+        nodes = set(seeds)
+        frontier = seeds
+        for _ in range(radius):
+            new_frontier = []
+            for node in frontier:
+                for neighbor, edge_dicts in it.chain(G.succ[node].items(), G.pred[node].items()):
+                    if neighbor in nodes or neighbor in blocked_uris:
+                        continue
+                    if skip_literals and G.nodes[neighbor]["is_literal"]:
+                        continue
+                    # a match only contains edges of relations which occur in P (e.g. no R4-edges to type-items)
+                    if not wildcard_edges and all(d["rel_uri"] not in P_rel_uris for d in edge_dicts.values()):
+                        continue
+                    nodes.add(neighbor)
+                    new_frontier.append(neighbor)
+            frontier = new_frontier
 
-        new_res = []
-        for d in res:
-            new_res.append(dict((v, self._get_by_uri(k)) for k, v in d.items()))
+        if len(nodes) > len(G) / 2:
+            # restriction would not pay off
+            return G, delta_subject_uris
 
-        # new_res is a list of dicts like
-        # [{
-        #   0: <Item I2931["local Lyapunov stability"]>,
-        #   1: <Item I4900["local asymptotical stability"]>,
-        #   2: <Item I9642["local exponential stability"]>
-        #  }, ... ]
+        # fixed nodes and nodes of the other components (relations)
+        nodes.update(uri for uri in fixed_uris if uri in G)
+        if cc.subjectivized_predicates_components:
+            nodes.update(uri for uri in core.ds.relations if uri in G)
 
-        # IPS()
-        return new_res
+        return G.subgraph(nodes).copy(), delta_subject_uris
 
     def _get_by_uri(self, uri):
         """
@@ -1177,7 +3220,7 @@ class RuleApplicatorWorker:
 
         if len(cc.main_components) == 0:
             # TODO: remove this when implementing the AlgorithmicRuleApplicationWorker
-            if getattr(self.parent.rule, "cheat", None):
+            if is_algorithmic_rule(self.parent.rule):
                 return
             # end of cheat (hardcoded experimental query)
 
@@ -1253,6 +3296,367 @@ class RuleApplicatorWorker:
             stm_list.pop(idx)
 
 
+class PrototypeMatcher:
+    """
+    Find all subgraph monomorphisms of a prototype graph P in the simple graph G (see ReasoningGraph).
+
+    P is compiled into a plan which binds one P-node after another. The candidates for a node are obtained by
+    following an edge from an already bound node via the adjacency of G (or via the statistics of G for the first node
+    of a component). All other edges to already bound nodes are checked afterwards. The order of the nodes is chosen
+    based on the RelationStatistics of G (see `.explain()` for a readable version of the plan).
+
+    The results are the same as those of
+    `nxiso.MultiDiGraphMatcher(G, P, node_match, edge_match).subgraph_monomorphisms_iter()`, except for the matches
+    which are rejected by the condition functions. A condition function is evaluated as soon as all its arguments are
+    bound (this prunes the search early). The same holds for the symmetry constraints (only one of several equivalent
+    matches is generated). The matches are generated in the lexicographic order of their G-nodes (in the order of
+    the plan).
+    """
+
+    def __init__(
+        self,
+        P: nx.MultiDiGraph,
+        node_match: callable,
+        edge_match: callable,
+        literals: core.aux.OneToOneMapping,
+        fixed_nodes: Dict[int, str] = None,
+        statistics: "RelationStatistics" = None,
+        conditions: List[Tuple[callable, Tuple[int]]] = None,
+        symmetry_constraints: List[tuple] = None,
+    ):
+        """
+        :param P:           prototype graph
+        :param node_match:  callable (G-node-data, P-node-data) -> bool
+        :param edge_match:  callable (G-multi-edge-data, P-multi-edge-data) -> bool
+        :param literals:    mapping between literal uris (nodes of G) and literal values
+        :param fixed_nodes: dict {P-node: G-node} for nodes of P which can only be mapped to one node of G
+        :param statistics:  statistics of G which are used to estimate the cost of the plan
+        :param conditions:  list of 2-tuples (condition function, tuple of P-nodes); the function is called with the
+                            entities (or literal values) of these nodes and must return True for a match
+        :param symmetry_constraints:
+                            list of pairs (P-node1, P-node2); for a match the G-node of P-node1 must be smaller than
+                            the G-node of P-node2 (see RuleApplicatorWorker.get_symmetry_constraints)
+        """
+        self.P = P
+        self.node_match = node_match
+        self.edge_match = edge_match
+        self.literals = literals
+        self.fixed_nodes = fixed_nodes or {}
+        if statistics is None:
+            statistics = RelationStatistics()
+        self.statistics = statistics
+        self.conditions = conditions or []
+        self.symmetry_constraints = symmetry_constraints or []
+
+        self.plan: List[Container] = self.compile_plan()
+
+    def compile_plan(self) -> List[Container]:
+        """
+        Determine the order in which the nodes of P are bound and how their candidates are obtained.
+
+        The order is chosen greedily: in every step the node with the smallest estimated number of candidates
+        (based on self.statistics) is bound next. Each step of the plan is a Container with the attributes
+            - node:         P-node to bind
+            - anchor:       None or P-edge (n1, n2, rel_uri) which connects `node` to an already bound node
+            - checks:       list of all P-edges (n1, n2) between `node` and already bound nodes (including `node`)
+            - estimate:     estimated number of candidates per partial match (after checking the edges)
+            - rows:         estimated number of partial matches after this step
+            - conditions:   list of the conditions whose arguments are bound after this step
+            - order_checks: list of the symmetry constraints whose nodes are bound after this step
+        """
+
+        for n1, n2 in self.P.edges():
+            msg = "multi-edges in prototype-graph not yet supported, use SPARQL premise"
+            assert self.P.number_of_edges(n1, n2) == 1, msg
+
+        plan = []
+        bound = set()
+        unbound = list(self.P.nodes)
+        rows = 1
+        while unbound:
+            options = []
+            for idx, n in enumerate(unbound):
+                estimate, anchor = self._estimate_step(n, bound)
+                # ties (e.g. due to missing statistics) are broken by the number of edges which can be checked
+                options.append((estimate, -len(self._get_edges_to(n, bound)), idx, n, anchor))
+            estimate, _, _, node, anchor = min(options, key=lambda option: option[:3])
+            unbound.remove(node)
+
+            bound.add(node)
+            checks = [(n1, n2) for n1, n2, _ in self._get_edges_to(node, bound)]
+            rows *= estimate
+            plan.append(Container(node=node, anchor=anchor, checks=checks, estimate=estimate, rows=rows))
+
+        step_indices = {step.node: idx for idx, step in enumerate(plan)}
+        for step in plan:
+            step.conditions = []
+            step.order_checks = []
+        for cond_func, node_tuple in self.conditions:
+            idx = max((step_indices[node] for node in node_tuple), default=0)
+            plan[idx].conditions.append((cond_func, node_tuple))
+        for n1, n2 in self.symmetry_constraints:
+            plan[max(step_indices[n1], step_indices[n2])].order_checks.append((n1, n2))
+
+        return plan
+
+    def _estimate_step(self, node, bound: set) -> Tuple[float, Optional[tuple]]:
+        """
+        Estimate the number of candidates for node (given that the nodes in `bound` are already bound) and choose
+        the anchor edge.
+
+        :returns:   2-tuple (estimate, anchor)
+        """
+        if node in self.fixed_nodes:
+            return 1, None
+
+        edges = self._get_edges_to(node, bound)
+
+        # the candidates are obtained either by following an edge from a bound node or (if this is cheaper, e.g. for
+        # edges from a fixed node with many edges) from the statements of some relation;
+        # all other edges have to be checked
+        options = [(self._estimate_unbound_candidates(node)[0], len(edges), None)]
+        for idx, edge in enumerate(edges):
+            options.append((self._estimate_fanout(node, edge), idx, edge))
+
+        # the access path is chosen by the number of candidates which have to be enumerated (the number of remaining
+        # candidates after checking the other edges is the same for all paths)
+        best_fanout = None
+        for fanout, _, anchor in options:
+            # prefer anchors (they restrict the candidates without relying on the statistics)
+            if best_fanout is None or fanout < best_fanout or (fanout == best_fanout and anchor):
+                best_fanout, best_anchor = fanout, anchor
+
+        estimate = best_fanout
+        for edge in edges:
+            if edge is not best_anchor:
+                estimate *= self._estimate_selectivity(edge)
+        return estimate, best_anchor
+
+    def _estimate_fanout(self, node, edge: tuple) -> float:
+        """
+        Estimate the number of candidates for `node` which are obtained by following `edge` from the bound node
+        """
+        n1, n2, rel_uri = edge
+        if rel_uri == wildcard_relation_uri:
+            # all neighbors have to be considered
+            return self.statistics.get_average_degree()
+        if n1 == node:
+            # node is the subject, the object is bound
+            return self.statistics.get_object_fanout(rel_uri, self.fixed_nodes.get(n2))
+        else:
+            return self.statistics.get_subject_fanout(rel_uri, self.fixed_nodes.get(n1))
+
+    def _estimate_selectivity(self, edge: tuple) -> float:
+        """
+        Estimate the probability that two (arbitrary) bound nodes are connected by `edge`
+        """
+        n1, n2, rel_uri = edge
+        if rel_uri == wildcard_relation_uri:
+            return 1
+        subject_count = self.statistics.get_distinct_subject_count(rel_uri)
+        object_count = self.statistics.get_distinct_object_count(rel_uri)
+        if subject_count == 0:
+            return 0
+        if n2 in self.fixed_nodes:
+            return min(1, self.statistics.get_object_fanout(rel_uri, self.fixed_nodes[n2]) / subject_count)
+        return min(1, self.statistics.get_statement_count(rel_uri) / (subject_count * object_count))
+
+    def _estimate_unbound_candidates(self, node) -> Tuple[float, Optional[tuple]]:
+        """
+        Estimate the number of candidates for a node without edges to bound nodes and choose the incident edge
+        whose relation is used to obtain them.
+
+        :returns:   2-tuple (estimate, (is_subject, rel_uri)) (second element is None if all nodes of G have to be
+                    considered)
+        """
+        best = (self.statistics.get_node_count(), None)
+        for n1, n2, rel_uri in it.chain(self.P.out_edges(node, data="rel_uri"), self.P.in_edges(node, data="rel_uri")):
+            if rel_uri == wildcard_relation_uri:
+                continue
+            if n1 == node:
+                option = (self.statistics.get_distinct_subject_count(rel_uri), (True, rel_uri))
+            else:
+                option = (self.statistics.get_distinct_object_count(rel_uri), (False, rel_uri))
+            if best[1] is None or option[0] < best[0]:
+                best = option
+        return best
+
+    def explain(self, get_node_label: callable = str) -> str:
+        """
+        Return a human readable description of the plan (similar to EXPLAIN in SQL)
+
+        :param get_node_label:  callable which returns a label for a P-node
+        """
+        lines = [f"{'step':<5} {'node':<30} {'estimate':>10} {'rows':>10}  access"]
+        bound = set()
+        for i, step in enumerate(self.plan):
+            if step.node in self.fixed_nodes:
+                access = "fixed node"
+            elif step.anchor is None:
+                _, option = self._estimate_unbound_candidates(step.node)
+                if option is None:
+                    access = "scan all nodes"
+                else:
+                    is_subject, rel_uri = option
+                    access = f"{'subjects' if is_subject else 'objects'} of {_get_relation_label(rel_uri)}"
+            else:
+                n1, n2, rel_uri = step.anchor
+                if n1 == step.node:
+                    access = f"subjects of {_get_relation_label(rel_uri)} with object {get_node_label(n2)}"
+                else:
+                    access = f"objects of {_get_relation_label(rel_uri)} with subject {get_node_label(n1)}"
+
+            checks = [(n1, n2) for n1, n2 in step.checks if step.anchor is None or (n1, n2) != step.anchor[:2]]
+            if checks:
+                check_strs = [f"{get_node_label(n1)}->{get_node_label(n2)}" for n1, n2 in checks]
+                access = f"{access}; check {', '.join(check_strs)}"
+            for cond_func, node_tuple in step.conditions:
+                arg_strs = [get_node_label(node) for node in node_tuple]
+                access = f"{access}; condition {getattr(cond_func, '__name__', cond_func)}({', '.join(arg_strs)})"
+            if step.order_checks:
+                order_strs = [f"{get_node_label(n1)} < {get_node_label(n2)}" for n1, n2 in step.order_checks]
+                access = f"{access}; order {', '.join(order_strs)}"
+            bound.add(step.node)
+            node_label = get_node_label(step.node)
+            lines.append(f"{i:<5} {node_label:<30} {step.estimate:>10.3g} {step.rows:>10.3g}  {access}")
+        return "\n".join(lines)
+
+    def _get_edges_to(self, node, other_nodes: set) -> List[tuple]:
+        """
+        Return all P-edges (n1, n2, rel_uri) between node and other_nodes
+        """
+        res = []
+        for _, n2, rel_uri in self.P.out_edges(node, data="rel_uri"):
+            if n2 in other_nodes:
+                res.append((node, n2, rel_uri))
+        for n1, _, rel_uri in self.P.in_edges(node, data="rel_uri"):
+            if n1 in other_nodes and n1 != node:
+                res.append((n1, node, rel_uri))
+        return res
+
+    def subgraph_monomorphisms_iter(self, G: nx.MultiDiGraph):
+        """
+        Iterate over all matches (dicts like {G-node: P-node}).
+        """
+        if len(self.P) == 0:
+            return
+        yield from self._match(G, 0, {}, {})
+
+    def _match(self, G: nx.MultiDiGraph, step_idx: int, mapping: dict, inv_mapping: dict):
+        step = self.plan[step_idx]
+        node = step.node
+        P_node_data = self.P.nodes[node]
+
+        # sorting the candidates ensures that the matches are generated in the lexicographic order of their G-nodes
+        # (see RuleApplicatorWorker.iter_result_maps)
+        candidates = sorted(c for c in self._get_candidates(G, step, mapping) if c is not None)
+        for candidate in candidates:
+            if candidate in inv_mapping or candidate not in G:
+                continue
+            if not self.node_match(G.nodes[candidate], P_node_data):
+                continue
+
+            mapping[node] = candidate
+            if (
+                all(mapping[n1] < mapping[n2] for n1, n2 in step.order_checks)
+                and self._check_edges(G, step.checks, mapping)
+                and self._check_conditions(G, step.conditions, mapping)
+            ):
+                inv_mapping[candidate] = node
+                if step_idx == len(self.plan) - 1:
+                    yield {g_node: p_node for p_node, g_node in mapping.items()}
+                else:
+                    yield from self._match(G, step_idx + 1, mapping, inv_mapping)
+                inv_mapping.pop(candidate)
+            mapping.pop(node)
+
+    def _check_edges(self, G: nx.MultiDiGraph, edges: List[tuple], mapping: dict) -> bool:
+        for n1, n2 in edges:
+            G_edge_data = G.adj[mapping[n1]].get(mapping[n2])
+            if G_edge_data is None or not self.edge_match(G_edge_data, self.P.adj[n1][n2]):
+                return False
+        return True
+
+    def _check_conditions(self, G: nx.MultiDiGraph, conditions: List[tuple], mapping: dict) -> bool:
+        for cond_func, node_tuple in conditions:
+            args = [self._get_node_value(G, mapping[node]) for node in node_tuple]
+            try:
+                if not cond_func(*args):
+                    return False
+            except Exception:
+                # keep the match; the function is evaluated again (see RuleApplicatorWorker._process_result_map)
+                pass
+        return True
+
+    @staticmethod
+    def _get_node_value(G: nx.MultiDiGraph, G_node: str):
+        """
+        Return the entity or the literal value of a node of G
+        """
+        node_data = G.nodes[G_node]
+        if node_data["is_literal"]:
+            return node_data["value"]
+        return node_data["itm"]
+
+    def _get_candidates(self, G: nx.MultiDiGraph, step: Container, mapping: dict):
+        """
+        Return an iterable of G-nodes which might be mapped to the P-node of this step (superset of the actual
+        candidates)
+        """
+        node = step.node
+        if node in self.fixed_nodes:
+            return (self.fixed_nodes[node],)
+
+        if step.anchor is None:
+            return self._get_unbound_candidates(G, node)
+
+        n1, n2, rel_uri = step.anchor
+        if n1 == node:
+            # node is the subject of the anchor edge
+            bound_node = mapping[n2]
+            adjacency = G.pred[bound_node] if bound_node in G else {}
+        else:
+            # node is the object of the anchor edge
+            bound_node = mapping[n1]
+            adjacency = G.succ[bound_node] if bound_node in G else {}
+        if rel_uri == wildcard_relation_uri:
+            return list(adjacency)
+        # note: the candidates are taken from G (and not from the indexes of the data store) because the consequences
+        # of earlier matches are applied while the matches are generated (G does not change during the application)
+        return [
+            G_node
+            for G_node, edge_dict in adjacency.items()
+            if any(edge_data["rel_uri"] == rel_uri for edge_data in edge_dict.values())
+        ]
+
+    def _get_unbound_candidates(self, G: nx.MultiDiGraph, node):
+        """
+        Return candidates for a node which has no edges to bound nodes (first node of a component)
+        """
+
+        # use the incident edge whose relation has the smallest number of distinct subjects (or objects)
+        _, option = self._estimate_unbound_candidates(node)
+        if option is None:
+            return list(G.nodes)
+
+        is_subject, rel_uri = option
+        statistics: RelationStatistics = G.graph.get("statistics")
+        if statistics is not None:
+            # the statistics of G are updated together with G (see ReasoningGraph)
+            counts = statistics.subject_counts if is_subject else statistics.object_counts
+            return list(counts.get(rel_uri, ()))
+
+        idx = 0 if is_subject else 1
+        return dict.fromkeys(edge[idx] for edge in G.edges(data="rel_uri") if edge[2] == rel_uri)
+
+
+def _get_relation_label(rel_uri: str) -> str:
+    rel = core.ds.get_entity_by_uri(rel_uri, strict=False)
+    if rel is None:
+        return rel_uri
+    return f"{rel.short_key}[{rel.R1}]"
+
+
 wildcard_relation_uri = bi.R58["wildcard relation"].uri
 
 
@@ -1326,6 +3730,9 @@ class ReportingRuleResult(core.RuleResult):
             self.explanation_text_template = None
         self.raw_result_count = raw_result_count
 
+        # True if not all matches have been processed (see RuleApplicator.match_limit)
+        self.match_limit_reached = False
+
     @classmethod
     def get_new_instance(cls: type, res: core.RuleResult):
         """
@@ -1442,6 +3849,10 @@ class ReportingMultiRuleResult(ReportingRuleResult):
 
         super().__init__(raworker=None)
 
+        # only used by apply_rules_until_fixpoint
+        self.round_stats: List[Container] = []
+        self.stop_reason = None
+
     @property
     def rule(self):
         # for this class a single rule attribute is not meaningful
@@ -1580,153 +3991,254 @@ def get_simple_properties(item: core.Item) -> dict:
     return res
 
 
-class AlgorithmicRuleApplicationWorker:
+class AggregationRule:
     """
-    This class executes algorithmic rules.
+    Declarative description of an aggregation rule (alternative to a graph premise for conditions like "a person has
+    four negative statements of the same kind"). The statements of the considered predicates are grouped by
+    (subject, predicate); every group whose number of (filtered) objects fulfills the count condition is a match.
+
+    An aggregation rule is described by statements in the premise scope of a rule item (see
+    _rule__CM.new_aggregation); it is created by RuleApplicator.compile_aggregation_rule. The rule is evaluated by one pass over the statements of every predicate
+    (see AlgorithmicRuleApplicationWorker.apply_aggregation_rule).
     """
 
-    def __init__(self):
-        # simple hack
-        self.parent = Container(rule=None)
+    group_argument_names = ("subject", "predicate", "objects")
 
-    @staticmethod
-    def hardcoded_I810(zb, consequent_function: callable):
+    def __init__(
+        self,
+        consequent_function: callable,
+        predicates: List[core.Relation] = None,
+        predicate_relation: core.Relation = None,
+        predicate_relation_object=None,
+        excluded_predicates: List[core.Relation] = None,
+        subject_class: core.Item = None,
+        subject_filter: callable = None,
+        object_filter: callable = None,
+        min_count: int = 1,
+        max_count: int = None,
+        consequent_args: tuple = (),
+        group_arguments: tuple = group_argument_names,
+        group_count: int = None,
+    ):
         """
-        Convert 4 negative facts into one positive fact
+        :param consequent_function:         callable which is called for every matching group like
+                                            `consequent_function(*consequent_args, *<group arguments>)`
+        :param predicates:                  list of relations whose statements are grouped
+        :param predicate_relation:          alternative to `predicates`: use the subjects of the statements of this
+                                            relation (evaluated when the rule is applied)
+        :param predicate_relation_object:   optional; only consider statements of `predicate_relation` with this
+                                            object
+        :param excluded_predicates:         optional list of relations which are not considered
+        :param subject_class:               optional; only consider subjects which are direct instances of this class
+        :param subject_filter:              optional callable (subject) -> bool
+        :param object_filter:               optional callable (object) -> bool
+        :param min_count:                   minimum number of objects of a matching group
+        :param max_count:                   maximum number of objects of a matching group (None means: no limit)
+        :param consequent_args:             tuple of arguments which are passed to the consequent function
+        :param group_arguments:             names of the group data which are passed to the consequent function
+                                            (subset of ("subject", "predicate", "objects"), the objects are passed
+                                            as separate arguments)
+        :param group_count:                 optional; if passed, the consequent function is called only once (without
+                                            group arguments) if the number of matching groups is equal to this value
         """
-        t0 = time.time()
 
-        # in the future this logic will be parsed from the graph
-        h_list = p.get_direct_instances_of(zb.I7435["human"])
-        rel_list = p.ds.get_subjects_for_relation(zb.R6020["is opposite of functional activity"].uri)
-        result_filters = [p.is_relevant_item]
-        result_conditions = [lambda res: len(res) == 4]
-
-        result_list = []
-        for subj, pred in it.product(h_list, rel_list):
-            tmp_res_list = subj.get_relations(pred.uri, return_obj=True)
-
-            for rf in result_filters:
-                tmp_res_list = [res for res in tmp_res_list if p.is_relevant_item(res)]
+        if (predicates is None) == (predicate_relation is None):
+            msg = "Exactly one of `predicates` and `predicate_relation` has to be passed."
+            raise core.aux.SemanticRuleError(msg)
+        if min_count < 1 or (max_count is not None and max_count < min_count):
+            msg = f"Invalid count condition: min_count={min_count}, max_count={max_count}"
+            raise core.aux.SemanticRuleError(msg)
+        if unknown_names := set(group_arguments).difference(self.group_argument_names):
+            msg = f"Unknown group arguments: {unknown_names}"
+            raise core.aux.SemanticRuleError(msg)
 
-            for cond_func in result_conditions:
-                if not cond_func(tmp_res_list):
-                    break
-            else:
-                # all conditions are met
-                result_list.append((subj, pred, *tmp_res_list))
+        self.consequent_function = consequent_function
+        self.predicates = predicates
+        self.predicate_relation = predicate_relation
+        self.predicate_relation_object = predicate_relation_object
+        self.excluded_predicates = excluded_predicates or []
+        self.subject_class = subject_class
+        self.subject_filter = subject_filter
+        self.object_filter = object_filter
+        self.min_count = min_count
+        self.max_count = max_count
+        self.consequent_args = tuple(consequent_args)
+        self.group_arguments = tuple(group_arguments)
+        self.group_count = group_count
+
+    def get_predicates(self) -> List[core.Relation]:
+        if self.predicates is not None:
+            predicates = self.predicates
+        else:
+            filter_obj = self.predicate_relation_object
+            predicates = core.ds.get_subjects_for_relation(self.predicate_relation.uri, filter=filter_obj)
 
-        # raworker=self, raw_result_count=len(result_list)
-        final_result = ReportingRuleResult(raworker=None)
-        final_result.apply_time = time.time() - t0
-        for args in result_list:
-            cfr = consequent_function(None, *args)
+        excluded_uris = {rel.uri for rel in self.excluded_predicates}
 
-            # TODO: add result.extend_with_binding_info(cfr, res_dict), see above
-            final_result.extend_with_binding_info(cfr, {})
-        return final_result
+        # remove duplicates (several statements might have the same subject) but keep the order
+        res = {}
+        for pred in predicates:
+            if pred.uri not in excluded_uris:
+                res.setdefault(pred.uri, pred)
+        return list(res.values())
 
-    @staticmethod
-    def hardcoded_I830(zb, consequent_function: callable, *args):
-        """
-        Raise exception if one person is different from more than 4 non-placeholder persons
-        """
-        t0 = time.time()
+    def is_matching_count(self, count: int) -> bool:
+        return count >= self.min_count and (self.max_count is None or count <= self.max_count)
 
-        # in the future this logic will be parsed from the graph
-        h_list = p.get_direct_instances_of(
-            zb.I7435["human"], filter=lambda itm: not itm.R20__has_defining_scope
-        )
-        rel_list = [p.R50["is different from"]]
 
-        # filter out R57__is_placeholder items
-        result_filters = [p.is_relevant_item]
-        result_conditions = [lambda res: len(res) > 4]
+def combine_filters(filters: List[callable]) -> Optional[callable]:
+    """
+    Return a callable which is True if all filters are True (or None if there are no filters)
+    """
+    if not filters:
+        return None
+    if len(filters) == 1:
+        return filters[0]
+    return lambda arg: all(func(arg) for func in filters)
 
-        result_list = []
-        for subj, pred in it.product(h_list, rel_list):
-            tmp_res_list = subj.get_relations(pred.uri, return_obj=True)
 
-            for rf in result_filters:
-                tmp_res_list = [res for res in tmp_res_list if rf(res)]
+def get_aggregation_anchor(rule: core.Item) -> Optional[core.Item]:
+    """
+    Return the aggregation anchor item of the premise of the rule (see _rule__CM.new_aggregation) or None
+    """
+    premise_scope = getattr(rule, "scp__premise", None)
+    if premise_scope is None:
+        return None
+    for itm in premise_scope.get_inv_relations("R20__has_defining_scope", return_subj=True):
+        if isinstance(itm, core.Item) and getattr(itm, "R4__is_instance_of", None) == p.I64["aggregation anchor"]:
+            return itm
+    return None
 
-            for cond_func in result_conditions:
-                if not cond_func(tmp_res_list):
-                    break
-            else:
-                # all conditions are met
-                result_list.append((subj, pred, *tmp_res_list))
 
-        final_result = p.core.RuleResult()
+def is_algorithmic_rule(rule: core.Item) -> bool:
+    """
+    Return True if the rule is not evaluated by a premise graph but by an algorithm (aggregation rule or hardcoded
+    experimental query)
+    """
+    return bool(getattr(rule, "cheat", None) or get_aggregation_anchor(rule))
 
-        for result_args in result_list:
-            assert len(args) == 1  # this is like ("{} has too many `R50__is_different_from` statements",)
-            tmp_res = consequent_function(None, *args, result_args[0])
 
-            # TODO: add result.extend_with_binding_info(cfr, res_dict), see above
-            final_result.extend(tmp_res)
+class AlgorithmicRuleApplicationWorker:
+    """
+    This class executes algorithmic rules.
+    """
 
-        final_result.apply_time = time.time() - t0
-        return final_result
+    def __init__(self):
+        # simple hack
+        self.parent = Container(rule=None)
 
-    @staticmethod
-    def hardcoded_I840(zb, consequent_function: callable, *args):
-        t0 = time.time()
+    def get_aggregation_groups(self, aggregation: AggregationRule) -> List[Tuple[core.Entity, core.Relation, list]]:
+        """
+        Return the list of matching groups like [(subject, predicate, [obj1, ...]), ...] (ordered by subject and
+        predicate). Every predicate is processed by one pass over its statements.
+        """
 
-        h_list = p.get_direct_instances_of(zb.I7435["human"], filter=p.is_relevant_item)
-        rel_list = p.ds.get_subjects_for_relation(zb.R2850["is functional activity"].uri, filter=True)
+        # {subject_uri: <position>, ...} (determines the order of the result)
+        if aggregation.subject_class is not None:
+            subjects = aggregation.subject_class.get_inv_relations("R4__is_instance_of", return_subj=True)
+            subject_positions = {subj.uri: i for i, subj in enumerate(subjects)}
+        else:
+            subject_positions = {}
+
+        # {subject_uri: <bool>, ...}
+        subject_flags = {}
+
+        # {(subject_uri, predicate_idx): (subject, predicate, [obj1, ...]), ...}
+        groups = {}
+        for pred_idx, pred in enumerate(aggregation.get_predicates()):
+            for stm in core.ds.relation_statements.get(pred.uri, ()):
+                subj = stm.subject
+                if not isinstance(subj, core.Entity):
+                    # qualifier statement
+                    continue
 
-        # filter out the two person-person-activities (TODO: test if this is necessary)
-        # otherwise we would have 7 statements per person
-        rel_list = [
-            r
-            for r in rel_list
-            if r not in (zb.R2353["lives immediately right of"], zb.R8768["lives immediately left of"])
-        ]
+                flag = subject_flags.get(subj.uri)
+                if flag is None:
+                    if aggregation.subject_class is not None:
+                        flag = subj.uri in subject_positions
+                    else:
+                        flag = True
+                        subject_positions.setdefault(subj.uri, len(subject_positions))
+                    flag = flag and (aggregation.subject_filter is None or bool(aggregation.subject_filter(subj)))
+                    subject_flags[subj.uri] = flag
+                if not flag:
+                    continue
 
-        result_filters = [p.is_relevant_item]
-        result_conditions = [lambda res: len(res) == 1]
+                obj = stm.object
+                if aggregation.object_filter is not None and not aggregation.object_filter(obj):
+                    continue
 
-        result_list = []
-        for subj, pred in it.product(h_list, rel_list):
-            tmp_res_list = subj.get_relations(pred.uri, return_obj=True)
+                group = groups.get((subj.uri, pred_idx))
+                if group is None:
+                    group = groups[(subj.uri, pred_idx)] = (subj, pred, [])
+                group[2].append(obj)
 
-            for rf in result_filters:
-                tmp_res_list = [res for res in tmp_res_list if rf(res)]
+        def get_sort_key(group_key):
+            subj_uri, pred_idx = group_key
+            return subject_positions[subj_uri], pred_idx
 
-            for cond_func in result_conditions:
-                if not cond_func(tmp_res_list):
-                    break
-            else:
-                # all conditions are met
-                result_list.append((subj, pred, *tmp_res_list))
+        res = []
+        for group_key in sorted(groups, key=get_sort_key):
+            group = groups[group_key]
+            if aggregation.is_matching_count(len(group[2])):
+                res.append(group)
+        return res
 
-        if len(result_list) == 25:
-            # raise the respective success-exception
-            consequent_function(None, *args)
+    def apply_aggregation_rule(self, aggregation: AggregationRule) -> "ReportingRuleResult":
+        """
+        Call the consequent function of the aggregation rule for the matching groups (see get_aggregation_groups)
+        """
+        t0 = time.time()
+        groups = self.get_aggregation_groups(aggregation)
+
+        final_result = ReportingRuleResult(raworker=None, raw_result_count=len(groups))
+        if aggregation.group_count is not None:
+            if len(groups) == aggregation.group_count:
+                cfr = aggregation.consequent_function(*aggregation.consequent_args)
+                if cfr is not None:
+                    final_result.extend(cfr)
+        else:
+            for subj, pred, objs in groups:
+                group_data = {"subject": (subj,), "predicate": (pred,), "objects": tuple(objs)}
+                args = [arg for name in aggregation.group_arguments for arg in group_data[name]]
+                cfr = aggregation.consequent_function(*aggregation.consequent_args, *args)
+                if cfr is not None:
+                    final_result.extend_with_binding_info(cfr, {})
 
-        final_result = p.core.RuleResult()
         final_result.apply_time = time.time() - t0
-        final_result.dbg = result_list
-
         return final_result
 
-    def get_single_predicate_report(self, pred):
+    @staticmethod
+    def _get_subject_and_object_items(pred: core.Relation) -> Tuple[list, list]:
         subj_type = pred.R8__has_domain_of_argument_1[0]
         obj_type = pred.R11__has_range_of_result[0]
 
         subj_items = subj_type.R51__instances_are_from[0].R39__has_element
         obj_items = obj_type.R51__instances_are_from[0].R39__has_element
+        return subj_items, obj_items
 
-        all_combination_tuples = [tuple(zip(subj_items, perm)) for perm in list(it.permutations(obj_items))]
-        # list like [((A, X), (B, Y), (C, Z)), ((A, Y), (B, X), (C, Z)), ...]
-
-        possible_combination_tuples = []
+    @staticmethod
+    def _get_opposite_predicate(pred: core.Relation) -> Optional[core.Relation]:
         pred_opposite_list = p.ds.get_subjects_for_relation(p.R43["is opposite of"].uri, filter=pred)
         if not pred_opposite_list:
+            return None
+        return pred_opposite_list[0]
+
+    def get_single_predicate_report(self, pred):
+        """
+        Enumerate all combinations of subject-object-pairs (permutations of the objects) which do not contradict an
+        opposite statement. Note: the effort grows with n! (see get_single_predicate_domains for an alternative).
+        """
+        subj_items, obj_items = self._get_subject_and_object_items(pred)
+
+        pred_opposite = self._get_opposite_predicate(pred)
+        if pred_opposite is None:
             return []
-        pred_opposite = pred_opposite_list[0]
 
+        all_combination_tuples = [tuple(zip(subj_items, perm)) for perm in list(it.permutations(obj_items))]
+        # list like [((A, X), (B, Y), (C, Z)), ((A, Y), (B, X), (C, Z)), ...]
+
+        possible_combination_tuples = []
         for comb_tup in all_combination_tuples:
             for subj, obj in comb_tup:
                 if obj in subj.get_relations(pred_opposite.uri, return_obj=True):
@@ -1741,11 +4253,44 @@ class AlgorithmicRuleApplicationWorker:
 
         return possible_combination_tuples
 
-    def get_predicates_report(self, predicate_list):
+    def get_single_predicate_domains(self, pred) -> Optional[Dict[str, list]]:
+        """
+        Determine for every subject the objects which are possible in at least one combination of subject-object-pairs
+        (without enumerating the combinations): the initial domains exclude the objects of opposite statements, then
+        the all-different constraint is propagated (see propagate_all_different).
+
+        :returns:   dict like {subj_uri: [obj1, ...], ...} or None if the number of subjects and objects differ
+        """
+        subj_items, obj_items = self._get_subject_and_object_items(pred)
+        if len(subj_items) != len(obj_items):
+            return None
+        pred_opposite = self._get_opposite_predicate(pred)
+
+        domains = {}
+        for subj in subj_items:
+            excluded_uris = {obj.uri for obj in subj.get_relations(pred_opposite.uri, return_obj=True)}
+            domains[subj.uri] = [obj for obj in obj_items if obj.uri not in excluded_uris]
+        return propagate_all_different(domains)
+
+    @staticmethod
+    def _get_domains_from_combinations(combination_tuples: list) -> Dict[str, list]:
+        tmp_def_dict = defaultdict(dict)
+        for comb_tup in combination_tuples:
+            for subj, _, obj in comb_tup:
+                tmp_def_dict[subj.uri][obj.uri] = obj
+        return {subj_uri: list(obj_dict.values()) for subj_uri, obj_dict in tmp_def_dict.items()}
+
+    def get_predicates_report(self, predicate_list, enumerate_combinations=False):
         """
         Gather data for each relevant predicate how many possibilities of subject-object-pairs exist, which do
         not contradict an `oppo_pred`-statement, where `oppo_pred` is 'R43__is_opposite_of' the considered predicate.
         ("oppo" means opposite)
+
+        :param predicate_list:          list of relations
+        :param enumerate_combinations:  if True, the combinations are enumerated (see get_single_predicate_report)
+                                        and stored as `pred_report[pred.uri]`; by default the possibilities are
+                                        determined by constraint propagation and counting (see
+                                        get_single_predicate_domains)
         """
 
         pred_report = Container()
@@ -1755,39 +4300,131 @@ class AlgorithmicRuleApplicationWorker:
         pred_report.predicates = []
         pred_report.stable_candidates = Container()
         pred_report.hypothesis_candidates = []
+
+        # {pred_uri: {subj_uri: [obj1, ...], ...}, ...}
+        pred_report.domains = Container()
         for pred in predicate_list:
-            possible_combination_tuples = self.get_single_predicate_report(pred)
-            if len(possible_combination_tuples) == 0:
+            if self._get_opposite_predicate(pred) is None:
                 continue
-            pred_report[pred.uri] = possible_combination_tuples
-            pred_report.counters.append(len(possible_combination_tuples))
-            pred_report.predicates.append(pred)
-            pred_report.total_sum += len(possible_combination_tuples)
-            pred_report.total_prod *= len(possible_combination_tuples)
 
-            # find (subject, object)-pairs which are stable among all combinations
+            domains = None if enumerate_combinations else self.get_single_predicate_domains(pred)
+            if domains is None:
+                possible_combination_tuples = self.get_single_predicate_report(pred)
+                domains = self._get_domains_from_combinations(possible_combination_tuples)
+                count = len(possible_combination_tuples)
+            else:
+                possible_combination_tuples = None
+                count = count_all_different_solutions(domains)
 
-            # pred_report.stable_candidates[pred.uri] = defaultdict(dict)
-            tmp_def_dict = defaultdict(dict)
-            for comb_tup in possible_combination_tuples:
-                for subj, _, obj in comb_tup:
-                    tmp_def_dict[subj.uri][obj.uri] = 1
+            if count == 0:
+                continue
+            if possible_combination_tuples is not None:
+                pred_report[pred.uri] = possible_combination_tuples
+            pred_report.domains[pred.uri] = domains
+            pred_report.counters.append(count)
+            pred_report.predicates.append(pred)
+            pred_report.total_sum += count
+            pred_report.total_prod *= count
 
+            # find (subject, object)-pairs which are stable among all combinations
             pred_report.stable_candidates[pred.uri] = []
-            for sub_uri, obj_dict in tmp_def_dict.items():
-                pred_report.stable_candidates[pred.uri].append((len(obj_dict), sub_uri))
+            for sub_uri, objs in domains.items():
+                pred_report.stable_candidates[pred.uri].append((len(objs), sub_uri))
 
                 # store a list which allows easy access to remaining possibilities
                 tmp_list = [
-                    len(obj_dict),
-                    Container(pred=pred.uri, subj=sub_uri, objs=tuple(obj_dict.keys())),
+                    len(objs),
+                    Container(pred=pred.uri, subj=sub_uri, objs=tuple(obj.uri for obj in objs)),
                 ]
                 pred_report.hypothesis_candidates.append(tmp_list)
 
+        # the candidates with the smallest domains are the preferred branching variables
         pred_report.hypothesis_candidates.sort(key=lambda elt: elt[0])
         return pred_report
 
 
+def propagate_all_different(domains: Dict[str, list]) -> Dict[str, list]:
+    """
+    Remove all values which are not part of any solution of the all-different constraint over the given variables
+    (generalized arc consistency): a value is kept if the corresponding edge belongs to some maximum matching of the
+    variable-value-graph. This is decided via one matching and the strongly connected components (Régin 1994).
+
+    :param domains:     dict like {var_key: [entity1, ...], ...}
+    :returns:           dict with the reduced domains (same order); all domains are empty if there is no solution
+    """
+    var_nodes = [("var", key) for key in domains]
+    graph = nx.Graph()
+    graph.add_nodes_from(var_nodes)
+    for key, values in domains.items():
+        for value in values:
+            graph.add_edge(("var", key), ("value", value.uri))
+
+    matching = nx.bipartite.hopcroft_karp_matching(graph, top_nodes=var_nodes)
+    if any(node not in matching for node in var_nodes):
+        return {key: [] for key in domains}
+
+    # orientation: matching edges from variable to value, other edges from value to variable
+    digraph = nx.DiGraph()
+    digraph.add_nodes_from(graph)
+    for var_node, value_node in graph.edges():
+        if var_node[0] != "var":
+            var_node, value_node = value_node, var_node
+        if matching[var_node] == value_node:
+            digraph.add_edge(var_node, value_node)
+        else:
+            digraph.add_edge(value_node, var_node)
+
+    # values which are reachable from a free value lie on an even alternating path
+    reachable = set()
+    for node in digraph:
+        if node[0] == "value" and node not in matching and node not in reachable:
+            reachable.add(node)
+            reachable.update(nx.descendants(digraph, node))
+
+    components = {}
+    for i, component in enumerate(nx.strongly_connected_components(digraph)):
+        for node in component:
+            components[node] = i
+
+    res = {}
+    for key, values in domains.items():
+        var_node = ("var", key)
+        res[key] = [
+            value
+            for value in values
+            if matching[var_node] == ("value", value.uri)
+            or components[var_node] == components[("value", value.uri)]
+            or ("value", value.uri) in reachable
+        ]
+    return res
+
+
+def count_all_different_solutions(domains: Dict[str, list]) -> int:
+    """
+    Return the number of solutions of the all-different constraint over the given variables (i.e. the number of
+    perfect matchings) via dynamic programming over the sets of used values.
+
+    :param domains:     dict like {var_key: [entity1, ...], ...}
+    """
+
+    # {value_uri: <bit>, ...}
+    value_bits = {}
+
+    # {<bitmask of used values>: <number of partial solutions>}
+    counts = {0: 1}
+
+    # variables with small domains first (keeps the number of bitmasks small)
+    for values in sorted(domains.values(), key=len):
+        new_counts = defaultdict(int)
+        for mask, count in counts.items():
+            for value in values:
+                bit = value_bits.setdefault(value.uri, 1 << len(value_bits))
+                if not mask & bit:
+                    new_counts[mask | bit] += count
+        counts = new_counts
+    return sum(counts.values())
+
+
 class HypothesisReasoner:
     uri_suffix = "HYPOTHESIS"
 
@@ -1800,7 +4437,20 @@ class HypothesisReasoner:
         keymanager = p.KeyManager()
         p.register_mod(self.context_uri, keymanager, check_uri=False)
 
-    def hypothesis_reasoning_step(self, rule_list):
+    def hypothesis_reasoning_step(self, rule_list, processes: int = None) -> Container:
+        """
+        Choose the hypothesis candidate with the smallest domain (see get_predicates_report) and test the
+        possible objects (one hypothesis per object) by applying the rules until fixpoint.
+
+        :param rule_list:   rules which are applied to test a hypothesis
+        :param processes:   optional number of worker processes; if passed, the hypotheses are tested concurrently
+                            in forked processes (copy-on-write copies of the data store). The first hypothesis which
+                            leads to ReasoningGoalReached wins; it is tested again in this process (replay) because the
+                            changes of the workers are lost.
+
+        :returns:           Container with `.stm_triples`, `.outcomes` (one entry per tested hypothesis: "goal",
+                            "contradiction", "open", "error" or None if it was not tested) and `.reasoning_results`
+        """
         # generate hypothesis
         araw = AlgorithmicRuleApplicationWorker()
         func_act_list = p.ds.get_subjects_for_relation(
@@ -1825,30 +4475,95 @@ class HypothesisReasoner:
         result.stm_triples = [(subj, pred, obj) for obj in objs]
         result.reasoning_results = []
 
-        # currently the good solution is the first by accident.
-        # TODO: test the other direction
-
-        for subj, pred, obj in result.stm_triples[1:]:
-            # test the consequences of an hypothesis inside an isolated module (which can be deleted if it failed)
-            self.register_module()
-            with p.uri_context(uri=self.context_uri):
-                stm = subj.set_relation(pred, obj)
-                k = 0
-                if VERBOSITY:
-                    print("\n" * 2, "    Assuming", stm, "and testing\n\n")
-                while True:
-                    k += 1
-                    # TODO: this might provoke a FunctionalRelationError in case of wrong hypothesis
-                    res = apply_semantic_rules(*rule_list)
-                    if res.exception or not res.new_statements:
+        # note: all objects are tested (the candidates whose object is already fixed are skipped above)
+        hypotheses = result.stm_triples
+        result.outcomes = [None] * len(hypotheses)
+
+        if processes is not None and len(hypotheses) > 1 and ParallelRuleMatcher.is_available():
+            self._test_hypotheses_in_parallel(hypotheses, rule_list, processes, result)
+            return result
+
+        for idx, stm_triple in enumerate(hypotheses):
+            res = self.test_hypothesis(stm_triple, rule_list)
+            result.outcomes[idx] = self._get_outcome(res)
+            if result.outcomes[idx] == "goal":
+                print(p.aux.bgreen("puzzle solved"))
+                result.reasoning_results.append(res)
+                break  # break the for loop
+
+            if result.outcomes[idx] == "contradiction":
+                print(p.aux.byellow("This hypothesis led to a contradiction:"), stm_triple)
+
+            # delete all statements from this context (the module was registered without loading a file); this also
+            # holds for open hypotheses (they must not influence the test of the next hypothesis)
+            p.unload_mod(self.context_uri, strict=False)
+        return result
+
+    def test_hypothesis(self, stm_triple: tuple, rule_list) -> "ReportingMultiRuleResult":
+        """
+        Test the consequences of an hypothesis inside an isolated module (which can be deleted if it failed)
+        """
+        subj, pred, obj = stm_triple
+        self.register_module()
+        with p.uri_context(uri=self.context_uri):
+            stm = subj.set_relation(pred, obj)
+            if VERBOSITY:
+                print("\n" * 2, "    Assuming", stm, "and testing\n\n")
+            # TODO: this might provoke a FunctionalRelationError in case of wrong hypothesis
+            res = apply_rules_until_fixpoint(rule_list)
+        return res
+
+    @staticmethod
+    def _get_outcome(res: core.RuleResult) -> str:
+        if isinstance(res.exception, p.core.aux.ReasoningGoalReached):
+            return "goal"
+        if isinstance(res.exception, p.core.aux.LogicalContradiction):
+            return "contradiction"
+        return "open"
+
+    def _test_hypotheses_in_parallel(self, hypotheses: List[tuple], rule_list, processes: int, result: Container):
+        global _hypothesis_jobs
+
+        winner_idx = None
+        _hypothesis_jobs = [(self, stm_triple, rule_list) for stm_triple in hypotheses]
+        try:
+            # maxtasksperchild=1: every hypothesis is tested in a fresh copy of this process (a worker process keeps
+            # the changes of its previous hypothesis)
+            pool = multiprocessing.get_context("fork").Pool(min(processes, len(hypotheses)), maxtasksperchild=1)
+            with pool:
+                for job_idx, outcome in pool.imap_unordered(_run_hypothesis_job, range(len(hypotheses))):
+                    result.outcomes[job_idx] = outcome
+                    if outcome == "goal":
+                        # leaving the with-block terminates the remaining workers
+                        winner_idx = job_idx
                         break
-                if isinstance(res.exception, p.core.aux.ReasoningGoalReached):
-                    print(p.aux.bgreen("puzzle solved"))
-                    result.reasoning_results.append(res)
-                    break  # break the for loop
+        finally:
+            _hypothesis_jobs = []
 
-            if isinstance(res.exception, p.core.aux.LogicalContradiction):
-                print(p.aux.byellow("This hypothesis led to a contradiction:"), stm)
+        if winner_idx is None:
+            return
+
+        # replay the winning hypothesis in this process (the rule application is deterministic)
+        res = self.test_hypothesis(hypotheses[winner_idx], rule_list)
+        if self._get_outcome(res) == "goal":
+            print(p.aux.bgreen("puzzle solved"))
+        result.reasoning_results.append(res)
+
+
+# (reasoner, stm_triple, rule_list) tuples which are inherited by the forked worker processes
+# (see HypothesisReasoner._test_hypotheses_in_parallel)
+_hypothesis_jobs: List[tuple] = []
 
-                # delete all statements from this context
-                p.unload_mod(self.context_uri)
+
+def _run_hypothesis_job(job_idx: int) -> Tuple[int, str]:
+    """
+    Executed in a worker process: test one hypothesis and return its outcome (the changes are discarded with the
+    process)
+    """
+    reasoner, stm_triple, rule_list = _hypothesis_jobs[job_idx]
+    try:
+        res = reasoner.test_hypothesis(stm_triple, rule_list)
+    except Exception:
+        # e.g. FunctionalRelationError (wrong hypothesis)
+        return job_idx, "error"
+    return job_idx, reasoner._get_outcome(res)
@@ -402,16 +402,19 @@ def replace_dummy_entities_by_label(modpath):
     with open(modpath) as fp:
         txt = fp.read()
 
-    matches = list(pattern.finditer(txt))
-    for match in matches:
+    def replace_match(match):
         full_expr = match.group(1)  # the whole string like `p.I000["foo bar"]`
         label = match.group(2)  # only the label string "foo bar"
+
+        # this uses the label index of the data store (no linear search)
         entity = core.ds.get_item_by_label(label)
         if entity is None:
             print(f"could not find entity for label: {label}")
-            continue
-        new_expr = f'{entity.short_key}["{label}"]'
-        txt = txt.replace(full_expr, new_expr)
+            return full_expr
+        return f'{entity.short_key}["{label}"]'
+
+    # replace all matches in one pass
+    txt = pattern.sub(replace_match, txt)
 
     with open(modpath, "w") as fp:
         fp.write(txt)
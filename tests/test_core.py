@@ -124,14 +124,25 @@ class Test_00_Core(HousekeeperMixin, unittest.TestCase):
 
         km = p.KeyManager(minval=100, maxval=105)
 
-        self.assertEqual(km.key_reservoir, [103, 101, 100, 104, 102])
+        keys = [km.pop() for i in range(5)]
+        self.assertEqual(keys, [101, 102, 104, 103, 100])
 
-        k = km.pop()
-        self.assertEqual(k, 102)
+        # statement keys come from a separate reservoir
+        stm_keys = [km.pop_stm_key() for i in range(5)]
+        self.assertEqual(sorted(stm_keys), [100, 101, 102, 103, 104])
 
-        k = km.pop()
-        self.assertEqual(k, 104)
-        self.assertEqual(km.key_reservoir, [103, 101, 100])
+        # the key space is expanded if necessary
+        keys2 = [km.pop() for i in range(945)]
+        self.assertEqual(sorted(keys2), list(range(105, 1050)))
+        self.assertGreaterEqual(km.pop(), 1050)
+
+        # reproducibility
+        km2 = p.KeyManager(minval=100, maxval=105)
+        self.assertEqual([km2.pop() for i in range(50)], keys + keys2[:45])
+
+        # lazy key generation: a huge key space does not cost anything
+        km3 = p.KeyManager(minval=1000, maxval=10**15)
+        self.assertTrue(1000 <= km3.pop() < 10**15)
 
     def test_b4__uri_attr_of_entities(self):
 
@@ -832,6 +843,35 @@ class Test_01_Core(HousekeeperMixin, unittest.TestCase):
                 # I39 is not an instance -> error
                 p.is_instance_of(p.I39["positive integer"], p.I39["positive integer"])
 
+    def test_c09c__taxonomy_cache(self):
+        with p.uri_context(uri=TEST_BASE_URI):
+            cls1 = p.create_item(key_str="I9001", R1__has_label="test class 1", R4__is_instance_of=p.I2["Metaclass"])
+            cls2 = p.create_item(key_str="I9002", R1__has_label="test class 2", R3__is_subclass_of=cls1)
+            cls3 = p.create_item(key_str="I9003", R1__has_label="test class 3", R3__is_subclass_of=cls2)
+            i1 = p.instance_of(cls3)
+
+            self.assertTrue(p.is_instance_of(i1, cls1))
+            self.assertEqual(p.get_all_subclasses_of(cls1), [cls2, cls3])
+            self.assertIn(cls3.uri, p.ds.taxonomy_cache)
+            self.assertIn(cls1.uri, p.ds.subclasses_cache)
+
+            # changing the taxonomy invalidates the cached results of all affected entities
+            cls4 = p.create_item(key_str="I9004", R1__has_label="test class 4", R4__is_instance_of=p.I2["Metaclass"])
+            cls2.overwrite_statement("R3__is_subclass_of", cls4)
+
+        self.assertNotIn(cls3.uri, p.ds.taxonomy_cache)
+        self.assertNotIn(cls1.uri, p.ds.subclasses_cache)
+        self.assertFalse(p.is_instance_of(i1, cls1))
+        self.assertTrue(p.is_instance_of(i1, cls4))
+        self.assertTrue(p.is_subclass_of(cls3, cls4))
+        self.assertEqual(p.get_all_subclasses_of(cls1), [])
+        self.assertEqual(p.get_all_subclasses_of(cls4), [cls2, cls3])
+        self.assertEqual(p.get_taxonomy_tree(cls3)[:3], [(None, cls3), ("R3", cls2), ("R3", cls4)])
+
+        # the cached lists are not affected by changes of the returned lists
+        p.get_all_subclasses_of(cls4).clear()
+        self.assertEqual(p.get_all_subclasses_of(cls4), [cls2, cls3])
+
     def test_c10__qualifiers(self):
         _ = p.irkloader.load_mod_from_path(TEST_DATA_PATH2, prefix="ct")
         _ = p.irkloader.load_mod_from_path(TEST_DATA_PATH3, prefix="ag")
@@ -849,6 +889,36 @@ class Test_01_Core(HousekeeperMixin, unittest.TestCase):
         self.assertEqual(len(stm2.qualifiers), 1)
         self.assertEqual(len(stm2.dual_statement.qualifiers), 1)
 
+    def test_c10b__compact_statements(self):
+
+        with p.uri_context(uri=TEST_BASE_URI, prefix="ut"):
+            itm1 = p.instance_of(p.I1["general item"])
+            itm2 = p.instance_of(p.I1["general item"])
+            stm = itm1.set_relation(p.R16["has property"], itm2)
+
+        self.assertFalse(hasattr(stm, "__dict__"))
+        self.assertEqual((stm.subject, stm.predicate, stm.object), (itm1, p.R16, itm2))
+        self.assertEqual(stm.role, p.RelationRole.SUBJECT)
+        self.assertEqual(stm.corresponding_entity, itm2)
+
+        # the inverse statement is a view of the primary statement
+        (inv_stm,) = itm2.get_inv_relations("R16")
+        self.assertIsInstance(inv_stm, p.Statement)
+        self.assertIs(stm.dual_statement, inv_stm)
+        self.assertIs(inv_stm.dual_statement, stm)
+        self.assertEqual(inv_stm.role, p.RelationRole.OBJECT)
+        self.assertEqual(inv_stm.relation_tuple, stm.relation_tuple)
+        self.assertEqual(inv_stm.uri, stm.uri)
+        self.assertEqual(inv_stm.corresponding_entity, itm1)
+        self.assertIs(p.ds.statement_uri_map[inv_stm.uri], stm)
+
+        # unlinking the view unlinks the statement
+        inv_stm.unlink()
+        self.assertTrue(stm.unlinked)
+        self.assertEqual(itm1.get_relations("R16"), [])
+        self.assertEqual(itm2.get_inv_relations("R16"), [])
+        self.assertNotIn(stm.uri, p.ds.statement_uri_map)
+
     def test_c11__equation(self):
         mod1 = p.irkloader.load_mod_from_path(TEST_DATA_PATH2, prefix="ct")
 
@@ -980,6 +1050,38 @@ class Test_01_Core(HousekeeperMixin, unittest.TestCase):
             )
 
     @unittest.skipIf(os.environ.get("CI"), "Skipping visualization test on CI to prevent graphviz-dependency")
+    def test_c12c__process_key_str_cache(self):
+
+        pkey1 = p.process_key_str("R2__has_description")
+        self.assertEqual(pkey1.uri, p.R2.uri)
+
+        # repeated calls are served from the cache
+        self.assertIs(p.process_key_str("R2__has_description"), pkey1)
+
+        with p.uri_context(uri=TEST_BASE_URI, prefix="ut"):
+            # builtins serve as fallback
+            self.assertEqual(p.process_key_str("R2").uri, p.R2.uri)
+            self.assertEqual(p.process_key_str("ut__R2", check=False).uri, f"{TEST_BASE_URI}#R2")
+
+            # a new entity with the same short key must be found in the active module
+            rel = p.create_relation(key_str="R2", R1="some test relation")
+            self.assertEqual(p.process_key_str("R2").uri, rel.uri)
+
+            # changing the label affects the label check
+            self.assertEqual(p.process_key_str("R2__some_test_relation").uri, rel.uri)
+            rel.overwrite_statement("R1", "new label")
+            with self.assertRaises(ValueError):
+                p.process_key_str("R2__some_test_relation")
+            self.assertEqual(p.process_key_str("R2__new_label").uri, rel.uri)
+
+            p.core._unlink_entity(rel.uri, remove_from_mod=True)
+            self.assertEqual(p.process_key_str("R2").uri, p.R2.uri)
+
+        # outside of the context the builtin entity is found again and the prefix is unknown
+        self.assertEqual(p.process_key_str("R2").uri, p.R2.uri)
+        with self.assertRaises(p.UnknownPrefixError):
+            p.process_key_str("ut__R2", check=False)
+
     def test_c13__format_label(self):
         with p.uri_context(uri=TEST_BASE_URI):
             e1 = p.create_item(key_str="I0123", R1="1234567890")
@@ -1218,6 +1320,40 @@ class Test_01_Core(HousekeeperMixin, unittest.TestCase):
         res = p.get_relation_properties(I2000)
         self.assertEqual(res, [p.R22.uri])
 
+    def test_d06b__relation_property_flags(self):
+
+        self.assertTrue(p.R22["is functional"].is_functional)
+        self.assertTrue(p.R1["has label"].is_functional_for_each_language)
+        self.assertTrue(p.R1["has label"].has_literal_range)
+        self.assertTrue(p.R42["is symmetrical"].is_functional)
+        self.assertFalse(p.R4["is instance of"].is_symmetrical)
+
+        with p.uri_context(uri=TEST_BASE_URI, prefix="ut"):
+            R1000 = p.create_relation(R1__has_label="test relation", R42__is_symmetrical=True)
+
+            self.assertTrue(R1000.is_symmetrical)
+            self.assertFalse(R1000.is_functional)
+            self.assertFalse(R1000.is_transitive)
+            self.assertFalse(R1000.has_literal_range)
+
+            stm = R1000.set_relation(p.R60["is transitive"], True)
+            self.assertTrue(R1000.is_transitive)
+            self.assertEqual(p.get_relation_properties(R1000), [p.R42.uri, p.R60.uri])
+
+            stm.unlink()
+            self.assertFalse(R1000.is_transitive)
+            self.assertEqual(p.get_relation_properties(R1000), [p.R42.uri])
+
+            # a new relation property affects the (cached) relation properties of all relations
+            R1001 = p.create_relation(R1__has_label="test relation property")
+            R1000.set_relation(R1001, True)
+            self.assertEqual(p.get_relation_properties(R1000), [p.R42.uri])
+            R1001.set_relation(p.R62["is relation property"], True)
+            self.assertEqual(p.get_relation_properties(R1000), sorted([p.R42.uri, R1001.uri]))
+
+            R1000.set_relation(p.R22["is functional"], True)
+            self.assertTrue(R1000.is_functional)
+
     def test_d07__replace_statement(self):
 
         with p.uri_context(uri=TEST_BASE_URI, prefix="ut"):
@@ -1230,6 +1366,40 @@ class Test_01_Core(HousekeeperMixin, unittest.TestCase):
             itm.overwrite_statement("R4__is_instance_of", p.I2["Metaclass"])
         self.assertEqual(itm.R4__is_instance_of, p.I2["Metaclass"])
 
+    def test_d07b__relation_contents_cache(self):
+
+        with p.uri_context(uri=TEST_BASE_URI, prefix="ut"):
+            itm1 = p.instance_of(p.I1["general item"])
+            itm2 = p.instance_of(p.I1["general item"])
+            itm3 = p.instance_of(p.I1["general item"])
+            rel = p.create_relation(key_str=p.pop_uri_based_key("R"), R1="unit test relation")
+
+            self.assertEqual(itm1.R16, [])
+            stm1 = itm1.set_relation(p.R16["has property"], itm2)
+            self.assertEqual(itm1.R16, [itm2])
+
+            # changing the returned list does not affect the cache
+            itm1.R16.append(itm3)
+            self.assertEqual(itm1.R16, [itm2])
+
+            itm1.set_relation(p.R16["has property"], itm3)
+            self.assertEqual(itm1.R16, [itm2, itm3])
+            stm1.unlink()
+            self.assertEqual(itm1.R16, [itm3])
+
+            # the cached value depends on the functionality of the relation
+            itm1.set_relation(rel, itm2)
+            self.assertEqual(getattr(itm1, rel.short_key), [itm2])
+            rel.set_relation(p.R22["is functional"], True)
+            self.assertEqual(getattr(itm1, rel.short_key), itm2)
+
+            # the cached value depends on the language
+            r2_en = itm3.R2__has_description__en
+            self.assertEqual(itm3.R2__has_description__de, None)
+            itm3.set_relation(p.R2["has description"], p.Literal("bar", lang="de"))
+            self.assertEqual(itm3.R2__has_description__en, r2_en)
+            self.assertEqual(itm3.R2__has_description__de, p.Literal("bar", lang="de"))
+
     def test_d08__unlink_entities(self):
 
         with p.uri_context(uri=TEST_BASE_URI, prefix="ut"):
@@ -1244,6 +1414,66 @@ class Test_01_Core(HousekeeperMixin, unittest.TestCase):
             rep_str2 = repr(itm1)
             self.assertTrue(rep_str2.endswith('["!!unlinked: itm1"]>'))
 
+    def test_d08b__ordered_statement_containers(self):
+
+        with p.uri_context(uri=TEST_BASE_URI, prefix="ut"):
+            itm1 = p.instance_of(p.I1["general item"])
+            items = [p.instance_of(p.I1["general item"]) for i in range(5)]
+            stms = [itm1.set_relation(p.R16["has property"], itm) for itm in items]
+
+        stm_container = itm1.get_relations("R16")
+        self.assertIsInstance(stm_container, p.aux.OrderedSet)
+        self.assertEqual(stm_container, stms)
+        self.assertEqual(stm_container[1:3], stms[1:3])
+
+        # removal keeps the insertion order of the remaining elements
+        stms[1].unlink()
+        stms[3].unlink()
+        self.assertEqual(itm1.get_relations("R16"), [stms[0], stms[2], stms[4]])
+        self.assertEqual(itm1.R16, [items[0], items[2], items[4]])
+        self.assertNotIn(stms[1], p.ds.relation_statements[p.R16.uri])
+        self.assertEqual(items[1].get_inv_relations("R16"), [])
+
+        # removal during iteration is allowed
+        oset = p.aux.OrderedSet(range(5))
+        for elt in oset:
+            oset.remove(elt)
+        self.assertEqual(len(oset), 0)
+        with self.assertRaises(ValueError):
+            oset.remove(0)
+
+    def test_d08c__unload_mod_without_empty_buckets(self):
+
+        def index_snapshot():
+            return (
+                {uri: {rel_uri: len(stms) for rel_uri, stms in dct.items()} for uri, dct in p.ds.statements.items()},
+                {uri: {rel_uri: len(stms) for rel_uri, stms in dct.items()} for uri, dct in p.ds.inv_statements.items()},
+                {rel_uri: len(stms) for rel_uri, stms in p.ds.relation_statements.items()},
+            )
+
+        snapshot1 = index_snapshot()
+
+        with p.uri_context(uri=TEST_BASE_URI, prefix="ut"):
+            R301 = p.create_relation(R1__has_label="test relation")
+            itm1 = p.instance_of(p.I1["general item"])
+            itm2 = p.instance_of(p.I1["general item"])
+            itm1.set_relation(R301, itm2, qualifiers=[p.qff_has_rule_ptg_mode(1)])
+            itm1.set_relation(p.R16["has property"], p.I2["Metaclass"])
+
+            # reading must not create any buckets
+            p.I3["Field of science"].get_relations("R16")
+            p.I3["Field of science"].get_inv_relations("R16")
+
+        # unlinking a statement deletes the buckets which became empty
+        stm = itm1.get_relations("R16")[0]
+        stm.unlink()
+        self.assertNotIn(p.R16.uri, p.ds.statements[itm1.uri])
+        self.assertNotIn(itm1.uri, p.ds.inv_statements[p.I2.uri].get(p.R16.uri, []))
+
+        p.unload_mod(TEST_BASE_URI, strict=False)
+        self.assertEqual(index_snapshot(), snapshot1)
+        self.assertNotIn(TEST_BASE_URI, p.ds.entities_created_in_mod)
+
     def test_d09__raise_invalid_scope_name_error(self):
 
         with p.uri_context(uri=TEST_BASE_URI, prefix="ut"):
@@ -1288,6 +1518,127 @@ class Test_01_Core(HousekeeperMixin, unittest.TestCase):
             self.assertEqual(itm2.R31__is_in_mathematical_relation_with, [x])
             self.assertEqual(itm3.R31__is_in_mathematical_relation_with, [x])
 
+    def test_d10b__bulk_insert(self):
+
+        with p.uri_context(uri=TEST_BASE_URI, prefix="ut"):
+            items = [p.instance_of(p.I1["general item"]) for i in range(4)]
+            itm1, itm2, itm3, itm4 = items
+
+            rows = [
+                (itm1, "R31", itm2),
+                (itm1, p.R31.uri, itm3),
+                (itm2, p.R31["is in mathematical relation with"], itm3),
+                (itm1, "R2", p.Literal("label1", lang="de")),
+            ]
+            stms = p.ds.bulk_insert(rows)
+
+        self.assertEqual(len(stms), 4)
+        self.assertEqual(itm1.R31, [itm2, itm3])
+        self.assertEqual(itm3.get_inv_relations("R31", return_subj=True), [itm1, itm2])
+        self.assertEqual(itm1.get_relations("R2", return_obj=True)[-1], p.Literal("label1", lang="de"))
+        self.assertIn(stms[3], p.ds.relation_statements[p.R2.uri])
+
+        # functional relations are validated at the end; in case of an error no new statement remains
+        n_stms = len(p.ds.statement_uri_map)
+        rows = [(itm2, "R57", True), (itm3, "R57", True), (itm3, "R57", False)]
+        with p.uri_context(uri=TEST_BASE_URI), self.assertRaises(p.aux.FunctionalRelationError):
+            p.ds.bulk_insert(rows)
+        self.assertEqual(len(p.ds.statement_uri_map), n_stms)
+        self.assertEqual(itm2.R57, None)
+        self.assertEqual(itm3.R57, None)
+
+        # R32: one value per language
+        with p.uri_context(uri=TEST_BASE_URI), self.assertRaises(p.aux.FunctionalRelationError):
+            p.ds.bulk_insert([(itm4, "R2", p.Literal("a", lang="de")), (itm4, "R2", p.Literal("b", lang="de"))])
+
+        # newest statement wins if desired (this is used by io.import_stms_from_rdf_triples)
+        with p.uri_context(uri=TEST_BASE_URI):
+            rows = [(itm3, "R57", True), (itm3, "R57", False), (itm1, "R2", p.Literal("label2", lang="de"))]
+            new_stms = p.ds.bulk_insert(rows, overwrite_functional=True)
+        self.assertEqual(itm3.R57, False)
+        self.assertEqual(itm1.get_relations("R2", return_obj=True)[-1], p.Literal("label2", lang="de"))
+        self.assertTrue(new_stms[0].unlinked)
+        self.assertTrue(stms[3].unlinked)
+
+        # failed insertions leave the indexes unchanged and are not reported to the change listeners
+        class ChangeRecorder:
+            def __init__(self):
+                self.events = []
+
+            def statement_changed(self, stm, added):
+                self.events.append((stm, added))
+
+            def entity_changed(self, entity, added):
+                self.events.append((entity, added))
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            R301 = p.create_relation(R1="has functional relation", R22__is_functional=True)
+            scope_itm = p.instance_of(p.I16["scope"], r1="bulk insert scope")
+
+        def get_index_state():
+            return (
+                len(p.ds.statement_uri_map),
+                list(p.ds.statements.get(itm1.uri, {})),
+                list(p.ds.inv_statements.get(itm2.uri, {})),
+                R301.uri in p.ds.relation_statements,
+                p.ds.get_entities_by_label("bulk label"),
+                list(p.ds.scope_statements.get(scope_itm.uri, [])),
+            )
+
+        recorder = ChangeRecorder()
+        p.ds.add_change_listener(recorder)
+        try:
+            index_state = get_index_state()
+            invalid_rows = [
+                [(itm1, R301, itm2), (itm1, p.R1, "bulk label"), (itm1, R301, object())],
+                [(itm1, R301, itm2), (itm1, p.R1, "bulk label"), (itm1, R301, itm3)],
+            ]
+            for rows, exception_type in zip(invalid_rows, [TypeError, p.aux.FunctionalRelationError]):
+                for scope in [None, scope_itm]:
+                    with p.uri_context(uri=TEST_BASE_URI), self.assertRaises(exception_type):
+                        p.ds.bulk_insert(rows, scope=scope)
+                    self.assertEqual(get_index_state(), index_state)
+                    self.assertEqual(itm1.get_relations(R301.uri), [])
+            self.assertEqual(recorder.events, [])
+        finally:
+            p.ds.remove_change_listener(recorder)
+
+    def test_d10c__label_index(self):
+
+        self.assertEqual(p.ds.get_entities_by_label("general item"), [p.I1])
+        self.assertEqual(p.ds.get_entities_by_label("has label"), [p.R1])
+        self.assertEqual(p.ds.get_entities_by_label("General Item"), [])
+        self.assertEqual(p.ds.get_entities_by_label("General Item", ignore_case=True), [p.I1])
+
+        with p.uri_context(uri=TEST_BASE_URI, prefix="ut"):
+            itm1 = p.create_item(
+                key_str="I9001",
+                R1__has_label="unittest label index item",
+                R1__has_label__de="Unittest-Label-Index-Element",
+            )
+            itm2 = p.instance_of(p.I1["general item"], r1="unittest label index item 2")
+            R301 = p.create_relation(key_str="R301", R1__has_label="unittest label index relation")
+
+        self.assertEqual(p.ds.get_entities_by_label("unittest label index item"), [itm1])
+        self.assertEqual(p.ds.get_entities_by_label("Unittest-Label-Index-Element", lang="de"), [itm1])
+        self.assertEqual(p.ds.get_entities_by_label("Unittest-Label-Index-Element", lang="en"), [])
+        self.assertEqual(p.ds.get_item_by_label("unittest label index item 2"), itm2)
+
+        res = p.ds.get_entities_by_label("unittest label index", prefix=True)
+        self.assertEqual(set(res), {itm1, itm2, R301})
+        res = p.ds.get_entities_by_label("UNITTEST-label", prefix=True, ignore_case=True)
+        self.assertEqual(res, [itm1])
+        self.assertEqual(p.ds.get_entities_by_label("UNITTEST-label", prefix=True), [])
+
+        # the index is updated incrementally
+        with p.uri_context(uri=TEST_BASE_URI):
+            itm2.overwrite_statement("R1", "unittest label index item 2 (new)")
+        self.assertEqual(p.ds.get_item_by_label("unittest label index item 2"), None)
+        self.assertEqual(p.ds.get_item_by_label("unittest label index item 2 (new)"), itm2)
+
+        p.core._unlink_entity(itm1.uri, remove_from_mod=True)
+        self.assertEqual(p.ds.get_entities_by_label("unittest label index", prefix=True), [itm2, R301])
+
     def test_d11__get_subjects_for_relation(self):
 
         with p.uri_context(uri=TEST_BASE_URI, prefix="ut"):
@@ -840,7 +840,7 @@ with I803.scope("assertion") as cm:
 
 # ###############################################################################
 
-# this function is needed by ruleengine.AlgorithmicRuleApplicationWorker.experiment
+# this function is the consequent function of the aggregation rule I810
 
 
 def add_stm_by_exclusion(self, p1, oppo_rel, not_itm1, not_itm2, not_itm3, not_itm4):
@@ -894,22 +894,33 @@ I820 = p.create_item(
 )
 
 I810 = p.create_item(
-    R1__has_label="rule: deduce positive fact from 4 negative facts (hardcoded cheat)",
-    R2__has_description=("deduce positive fact from 4 negative facts (graph version)"),
+    R1__has_label="rule: deduce positive fact from 4 negative facts",
+    R2__has_description=("deduce positive fact from 4 negative facts (aggregation version)"),
     R4__is_instance_of=p.I41["semantic rule"],
 )
 
 with I810.scope("setting") as cm:
-    pass
+    cm.new_var(p1=p.instance_of(p.I1["general item"]))
+    cm.new_rel_var("rel1")
+    cm.new_var(objs=p.instance_of(p.I1["general item"]))
+
+    cm.uses_external_entities(zb.I7435["human"], zb.R6020["is opposite of functional activity"])
 
+# every (person, opposite relation) group with four relevant objects is passed to add_stm_by_exclusion
 with I810.scope("premise") as cm:
-    pass
+    cm.new_aggregation(
+        cm.p1,
+        cm.rel1,
+        cm.objs,
+        predicate_relation=zb.R6020["is opposite of functional activity"],
+        subject_class=zb.I7435["human"],
+        min_count=4,
+        max_count=4,
+    )
+    cm.new_condition_func(lambda self, itm: p.is_relevant_item(itm), cm.objs)
 
 with I810.scope("assertion") as cm:
-    pass
-
-# this is a temporary solution until the AlgorithmicRuleApplicationWorker is implemented
-I810.cheat = [p.ruleengine.AlgorithmicRuleApplicationWorker.hardcoded_I810, zb, add_stm_by_exclusion]
+    cm.new_consequent_func(add_stm_by_exclusion, cm.p1, cm.rel1, cm.objs)
 
 with I820.scope("setting") as cm:
 
@@ -954,52 +965,29 @@ with I820.scope("assertion") as cm:
 
 
 I830 = p.create_item(
-    R1__has_label="rule: ensure absence of contradictions (5 different-from statements) (hardcoded cheat)",
+    R1__has_label="rule: ensure absence of contradictions (5 different-from statements)",
     R4__is_instance_of=p.I41["semantic rule"],
 )
 
-I830.cheat = [
-    p.ruleengine.AlgorithmicRuleApplicationWorker.hardcoded_I830,
-    zb,
-    p.raise_contradiction,
-    "{} has too many `R50__is_different_from` statements",
-]
-
-
-# currently obsolete because of hardcoded cheat
 with I830.scope("setting") as cm:
-
     cm.new_var(p0=p.instance_of(p.I1["general item"]))
-
-    cm.new_var(p1=p.instance_of(p.I1["general item"]))
-    cm.new_var(p2=p.instance_of(p.I1["general item"]))
-    cm.new_var(p3=p.instance_of(p.I1["general item"]))
-    cm.new_var(p4=p.instance_of(p.I1["general item"]))
-    cm.new_var(p5=p.instance_of(p.I1["general item"]))
+    cm.new_rel_var("rel1")
+    cm.new_var(objs=p.instance_of(p.I1["general item"]))
 
     cm.uses_external_entities(zb.I7435["human"])
 
-
+# raise an exception if one person is different from more than 4 non-placeholder persons
 with I830.scope("premise") as cm:
-    cm.new_rel(cm.p0, p.R4["is instance of"], zb.I7435["human"], overwrite=True)
-
-    cm.new_rel(cm.p1, p.R4["is instance of"], zb.I7435["human"], overwrite=True)
-    cm.new_rel(cm.p2, p.R4["is instance of"], zb.I7435["human"], overwrite=True)
-    cm.new_rel(cm.p3, p.R4["is instance of"], zb.I7435["human"], overwrite=True)
-    cm.new_rel(cm.p4, p.R4["is instance of"], zb.I7435["human"], overwrite=True)
-    cm.new_rel(cm.p5, p.R4["is instance of"], zb.I7435["human"], overwrite=True)
-
-    cm.new_rel(cm.p0, p.R50["is different from"], cm.p1)
-    cm.new_rel(cm.p0, p.R50["is different from"], cm.p2)
-    cm.new_rel(cm.p0, p.R50["is different from"], cm.p3)
-    cm.new_rel(cm.p0, p.R50["is different from"], cm.p4)
-    cm.new_rel(cm.p0, p.R50["is different from"], cm.p5)
-
-    cm.new_rel(cm.p1, p.R57["is placeholder"], False)
-    cm.new_rel(cm.p2, p.R57["is placeholder"], False)
-    cm.new_rel(cm.p3, p.R57["is placeholder"], False)
-    cm.new_rel(cm.p4, p.R57["is placeholder"], False)
-    cm.new_rel(cm.p5, p.R57["is placeholder"], False)
+    cm.new_aggregation(
+        cm.p0,
+        cm.rel1,
+        cm.objs,
+        predicates=[p.R50["is different from"]],
+        subject_class=zb.I7435["human"],
+        min_count=5,
+    )
+    cm.new_condition_func(lambda self, itm: not itm.R20__has_defining_scope, cm.p0)
+    cm.new_condition_func(lambda self, itm: p.is_relevant_item(itm), cm.objs)
 
 with I830.scope("assertion") as cm:
     cm.new_consequent_func(
@@ -1010,25 +998,37 @@ with I830.scope("assertion") as cm:
 
 
 I840 = p.create_item(
-    R1__has_label="rule: detect if puzzle is solved (hardcoded cheat)",
+    R1__has_label="rule: detect if puzzle is solved",
     R4__is_instance_of=p.I41["semantic rule"],
 )
 
-I840.cheat = [
-    p.ruleengine.AlgorithmicRuleApplicationWorker.hardcoded_I840,
-    zb,
-    p.raise_reasoning_goal_reached,
-    "puzzle solved",
-]
-
 with I840.scope("setting") as cm:
-    pass
+    cm.new_var(p1=p.instance_of(p.I1["general item"]))
+    cm.new_rel_var("rel1")
+    cm.new_var(objs=p.instance_of(p.I1["general item"]))
+
+    cm.uses_external_entities(zb.I7435["human"], zb.R2850["is functional activity"])
 
+# the puzzle is solved if every relevant person has exactly one object for each of the 5 functional activities
+# (the two person-person-activities are not considered)
 with I840.scope("premise") as cm:
-    pass
+    cm.new_aggregation(
+        cm.p1,
+        cm.rel1,
+        cm.objs,
+        predicate_relation=zb.R2850["is functional activity"],
+        predicate_relation_object=True,
+        excluded_predicates=[zb.R2353["lives immediately right of"], zb.R8768["lives immediately left of"]],
+        subject_class=zb.I7435["human"],
+        min_count=1,
+        max_count=1,
+        group_count=25,
+    )
+    cm.new_condition_func(lambda self, itm: p.is_relevant_item(itm), cm.p1)
+    cm.new_condition_func(lambda self, itm: p.is_relevant_item(itm), cm.objs)
 
 with I840.scope("assertion") as cm:
-    pass
+    cm.new_consequent_func(p.raise_reasoning_goal_reached, "puzzle solved")
 
 # ###############################################################################
 
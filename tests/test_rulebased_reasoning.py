@@ -332,6 +332,838 @@ class Test_01_rulebased_reasoning(HousekeeperMixin, unittest.TestCase):
         # without the condition func this would be also matched
         self.assertEqual(itm2.R54__is_matched_by_rule, [])
 
+    def test_d04c__shared_reasoning_graph(self):
+        """
+        test that the reasoning graph is shared between the rule applicators and updated incrementally
+        """
+
+        def graph_data(G):
+            nodes = {n: d.get("itm", d.get("value")) for n, d in G.nodes(data=True)}
+            edges = {(u, v, k): (d["itm1"], d["itm2"], d["rel_uri"]) for u, v, k, d in G.edges(keys=True, data=True)}
+            return nodes, edges
+
+        zb = p.irkloader.load_mod_from_path(TEST_DATA_PATH_ZEBRA01, prefix="zb")
+        rule = p.ds.get_entity_by_key_str("zb__I901")
+
+        ra1 = p.ruleengine.RuleApplicator(rule, mod_context_uri=zb.__URI__)
+        res = ra1.apply()
+        self.assertGreater(len(res.new_statements), 0)
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            itm1 = p.instance_of(p.I36["rational number"])
+            itm1.set_relation(p.R38["has length"], 5)
+            p.instance_of(p.I36["rational number"])
+        res.new_statements[0].unlink()
+        p.core._unlink_entity(itm1.uri, remove_from_mod=True)
+
+        ra2 = p.ruleengine.RuleApplicator(rule, mod_context_uri=zb.__URI__)
+        self.assertIs(ra2.reasoning_graph, ra1.reasoning_graph)
+        self.assertIs(ra2.G, ra1.G)
+        self.assertEqual(graph_data(ra2.G), graph_data(ra2.create_simple_graph()))
+
+        # reload the module (same uris, new objects)
+        p.unload_mod(zb.__URI__)
+        zb = p.irkloader.load_mod_from_path(TEST_DATA_PATH_ZEBRA01, prefix="zb")
+        rule = p.ds.get_entity_by_key_str("zb__I901")
+        ra3 = p.ruleengine.RuleApplicator(rule, mod_context_uri=zb.__URI__)
+        self.assertEqual(graph_data(ra3.G), graph_data(ra3.create_simple_graph()))
+
+    def test_d04d__apply_rules_until_fixpoint(self):
+        """
+        test the semi-naive fixpoint iteration
+        """
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            R301 = p.create_relation(R1="has successor")
+            R302 = p.create_relation(R1="is marked")
+
+            items = [p.instance_of(p.I1["general item"]) for i in range(6)]
+            for itm1, itm2 in zip(items[:-1], items[1:]):
+                itm1.set_relation(R301, itm2)
+            items[0].set_relation(R302, True)
+
+            I705 = p.create_item(
+                R1__has_label="test rule",
+                R2__has_description="mark the successor of a marked item",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+
+            with I705.scope("setting") as cm:
+                cm.new_var(x=p.instance_of(p.I1["general item"]))
+                cm.new_var(y=p.instance_of(p.I1["general item"]))
+
+            with I705.scope("premise") as cm:
+                cm.new_rel(cm.x, R301, cm.y)
+                cm.new_rel(cm.x, R302, True)
+
+            with I705.scope("assertion") as cm:
+                cm.new_rel(cm.y, R302, True, qualifiers=[p.qff_has_rule_ptg_mode(5)])
+
+            res = p.ruleengine.apply_rules_until_fixpoint([I705], max_rounds=2)
+            self.assertEqual(res.stop_reason, "max_rounds")
+            self.assertEqual(len(res.new_statements), 2)
+            marks = [itm.get_relations(R302.uri, return_obj=True) for itm in items]
+            self.assertEqual(marks, [[True]] * 3 + [[]] * 3)
+
+            res = p.ruleengine.apply_rules_until_fixpoint([I705])
+
+        self.assertEqual(res.stop_reason, "fixpoint")
+        marks = [itm.get_relations(R302.uri, return_obj=True) for itm in items]
+        self.assertEqual(marks, [[True]] * 6)
+
+        # 3 rounds with one new statement each + 1 round without new statements
+        self.assertEqual(len(res.new_statements), 3)
+        self.assertEqual([rs.new_statements for rs in res.round_stats], [1, 1, 1, 0])
+        self.assertEqual([rs.applied_rules for rs in res.round_stats], [1, 1, 1, 1])
+
+        # the second round only considers the matches which involve the subject of the newly created statement
+        self.assertEqual(res.partial_results[0].partial_results[0].raw_result_count, 3)
+        self.assertEqual(res.partial_results[1].partial_results[0].raw_result_count, 2)
+
+    def test_d04e__prototype_matcher(self):
+        """
+        test that the index based matcher finds the same matches as the VF2 implementation of networkx
+        """
+
+        zb = p.irkloader.load_mod_from_path(TEST_DATA_PATH_ZEBRA_BASE_DATA, prefix="zb")
+        zr = p.irkloader.load_mod_from_path(TEST_DATA_PATH_ZEBRA_RULES, prefix="zr", reuse_loaded=True)
+        zp = p.irkloader.load_mod_from_path(TEST_DATA_PATH_ZEBRA02, prefix="zp")
+
+        rules = [zr.I701, zr.I702, zr.I705, zr.I720, zr.I750, zr.I763, zr.I794, zr.I796, zr.I800, zr.I820]
+        total_match_count = 0
+        for rule in rules:
+            ra = p.ruleengine.RuleApplicator(rule, mod_context_uri=TEST_BASE_URI)
+            self.assertEqual(ra.premise_type, p.ruleengine.PremiseType.GRAPH)
+
+            for ra_worker in ra.ra_workers:
+                # the VF2 implementation does not evaluate condition functions and generates all equivalent matches
+                ra_worker.push_down_condition_functions = False
+                ra_worker.break_symmetries = False
+                ra_worker.use_vf2_matcher = True
+                res_vf2 = list(ra_worker._iter_subgraph_monomorphisms(ra.G))
+                ra_worker.use_vf2_matcher = False
+                res = list(ra_worker._iter_subgraph_monomorphisms(ra.G))
+
+                self.assertEqual(len(res), len(res_vf2))
+                self.assertEqual(set(frozenset(d.items()) for d in res), set(frozenset(d.items()) for d in res_vf2))
+                total_match_count += len(res)
+
+        self.assertGreater(total_match_count, 40)
+
+    def test_d04f__premise_join_order(self):
+        """
+        test that the matching plan starts with the most selective premise statement
+        """
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            R301 = p.create_relation(R1="has rare property")
+            R302 = p.create_relation(R1="has category")
+
+            I501 = p.create_item(R1__has_label="common category", R4__is_instance_of=p.I1["general item"])
+            items = [p.instance_of(p.I1["general item"]) for i in range(30)]
+            for itm in items:
+                itm.set_relation(R302, I501)
+            items[0].set_relation(R301, items[1])
+            items[5].set_relation(R301, items[6])
+
+            I701 = p.create_item(
+                R1__has_label="test rule",
+                R2__has_description="find items of the common category with a rare property",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+
+            with I701.scope("setting") as cm:
+                cm.new_var(x=p.instance_of(p.I1["general item"]))
+                cm.new_var(y=p.instance_of(p.I1["general item"]))
+                cm.uses_external_entities(I501)
+
+            with I701.scope("premise") as cm:
+                cm.new_rel(cm.x, R302, I501)
+                cm.new_rel(cm.x, R301, cm.y)
+
+            with I701.scope("assertion") as cm:
+                cm.new_rel(cm.y, R302, I501)
+
+        ra = p.ruleengine.RuleApplicator(I701, mod_context_uri=TEST_BASE_URI)
+        statistics = ra.reasoning_graph.statistics
+        self.assertEqual(statistics.get_statement_count(R302.uri), 30)
+        self.assertEqual(statistics.get_object_fanout(R302.uri, I501.uri), 30)
+        self.assertEqual(statistics.get_distinct_subject_count(R301.uri), 2)
+
+        ra_worker = ra.ra_workers[0]
+        matcher = ra_worker.get_matcher()
+        x_node = ra_worker.local_nodes.a[ra_worker.local_node_names.b["x"]]
+
+        # the external entity is bound first, then x is taken from the two subjects of R301 (instead of the
+        # 30 subjects of R302)
+        self.assertEqual([step.node for step in matcher.plan][1], x_node)
+        self.assertIsNone(matcher.plan[1].anchor)
+        self.assertEqual(matcher.plan[1].estimate, 2)
+
+        explanation = ra.explain()
+        self.assertIn(f"subjects of {R301.short_key}", explanation)
+        self.assertEqual(len(explanation.split("\n")), 1 + 1 + len(matcher.plan))
+
+        res = ra.apply()
+        self.assertEqual(res.partial_results[0].raw_result_count, 2)
+
+        # the statistics are updated together with the graph
+        ra.reasoning_graph.get_graph()
+        rebuilt_statistics = p.ruleengine.RelationStatistics()
+        ra.reasoning_graph.build_graph(rebuilt_statistics)
+        self.assertEqual(statistics.statement_counts, rebuilt_statistics.statement_counts)
+        self.assertEqual(statistics.node_degrees, rebuilt_statistics.node_degrees)
+        self.assertEqual(statistics.get_object_fanout(R302.uri, I501.uri), 30 + len(res.new_statements))
+
+    def test_d04g__compiled_rule_cache(self):
+        """
+        test that rules are only compiled once (unless they change)
+        """
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            R301 = p.create_relation(R1="has successor")
+            R302 = p.create_relation(R1="is marked")
+            R303 = p.create_relation(R1="has state")
+
+            items = [p.instance_of(p.I1["general item"]) for i in range(4)]
+            for itm1, itm2 in zip(items[:-1], items[1:]):
+                itm1.set_relation(R301, itm2)
+            items[0].set_relation(R302, True)
+
+            I701 = p.create_item(
+                R1__has_label="test rule",
+                R2__has_description="mark the successor of a marked item",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+
+            with I701.scope("setting") as cm:
+                cm.new_var(x=p.instance_of(p.I1["general item"]))
+                cm.new_var(y=p.instance_of(p.I1["general item"]))
+                x = cm.x
+
+            with I701.scope("premise") as cm:
+                cm.new_rel(cm.x, R301, cm.y)
+                cm.new_rel(cm.x, R302, True)
+
+            with I701.scope("assertion") as cm:
+                cm.new_rel(cm.y, R302, True, qualifiers=[p.qff_has_rule_ptg_mode(5)])
+
+        rule_cache = p.ruleengine.get_rule_cache()
+        hits = rule_cache.hits
+
+        ra1 = p.ruleengine.RuleApplicator(I701, mod_context_uri=TEST_BASE_URI)
+        ra2 = p.ruleengine.RuleApplicator(I701, mod_context_uri=TEST_BASE_URI)
+        self.assertEqual(rule_cache.hits, hits + 1)
+        self.assertIsNot(ra2.ra_workers[0], ra1.ra_workers[0])
+        self.assertIs(ra2.ra_workers[0].P, ra1.ra_workers[0].P)
+        self.assertIs(ra2.ra_workers[0].parent, ra2)
+
+        res = ra2.apply()
+        self.assertEqual(len(res.new_statements), 1)
+
+        # changing the premise invalidates the compiled rule
+        with p.uri_context(uri=TEST_BASE_URI):
+            stm = x.set_relation(R303, "active", scope=I701.scp__premise)
+        self.assertNotIn(I701.uri, rule_cache.entries)
+
+        ra3 = p.ruleengine.RuleApplicator(I701, mod_context_uri=TEST_BASE_URI)
+        self.assertEqual(ra3.ra_workers[0].P.number_of_edges(), ra1.ra_workers[0].P.number_of_edges() + 1)
+        res = ra3.apply()
+        self.assertEqual(len(res.new_statements), 0)
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            items[1].set_relation(R303, "active")
+        res = p.ruleengine.apply_semantic_rule(I701, mod_context_uri=TEST_BASE_URI)
+        self.assertEqual(len(res.new_statements), 1)
+
+        # changes outside of the rule do not affect the cache
+        self.assertIn(I701.uri, rule_cache.entries)
+
+        stm.unlink()
+        ra4 = p.ruleengine.RuleApplicator(I701, mod_context_uri=TEST_BASE_URI)
+        self.assertEqual(ra4.ra_workers[0].P.number_of_edges(), ra1.ra_workers[0].P.number_of_edges())
+
+    def test_d04h__parallel_rule_matching(self):
+        """
+        test that matching in worker processes leads to the same results as the serial application
+        """
+
+        if not p.ruleengine.ParallelRuleMatcher.is_available():
+            self.skipTest("fork start method not available")
+
+        def create_data_and_rules():
+            with p.uri_context(uri=TEST_BASE_URI):
+                R301 = p.create_relation(R1="has successor")
+                R302 = p.create_relation(R1="is marked")
+                R303 = p.create_relation(R1="has marked successor")
+
+                items = [p.instance_of(p.I1["general item"], r1=f"item{i}") for i in range(8)]
+                for itm1, itm2 in zip(items[:-1], items[1:]):
+                    itm1.set_relation(R301, itm2)
+                items[0].set_relation(R302, True)
+
+                I705 = p.create_item(
+                    R1__has_label="test rule 1",
+                    R2__has_description="mark the successor of a marked item",
+                    R4__is_instance_of=p.I41["semantic rule"],
+                )
+                with I705.scope("setting") as cm:
+                    cm.new_var(x=p.instance_of(p.I1["general item"]))
+                    cm.new_var(y=p.instance_of(p.I1["general item"]))
+                with I705.scope("premise") as cm:
+                    cm.new_rel(cm.x, R301, cm.y)
+                    cm.new_rel(cm.x, R302, True)
+                with I705.scope("assertion") as cm:
+                    cm.new_rel(cm.y, R302, True, qualifiers=[p.qff_has_rule_ptg_mode(5)])
+
+                # this rule also matches statements which are created by the first rule in the same round
+                I706 = p.create_item(
+                    R1__has_label="test rule 2",
+                    R2__has_description="connect marked items",
+                    R4__is_instance_of=p.I41["semantic rule"],
+                )
+                with I706.scope("setting") as cm:
+                    cm.new_var(x=p.instance_of(p.I1["general item"]))
+                    cm.new_var(y=p.instance_of(p.I1["general item"]))
+                with I706.scope("premise") as cm:
+                    cm.new_rel(cm.x, R301, cm.y)
+                    cm.new_rel(cm.x, R302, True)
+                    cm.new_rel(cm.y, R302, True)
+                with I706.scope("assertion") as cm:
+                    cm.new_rel(cm.x, R303, cm.y, qualifiers=[p.qff_has_rule_ptg_mode(5)])
+
+            return [I705, I706]
+
+        results = []
+        for processes in [None, 2]:
+            rules = create_data_and_rules()
+            res = p.ruleengine.apply_rules_until_fixpoint(
+                rules, mod_context_uri=TEST_BASE_URI, processes=processes
+            )
+            self.assertEqual(res.stop_reason, "fixpoint")
+            stm_data = [(stm.subject.R1, stm.predicate.R1, str(stm.object)) for stm in res.new_statements]
+            results.append((stm_data, [rs.new_statements for rs in res.round_stats]))
+
+            p.unload_mod(TEST_BASE_URI, strict=False)
+            self.register_this_module()
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(len(results[0][0]), 7 + 7)
+
+        # the snapshot matches and the delta matches are combined
+        rules = create_data_and_rules()
+        res = p.ruleengine.apply_semantic_rules(*rules, mod_context_uri=TEST_BASE_URI, processes=2)
+        self.assertEqual([len(part.new_statements) for part in res.partial_results], [1, 1])
+
+    def test_d04i__condition_pushdown(self):
+        """
+        test that condition functions are evaluated during matching
+        """
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            R301 = p.create_relation(R1="is related to")
+            R302 = p.create_relation(R1="has related successor")
+
+            items = [p.instance_of(p.I1["general item"], r1=f"item{i}") for i in range(12)]
+            for itm1 in items:
+                for itm2 in items:
+                    if itm1 is not itm2:
+                        itm1.set_relation(R301, itm2)
+
+            def is_predecessor(self, x, y):
+                return items.index(x) + 1 == items.index(y)
+
+            I707 = p.create_item(
+                R1__has_label="test rule",
+                R2__has_description="find chains of three consecutive items",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+            with I707.scope("setting") as cm:
+                cm.new_var(x=p.instance_of(p.I1["general item"]))
+                cm.new_var(y=p.instance_of(p.I1["general item"]))
+                cm.new_var(z=p.instance_of(p.I1["general item"]))
+            with I707.scope("premise") as cm:
+                cm.new_rel(cm.x, R301, cm.y)
+                cm.new_rel(cm.y, R301, cm.z)
+                cm.new_condition_func(is_predecessor, cm.x, cm.y)
+                cm.new_condition_func(is_predecessor, cm.y, cm.z)
+            with I707.scope("assertion") as cm:
+                cm.new_rel(cm.x, R302, cm.y)
+
+        ra = p.ruleengine.RuleApplicator(I707, mod_context_uri=TEST_BASE_URI)
+        self.assertEqual(ra.explain().count("; condition is_predecessor("), 2)
+        res = ra.apply()
+        self.assertEqual(res.partial_results[0].raw_result_count, 10)
+        self.assertEqual(len(res.new_statements), 10)
+        stm_data = [(stm.subject, stm.object) for stm in res.new_statements]
+        self.assertEqual(items[0].get_relations(R302.uri, return_obj=True), [items[1]])
+        self.assertEqual(items[9].get_relations(R302.uri, return_obj=True), [items[10]])
+        self.assertEqual(items[10].get_relations(R302.uri, return_obj=True), [])
+
+        # without pushdown all monomorphisms are found first and filtered afterwards (same result)
+        p.ruleengine.RuleApplicatorWorker.push_down_condition_functions = False
+        try:
+            ra = p.ruleengine.RuleApplicator(I707, mod_context_uri=TEST_BASE_URI)
+            res = ra.apply()
+        finally:
+            p.ruleengine.RuleApplicatorWorker.push_down_condition_functions = True
+        self.assertEqual(res.partial_results[0].raw_result_count, 12 * 11 * 10)
+        self.assertEqual([(stm.subject, stm.object) for stm in res.new_statements], stm_data)
+
+    def test_d04j__match_limit_and_paging(self):
+        """
+        test that truncated rule applications are reported and can be continued
+        """
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            R301 = p.create_relation(R1="has successor")
+            R302 = p.create_relation(R1="has marked successor")
+            R303 = p.create_relation(R1="has other marked successor")
+
+            items = [p.instance_of(p.I1["general item"], r1=f"item{i}") for i in range(10)]
+            for itm1, itm2 in zip(items[:-1], items[1:]):
+                itm1.set_relation(R301, itm2)
+
+            I708 = p.create_item(
+                R1__has_label="test rule 1",
+                R2__has_description="mark the successor",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+            I709 = p.create_item(
+                R1__has_label="test rule 2",
+                R2__has_description="mark the successor (again)",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+            for rule, rel in [(I708, R302), (I709, R303)]:
+                with rule.scope("setting") as cm:
+                    cm.new_var(x=p.instance_of(p.I1["general item"]))
+                    cm.new_var(y=p.instance_of(p.I1["general item"]))
+                with rule.scope("premise") as cm:
+                    cm.new_rel(cm.x, R301, cm.y)
+                with rule.scope("assertion") as cm:
+                    cm.new_rel(cm.x, rel, cm.y, qualifiers=[p.qff_has_rule_ptg_mode(5)])
+
+        # the matches are processed page by page
+        stms = []
+        match_cursors = None
+        for expected_count, expected_flag in [(4, True), (4, True), (1, False)]:
+            res = p.ruleengine.apply_semantic_rule(I708, TEST_BASE_URI, match_limit=4, match_cursors=match_cursors)
+            self.assertEqual(len(res.new_statements), expected_count)
+            self.assertEqual(res.match_limit_reached, expected_flag)
+            self.assertEqual(res.partial_results[0].raw_result_count, expected_count)
+            stms.extend(res.new_statements)
+            match_cursors = res.creator_object.match_cursors
+        self.assertEqual(set(stm.subject for stm in stms), set(items[:-1]))
+
+        # the fixpoint driver continues truncated applications in the following rounds
+        res = p.ruleengine.apply_rules_until_fixpoint([I709], mod_context_uri=TEST_BASE_URI, match_limit=2)
+        self.assertEqual(res.stop_reason, "fixpoint")
+        self.assertEqual(res.round_stats[0].truncated_rules, 1)
+        self.assertEqual(set((stm.subject, stm.object) for stm in res.new_statements), set(zip(items[:-1], items[1:])))
+        self.assertEqual(len(res.new_statements), 9)
+
+        with self.assertRaises(ValueError):
+            p.ruleengine.RuleApplicator(I708, match_limit=0)
+
+    def test_d04k__symmetry_breaking(self):
+        """
+        test that equivalent matches of rules with interchangeable variables are only processed once
+        """
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            R301 = p.create_relation(R1="is neighbor of")
+            R302 = p.create_relation(R1="has greeted")
+
+            I501 = p.create_item(R1__has_label="person", R4__is_instance_of=p.I2["Metaclass"])
+            persons = [p.instance_of(I501, r1=f"person{i}") for i in range(5)]
+
+            I710 = p.create_item(
+                R1__has_label="test rule 1",
+                R2__has_description="persons are neighbors of each other",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+            I711 = p.create_item(
+                R1__has_label="test rule 2",
+                R2__has_description="persons greet each other (not symmetric)",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+            for rule in [I710, I711]:
+                with rule.scope("setting") as cm:
+                    cm.new_var(x=p.instance_of(I501))
+                    cm.new_var(y=p.instance_of(I501))
+                    cm.uses_external_entities(I501)
+                with rule.scope("premise") as cm:
+                    cm.new_rel(cm.x, p.R4["is instance of"], I501, overwrite=True)
+                    cm.new_rel(cm.y, p.R4["is instance of"], I501, overwrite=True)
+
+            with I710.scope("assertion") as cm:
+                cm.new_rel(cm.x, R301, cm.y)
+                cm.new_rel(cm.y, R301, cm.x)
+            with I711.scope("assertion") as cm:
+                cm.new_rel(cm.x, R302, cm.y)
+
+        ra = p.ruleengine.RuleApplicator(I710, mod_context_uri=TEST_BASE_URI)
+        self.assertEqual(len(ra.ra_workers[0].get_symmetry_constraints()), 1)
+        self.assertIn("; order ", ra.explain())
+        res = ra.apply()
+        self.assertEqual(res.partial_results[0].raw_result_count, 5 * 4 // 2)
+        self.assertEqual(len(res.new_statements), 5 * 4)
+        self.assertEqual(set(persons[0].get_relations(R301.uri, return_obj=True)), set(persons[1:]))
+
+        # the assertion of this rule is not symmetric -> all matches are needed
+        ra = p.ruleengine.RuleApplicator(I711, mod_context_uri=TEST_BASE_URI)
+        self.assertEqual(ra.ra_workers[0].get_symmetry_constraints(), [])
+        res = ra.apply()
+        self.assertEqual(res.partial_results[0].raw_result_count, 5 * 4)
+
+    def test_d04l__rule_scheduler(self):
+        """
+        test that the scheduler orders the rules by their dependencies and skips rules without relevant changes
+        """
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            R301 = p.create_relation(R1="relation 1")
+            R302 = p.create_relation(R1="relation 2")
+            R303 = p.create_relation(R1="relation 3")
+            R304 = p.create_relation(R1="relation 4")
+            R305 = p.create_relation(R1="relation 5")
+
+            items = [p.instance_of(p.I1["general item"], r1=f"item{i}") for i in range(4)]
+            items[0].set_relation(R301, items[1])
+            items[2].set_relation(R304, items[3])
+
+            I712 = p.create_item(
+                R1__has_label="test rule 1",
+                R2__has_description="R302 -> R303",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+            I713 = p.create_item(
+                R1__has_label="test rule 2",
+                R2__has_description="R301 -> R302",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+            I714 = p.create_item(
+                R1__has_label="test rule 3",
+                R2__has_description="R304 -> R305",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+            for rule, rel1, rel2 in [(I712, R302, R303), (I713, R301, R302), (I714, R304, R305)]:
+                with rule.scope("setting") as cm:
+                    cm.new_var(x=p.instance_of(p.I1["general item"]))
+                    cm.new_var(y=p.instance_of(p.I1["general item"]))
+                with rule.scope("premise") as cm:
+                    cm.new_rel(cm.x, rel1, cm.y)
+                with rule.scope("assertion") as cm:
+                    cm.new_rel(cm.x, rel2, cm.y)
+
+        relations = p.ruleengine.get_rule_relations(I712)
+        self.assertEqual(relations.read_uris, {R302.uri})
+        self.assertEqual(relations.written_uris, {R303.uri})
+
+        with p.ruleengine.RuleScheduler([I712, I713, I714], mod_context_uri=TEST_BASE_URI) as scheduler:
+            self.assertEqual(list(scheduler.dependency_graph.edges), [(I713.uri, I712.uri)])
+            self.assertEqual(scheduler.strata, [[I713], [I712], [I714]])
+
+            # the producer is applied first -> the consumer sees its statements in the same pass
+            res = scheduler.apply()
+            self.assertEqual(res.stop_reason, "fixpoint")
+            self.assertEqual(len(res.new_statements), 3)
+            self.assertEqual(items[0].get_relations(R303.uri, return_obj=True), [items[1]])
+
+            # nothing has changed
+            res = scheduler.apply()
+            self.assertEqual(res.round_stats, [])
+            self.assertEqual(len(res.partial_results), 0)
+
+            # only the rule which reads the changed relation is applied
+            with p.uri_context(uri=TEST_BASE_URI):
+                items[3].set_relation(R304, items[0])
+            res = scheduler.apply()
+            self.assertEqual([part.rule for part in res.partial_results], [I714])
+            self.assertEqual(res.round_stats[0].skipped_rules, 2)
+            self.assertEqual(len(res.new_statements), 2)
+
+        self.assertNotIn(scheduler, p.ds.change_listeners)
+
+    def test_d04m__incremental_rule_network(self):
+        """
+        test that the incremental network processes the changes as soon as they are completed
+        """
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            R301 = p.create_relation(R1="has successor")
+            R302 = p.create_relation(R1="has predecessor")
+
+            items = [p.instance_of(p.I1["general item"], r1=f"item{i}") for i in range(6)]
+            items[0].set_relation(R301, items[1])
+            items[1].set_relation(R301, items[2])
+
+            I715 = p.create_item(
+                R1__has_label="test rule",
+                R2__has_description="create the inverse statements",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+            with I715.scope("setting") as cm:
+                cm.new_var(x=p.instance_of(p.I1["general item"]))
+                cm.new_var(y=p.instance_of(p.I1["general item"]))
+            with I715.scope("premise") as cm:
+                cm.new_rel(cm.x, R301, cm.y)
+            with I715.scope("assertion") as cm:
+                cm.new_rel(cm.y, R302, cm.x, qualifiers=[p.qff_has_rule_ptg_mode(5)])
+
+        def add_successor(i):
+            with p.uri_context(uri=TEST_BASE_URI):
+                return items[i].set_relation(R301, items[i + 1])
+
+        with p.ruleengine.IncrementalRuleNetwork([I715], mod_context_uri=TEST_BASE_URI) as network:
+            res = network.run()
+            self.assertEqual(res.stop_reason, "fixpoint")
+            self.assertEqual(len(res.new_statements), 2)
+
+            # the consequences are applied immediately after the change
+            # (the match (item1, item2) also involves the changed entity but it has already fired)
+            add_successor(2)
+            self.assertEqual(items[3].get_relations(R302.uri, return_obj=True), [items[2]])
+            self.assertEqual(len(network.last_result.new_statements), 1)
+            self.assertEqual(len(network.fired_matches[I715.uri]), 3)
+            self.assertEqual(network.run().stop_reason, "fixpoint")
+
+            network.pause()
+            stm = add_successor(3)
+            self.assertEqual(network.run().stop_reason, "paused")
+            self.assertEqual(items[4].get_relations(R302.uri, return_obj=True), [])
+            res = network.resume()
+            self.assertEqual(len(res.new_statements), 1)
+
+            # removing a statement forgets the matches of its subject
+            stm.unlink()
+            self.assertEqual(len(network.fired_matches[I715.uri]), 2)
+            add_successor(3)
+            self.assertEqual(len(network.fired_matches[I715.uri]), 4)
+            self.assertEqual(len(network.last_result.new_statements), 0)
+
+            # the changes of a consequence are processed by the current run (and do not trigger nested runs)
+            add_successor(4)
+            self.assertEqual(len(network.last_result.new_statements), 1)
+            self.assertEqual(network.last_result.stop_reason, "fixpoint")
+
+        self.assertNotIn(network, p.ds.change_listeners)
+
+        # bounded memory
+        with p.ruleengine.IncrementalRuleNetwork([I715], TEST_BASE_URI, max_fired_matches=2) as network:
+            network.run()
+            self.assertEqual(len(network.fired_matches[I715.uri]), 2)
+
+    def test_d04n__backward_chaining(self):
+        """
+        test that goals are proven without modification of the data store
+        """
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            R301 = p.create_relation(R1="is ancestor of")
+
+            items = [p.instance_of(p.I1["general item"], r1=f"item{i}") for i in range(5)]
+            for i in range(3):
+                items[i].set_relation(R301, items[i + 1])
+
+            I716 = p.create_item(
+                R1__has_label="test rule",
+                R2__has_description="transitivity of R301",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+            with I716.scope("setting") as cm:
+                cm.new_var(x=p.instance_of(p.I1["general item"]))
+                cm.new_var(y=p.instance_of(p.I1["general item"]))
+                cm.new_var(z=p.instance_of(p.I1["general item"]))
+            with I716.scope("premise") as cm:
+                cm.new_rel(cm.x, R301, cm.y)
+                cm.new_rel(cm.y, R301, cm.z)
+            with I716.scope("assertion") as cm:
+                cm.new_rel(cm.x, R301, cm.z, qualifiers=[p.qff_has_rule_ptg_mode(5)])
+
+        stm_count = len(p.ds.relation_statements[R301.uri])
+        chainer = p.ruleengine.BackwardChainer([I716])
+
+        res = chainer.prove(items[0], R301, items[3])
+        self.assertTrue(res.answer)
+        self.assertEqual(res.derivation.rule, I716)
+        self.assertIn("# statement", chainer.get_derivation_text(res.derivation))
+        self.assertFalse(chainer.prove(items[3], R301, items[0]).answer)
+        self.assertFalse(chainer.prove(items[0], R301, items[4]).answer)
+        self.assertEqual(len(p.ds.relation_statements[R301.uri]), stm_count)
+
+        # cycle: recursive subgoals have to terminate; compare with the forward application
+        with p.uri_context(uri=TEST_BASE_URI):
+            items[3].set_relation(R301, items[0])
+        expected = {}
+        for item in items:
+            answers = chainer.query(item, R301)
+            expected[item] = {answer.object for answer in answers}
+        self.assertEqual(expected[items[0]], {items[1], items[2], items[3]})
+        self.assertEqual(expected[items[4]], set())
+
+        all_answers = chainer.query(None, R301, None)
+        self.assertEqual(len(all_answers), 12)
+
+        res = p.ruleengine.apply_rules_until_fixpoint([I716], mod_context_uri=TEST_BASE_URI)
+        self.assertEqual(res.stop_reason, "fixpoint")
+        for item in items:
+            self.assertEqual(set(item.get_relations(R301.uri, return_obj=True)), expected[item])
+
+    def test_d04o__aggregation_rule(self):
+        """
+        test the declarative aggregation rules (count conditions over (subject, predicate) groups)
+        """
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            I701 = p.create_item(R1__has_label="test class", R4__is_instance_of=p.I2["Metaclass"])
+            R301 = p.create_relation(R1="likes")
+            R302 = p.create_relation(R1="dislikes")
+            R303 = p.create_relation(R1="is picky")
+
+            persons = [p.instance_of(I701, r1=f"person{i}") for i in range(4)]
+            things = [p.instance_of(p.I1["general item"], r1=f"thing{i}") for i in range(4)]
+            other = p.instance_of(p.I1["general item"], r1="not a person")
+
+            persons[0].set_multiple_relations(R302, things[:3])
+            persons[1].set_multiple_relations(R302, things[:2])
+            persons[1].set_multiple_relations(R301, things[2:])
+            persons[2].set_multiple_relations(R301, things)
+            other.set_multiple_relations(R302, things)
+
+            def mark_picky(self, subj, pred, *objs):
+                res = p.RuleResult()
+                res.add_statement(subj.set_relation(R303, len(objs)))
+                return res
+
+            I702 = p.create_item(
+                R1__has_label="test rule",
+                R2__has_description="mark persons with at least 3 statements of the same kind",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+            with I702.scope("setting") as cm:
+                cm.new_var(person=p.instance_of(p.I1["general item"]))
+                cm.new_rel_var("rel1")
+                cm.new_var(objs=p.instance_of(p.I1["general item"]))
+
+            with I702.scope("premise") as cm:
+                cm.new_aggregation(cm.person, cm.rel1, cm.objs, predicates=[R301, R302], subject_class=I701, min_count=3)
+
+            with I702.scope("assertion") as cm:
+                cm.new_consequent_func(mark_picky, cm.person, cm.rel1, cm.objs)
+
+        ra = p.ruleengine.RuleApplicator(I702)
+        self.assertEqual(ra.premise_type, p.ruleengine.PremiseType.AGGREGATION)
+        self.assertEqual(ra.aggregation.predicates, [R301, R302])
+        self.assertEqual(ra.aggregation.group_arguments, ("subject", "predicate", "objects"))
+
+        araw = p.ruleengine.AlgorithmicRuleApplicationWorker()
+        groups = araw.get_aggregation_groups(ra.aggregation)
+        self.assertEqual(groups, [(persons[0], R302, things[:3]), (persons[2], R301, things)])
+
+        res = p.ruleengine.apply_semantic_rule(I702, mod_context_uri=TEST_BASE_URI)
+        self.assertEqual(len(res.new_statements), 2)
+        self.assertEqual(res.raw_result_count, 2)
+        self.assertEqual(persons[0].get_relations(R303.uri, return_obj=True), [3])
+        self.assertEqual(persons[2].get_relations(R303.uri, return_obj=True), [4])
+
+        # the consequent function is called once if the number of groups matches
+        with p.uri_context(uri=TEST_BASE_URI):
+            I703 = p.create_item(
+                R1__has_label="test rule 2",
+                R2__has_description="check that the two relevant persons have two dislikes",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+            with I703.scope("setting") as cm:
+                cm.new_var(person=p.instance_of(p.I1["general item"]))
+                cm.new_rel_var("rel1")
+                cm.new_var(objs=p.instance_of(p.I1["general item"]))
+
+            with I703.scope("premise") as cm:
+                with self.assertRaises(p.aux.SemanticRuleError):
+                    cm.new_aggregation(cm.person, cm.rel1, cm.objs, predicates=[R301], predicate_relation=R302)
+
+                cm.new_aggregation(
+                    cm.person, cm.rel1, cm.objs, predicates=[R302], subject_class=I701, min_count=2, group_count=2
+                )
+                cm.new_condition_func(lambda self, itm: itm != persons[3], cm.person)
+
+            with I703.scope("assertion") as cm:
+                cm.new_consequent_func(p.raise_reasoning_goal_reached, "every person has two dislikes")
+
+        res = p.ruleengine.apply_semantic_rule(I703, mod_context_uri=TEST_BASE_URI)
+        self.assertIsInstance(res.exception, p.aux.ReasoningGoalReached)
+
+    def test_d04p__consequences_during_matching(self):
+        """
+        test that the matches do not depend on consequences which are applied while the matches are generated
+        """
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            R301 = p.create_relation(R1="has successor")
+            R302 = p.create_relation(R1="has marked successor")
+            R303 = p.create_relation(R1="has other relation")
+
+            chain_items = []
+
+            def unlink_other_successor_stms(self, x, y):
+                for itm in chain_items:
+                    for stm in itm.get_relations(R301.uri):
+                        if stm.relation_tuple[0] is not x:
+                            stm.unlink()
+                return p.RuleResult()
+
+            I708 = p.create_item(
+                R1__has_label="test rule",
+                R2__has_description="mark the successor and remove the other successor statements",
+                R4__is_instance_of=p.I41["semantic rule"],
+            )
+            with I708.scope("setting") as cm:
+                cm.new_var(x=p.instance_of(p.I1["general item"]))
+                cm.new_var(y=p.instance_of(p.I1["general item"]))
+            with I708.scope("premise") as cm:
+                cm.new_rel(cm.x, R301, cm.y)
+            with I708.scope("assertion") as cm:
+                cm.new_rel(cm.x, R302, cm.y)
+                cm.new_consequent_func(unlink_other_successor_stms, cm.x, cm.y)
+
+        def apply_rule(mode):
+            with p.uri_context(uri=TEST_BASE_URI):
+                items = [p.instance_of(p.I1["general item"], r1=f"{mode} item{i}") for i in range(3)]
+                items[0].set_relation(R301, items[1])
+                items[1].set_relation(R301, items[2])
+                # unrelated statements (every item is subject and object of another statement)
+                for i, itm in enumerate(items):
+                    itm.set_relation(R303, items[i - 1])
+            chain_items[:] = items
+
+            if mode == "vf2":
+                ra = p.ruleengine.RuleApplicator(I708, mod_context_uri=TEST_BASE_URI)
+                for ra_worker in ra.ra_workers:
+                    ra_worker.use_vf2_matcher = True
+                ra.apply()
+                # the workers are cached (see CompiledRuleCache)
+                for ra_worker in ra.ra_workers:
+                    ra_worker.use_vf2_matcher = False
+            else:
+                processes = 2 if mode == "parallel" else None
+                p.ruleengine.apply_semantic_rules(I708, mod_context_uri=TEST_BASE_URI, processes=processes)
+
+            for itm in items:
+                for stm in itm.get_relations(R301.uri):
+                    stm.unlink()
+            return [
+                (items.index(stm.subject), items.index(stm.object))
+                for stm in p.ds.relation_statements.get(R302.uri, ())
+                if stm.subject in items
+            ]
+
+        modes = ["vf2", "serial"]
+        if p.ruleengine.ParallelRuleMatcher.is_available():
+            modes.append("parallel")
+        for mode in modes:
+            self.assertEqual(apply_rule(mode), [(0, 1), (1, 2)], msg=mode)
+
     def test_d05__zebra_puzzle_stage02(self):
         """
         apply rules and assess correctness of the result
@@ -882,12 +1714,9 @@ class Test_01_rulebased_reasoning(HousekeeperMixin, unittest.TestCase):
 
             self.assertGreaterEqual(len(res.new_statements), 5)
 
-            # res_810 = res = p.ruleengine.apply_semantic_rules(
-            #     zr.I810["rule: deduce positive fact from 4 negative facts"], mod_context_uri=zb.__URI__
-            # )
-
-            araw = p.ruleengine.AlgorithmicRuleApplicationWorker()
-            res = araw.hardcoded_I810(zb, zr.add_stm_by_exclusion)
+            res = p.ruleengine.apply_semantic_rule(
+                zr.I810["rule: deduce positive fact from 4 negative facts"]
+            )
 
         self.assertEqual(len(res.new_statements), 1)
         self.assertEqual(zb.I9848["Norwegian"].zb__R8098__has_house_color, zb.I4118["yellow"])
@@ -921,6 +1750,20 @@ class Test_01_rulebased_reasoning(HousekeeperMixin, unittest.TestCase):
         self.assertEqual(pred_report.total_prod, 24883200000)
         self.assertTrue(p.check_type(pred_report.stable_candidates, Dict[str, List[Tuple[int, str]]]))
 
+        # constraint propagation (default) and enumeration of the permutations give the same report
+        pred_report2 = araw.get_predicates_report(predicate_list=func_act_list, enumerate_combinations=True)
+        self.assertEqual(pred_report2.counters, pred_report.counters)
+        self.assertEqual(pred_report2.stable_candidates, pred_report.stable_candidates)
+        self.assertEqual(len(pred_report2[func_act_list[0].uri]), 120)
+
+        # all-different: if two variables can only take the values a and b, the third variable cannot take them
+        a, b, c = zb.I5209["red"], zb.I1497["blue"], zb.I8065["green"]
+        domains = {"x": [a, b], "y": [a, b], "z": [a, b, c]}
+        self.assertEqual(p.ruleengine.propagate_all_different(domains), {"x": [a, b], "y": [a, b], "z": [c]})
+        self.assertEqual(p.ruleengine.count_all_different_solutions(domains), 2)
+        domains = {"x": [a], "y": [a], "z": [a, b, c]}
+        self.assertEqual(p.ruleengine.propagate_all_different(domains), {"x": [], "y": [], "z": []})
+
     def test_d17__zebra_puzzle_stage02(self):
 
         zb = p.irkloader.load_mod_from_path(TEST_DATA_PATH_ZEBRA_BASE_DATA, prefix="zb")
@@ -942,7 +1785,7 @@ class Test_01_rulebased_reasoning(HousekeeperMixin, unittest.TestCase):
             # this does nothing because we only have 'meaningless' R50-statements
             res = p.ruleengine.apply_semantic_rules(
                 zr.I830[
-                    "rule: ensure absence of contradictions (5 different-from statements) (hardcoded cheat)"
+                    "rule: ensure absence of contradictions (5 different-from statements)"
                 ]
             )
             self.assertEqual(len(res.new_statements), 0)
@@ -952,7 +1795,7 @@ class Test_01_rulebased_reasoning(HousekeeperMixin, unittest.TestCase):
             with self.assertRaises(p.aux.LogicalContradiction) as err:
                 res = p.ruleengine.apply_semantic_rules(
                     zr.I830[
-                        "rule: ensure absence of contradictions (5 different-from statements) (hardcoded cheat)"
+                        "rule: ensure absence of contradictions (5 different-from statements)"
                     ]
                 )
                 if res.exception:
@@ -981,7 +1824,7 @@ class Test_01_rulebased_reasoning(HousekeeperMixin, unittest.TestCase):
 
         res = p.ruleengine.apply_semantic_rules(
             zr.I800["rule: mark relations which are opposite of functional activities"],
-            zr.I810["rule: deduce positive fact from 4 negative facts (hardcoded cheat)"],
+            zr.I810["rule: deduce positive fact from 4 negative facts"],
             zr.I710["rule: identify same items via zb__R2850__is_functional_activity"],
             mod_context_uri=TEST_BASE_URI,
         )
@@ -997,6 +1840,77 @@ class Test_01_rulebased_reasoning(HousekeeperMixin, unittest.TestCase):
         else:
             os.unlink(fpath)
 
+    def test_d19__hypothesis_reasoning_in_parallel(self):
+        """
+        test that hypotheses can be tested in forked worker processes (the winning hypothesis is replayed)
+        """
+        zb = p.irkloader.load_mod_from_path(TEST_DATA_PATH_ZEBRA_BASE_DATA, prefix="zb")
+
+        with p.uri_context(uri=TEST_BASE_URI):
+            I701 = p.create_item(R1__has_label="test person", R4__is_instance_of=p.I2["Metaclass"])
+            I702 = p.create_item(R1__has_label="test color", R4__is_instance_of=p.I2["Metaclass"])
+            persons = [p.instance_of(I701, r1=f"person{i}") for i in range(3)]
+            colors = [p.instance_of(I702, r1=f"color{i}") for i in range(3)]
+            p.close_class_with_R51(I701)
+            p.close_class_with_R51(I702)
+
+            R301 = p.create_relation(
+                R1="has test color", R8__has_domain_of_argument_1=I701, R11__has_range_of_result=I702
+            )
+            R301.set_relation(zb.R2850["is functional activity"], True)
+            R302 = p.create_relation(
+                R1="has not test color",
+                R8__has_domain_of_argument_1=I701,
+                R11__has_range_of_result=I702,
+                R43__is_opposite_of=R301,
+            )
+            self.assertEqual(R302.R43, [R301])
+
+            # the hypothesis (person0, R301, color0) leads to no result, (person0, R301, color1) leads to a
+            # contradiction and (person0, R301, color2) to the goal
+            I703 = p.create_item(R1__has_label="contradiction rule", R4__is_instance_of=p.I41["semantic rule"])
+            with I703.scope("setting") as cm:
+                cm.new_var(person=p.instance_of(p.I1["general item"]))
+                cm.new_rel_var("rel1")
+                cm.new_var(objs=p.instance_of(p.I1["general item"]))
+
+            with I703.scope("premise") as cm:
+                cm.new_aggregation(cm.person, cm.rel1, cm.objs, predicates=[R301])
+                cm.new_condition_func(lambda self, obj: obj == colors[1], cm.objs)
+
+            with I703.scope("assertion") as cm:
+                cm.new_consequent_func(p.raise_contradiction, "{} has the wrong color", cm.person)
+
+            I704 = p.create_item(R1__has_label="goal rule", R4__is_instance_of=p.I41["semantic rule"])
+            with I704.scope("setting") as cm:
+                cm.new_var(person=p.instance_of(p.I1["general item"]))
+                cm.new_rel_var("rel1")
+                cm.new_var(objs=p.instance_of(p.I1["general item"]))
+
+            with I704.scope("premise") as cm:
+                cm.new_aggregation(cm.person, cm.rel1, cm.objs, predicates=[R301], group_count=1)
+                cm.new_condition_func(lambda self, obj: obj == colors[2], cm.objs)
+
+            with I704.scope("assertion") as cm:
+                cm.new_consequent_func(p.raise_reasoning_goal_reached, "solved")
+
+        hyre = p.ruleengine.HypothesisReasoner(zb, base_uri=TEST_BASE_URI)
+        res = hyre.hypothesis_reasoning_step([I703, I704])
+        self.assertEqual(res.stm_triples[0], (persons[0], R301, colors[0]))
+        self.assertEqual(res.outcomes, ["open", "contradiction", "goal"])
+        self.assertEqual(persons[0].get_relations(R301.uri, return_obj=True), [colors[2]])
+        p.unload_mod(hyre.context_uri, strict=False)
+        self.assertEqual(persons[0].get_relations(R301.uri, return_obj=True), [])
+
+        res = hyre.hypothesis_reasoning_step([I703, I704], processes=2)
+        self.assertEqual(res.outcomes[2], "goal")
+        self.assertEqual(len(res.reasoning_results), 1)
+        self.assertIsInstance(res.reasoning_results[0].exception, p.aux.ReasoningGoalReached)
+
+        # only the winning hypothesis has been replayed in this process
+        self.assertEqual(persons[0].get_relations(R301.uri, return_obj=True), [colors[2]])
+        p.unload_mod(hyre.context_uri, strict=False)
+
     @unittest.skip("currently too slow")
     def test_e01__zebra_puzzle_stage02(self):
         """
@@ -1243,11 +2157,10 @@ class Test_01_rulebased_reasoning(HousekeeperMixin, unittest.TestCase):
         result_history.append(res)
         self.assertGreaterEqual(len(res.new_statements), 5)
 
-        araw = p.ruleengine.AlgorithmicRuleApplicationWorker()
         with p.uri_context(uri=TEST_BASE_URI):
             # because with traditional rules it seems to be difficult to efficiently deduce positive fact from
-            # 4 negative facts, this is an algorithmic approach
-            res = araw.hardcoded_I810(zb, zr.add_stm_by_exclusion)
+            # 4 negative facts, this is an aggregation rule
+            res = p.ruleengine.apply_semantic_rule(zr.I810)
 
         reports.append(zb.report(display=False, title="I810_experiment"))
         result_history.append(res)
@@ -1279,8 +2192,8 @@ class Test_01_rulebased_reasoning(HousekeeperMixin, unittest.TestCase):
 
         with p.uri_context(uri=TEST_BASE_URI):
             # because with traditional rules it seems to be difficult to efficiently deduce positive fact from
-            # 4 negative facts, this is an algorithmic approach
-            res = araw.hardcoded_I810(zb, zr.add_stm_by_exclusion)
+            # 4 negative facts, this is an aggregation rule
+            res = p.ruleengine.apply_semantic_rule(zr.I810)
 
         reports.append(zb.report(display=False, title="I810_experiment_(2)"))
         result_history.append(res)
@@ -1404,7 +2317,7 @@ class Test_01_rulebased_reasoning(HousekeeperMixin, unittest.TestCase):
         pred_report = araw.get_predicates_report(predicate_list=func_act_list)
 
         with p.uri_context(uri=TEST_BASE_URI):
-            res = araw.hardcoded_I810(zb, zr.add_stm_by_exclusion)
+            res = p.ruleengine.apply_semantic_rule(zr.I810)
 
         # for performance reasons we continue with a test_e03
 
@@ -1458,11 +2371,11 @@ class Test_01_rulebased_reasoning(HousekeeperMixin, unittest.TestCase):
             zr.I796["rule: deduce different-from facts for neighbor-pairs"],
             zr.I798["rule: deduce negative facts from different-from-facts"],
             zr.I800["rule: mark relations which are opposite of functional activities"],
-            zr.I810["rule: deduce positive fact from 4 negative facts (hardcoded cheat)"],
+            zr.I810["rule: deduce positive fact from 4 negative facts"],
             zr.I820["rule: deduce personhood by exclusion"],
             zr.I825["rule: deduce lives-not-in... from lives-next-to"],
-            zr.I830["rule: ensure absence of contradictions (5 different-from statements) (hardcoded cheat)"],
-            zr.I840["rule: detect if puzzle is solved (hardcoded cheat)"],
+            zr.I830["rule: ensure absence of contradictions (5 different-from statements)"],
+            zr.I840["rule: detect if puzzle is solved"],
         ]
 
         araw = p.ruleengine.AlgorithmicRuleApplicationWorker()